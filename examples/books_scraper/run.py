@@ -231,7 +231,7 @@ async def run_scraper():
                 time.sleep(PAGE_DELAY)
 
     # Deduplicate all books
-    unique_books = deduplicator.deduplicate(all_books)
+    unique_books = deduplicator.deduplicate(all_books, add_hash=True)
     logger.info(f"After deduplication: {len(unique_books)} unique books")
 
     # Save to database - SEPARATE TABLES
@@ -158,6 +158,30 @@ class BrowserFactory:
 
         return options
 
+    @staticmethod
+    def _resize_command_pool(driver: WebDriver, maxsize: int) -> None:
+        """Let several WebDriver commands share pooled connections at once.
+
+        Selenium's command executor keeps one pooled connection per host, so
+        concurrent commands (e.g. a monitor thread running scripts during a
+        page load) open throwaway connections and log "connection pool is
+        full". Rebuild its urllib3 pool manager with a larger maxsize.
+
+        Args:
+            driver: Freshly created WebDriver
+            maxsize: Max pooled connections to the driver server
+        """
+        executor = driver.command_executor
+        try:
+            pool_args = executor._client_config.init_args_for_pool_manager
+            pool_args.setdefault("init_args_for_pool_manager", {})["maxsize"] = maxsize
+            old_conn = executor._conn
+            executor._conn = executor._get_connection_manager()
+            old_conn.clear()
+        except AttributeError as e:
+            # Private Selenium internals; keep the default pool if they change
+            logger.debug(f"Could not resize WebDriver connection pool: {e}")
+
     @classmethod
     def create(
         cls,
@@ -200,6 +224,8 @@ class BrowserFactory:
         else:
             raise ValueError(f"Unsupported browser type: {browser_type}")
 
+        cls._resize_command_pool(driver, settings.selenium_pool_maxsize)
+
         # Configure timeouts
         driver.set_page_load_timeout(settings.selenium_timeout)
         driver.implicitly_wait(settings.selenium_implicit_wait)
@@ -1,7 +1,9 @@
 """Data deduplication utilities."""
 
 import hashlib
-from typing import Any, Callable
+from typing import Any, Callable, Hashable
+
+import orjson
 
 from src.monitoring.logger import get_logger
 
@@ -16,6 +18,7 @@ class Deduplicator:
         key_fields: list[str] | None = None,
         hash_func: Callable[[dict[str, Any]], str] | None = None,
         case_sensitive: bool = False,
+        algorithm: str = "blake2b",
     ) -> None:
         """Initialize deduplicator.
 
@@ -23,10 +26,16 @@ class Deduplicator:
             key_fields: Fields to use for generating unique key
             hash_func: Custom hash function
             case_sensitive: Whether comparison is case-sensitive
+            algorithm: "blake2b" (default) or "sha256"; both give 64 hex chars.
+                Use "sha256" to match hashes stored by earlier versions
         """
+        if algorithm not in ("blake2b", "sha256"):
+            raise ValueError(f"Unsupported hash algorithm: {algorithm}")
+
         self.key_fields = key_fields
         self.hash_func = hash_func
         self.case_sensitive = case_sensitive
+        self.algorithm = algorithm
         self._seen_hashes: set[str] = set()
 
     def generate_hash(self, data: dict[str, Any]) -> str:
@@ -58,8 +67,47 @@ class Deduplicator:
                 normalized[k] = str(v)
 
         # Generate hash
-        content = str(sorted(normalized.items()))
-        return hashlib.sha256(content.encode()).hexdigest()
+        if self.algorithm == "sha256":
+            # Serialized exactly as before, so stored sha256 hashes keep matching
+            content = str(sorted(normalized.items())).encode()
+            return hashlib.sha256(content).hexdigest()
+
+        # Not security-relevant, so the faster blake2b, sized to keep 64 hex chars
+        content = orjson.dumps(normalized, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+        return hashlib.blake2b(content, digest_size=32).hexdigest()
+
+    def _key(self, data: dict[str, Any]) -> Hashable:
+        """Build an in-memory comparison key equivalent to generate_hash.
+
+        Records get equal keys exactly when they get equal hashes, but the key
+        is a plain tuple, so no serialization or digest is needed.
+
+        Args:
+            data: Data dictionary
+
+        Returns:
+            Hashable key
+        """
+        if self.hash_func:
+            return self.hash_func(data)
+
+        case_sensitive = self.case_sensitive
+        items = (
+            ((k, data.get(k)) for k in sorted(set(self.key_fields)))
+            if self.key_fields
+            else sorted(data.items())
+        )
+        return tuple(
+            (
+                k,
+                ""
+                if v is None
+                else (v if case_sensitive else v.lower())
+                if isinstance(v, str)
+                else str(v),
+            )
+            for k, v in items
+        )
 
     def is_duplicate(self, data: dict[str, Any]) -> bool:
         """Check if data is duplicate.
@@ -107,13 +155,18 @@ class Deduplicator:
         data: list[dict[str, Any]],
         keep: str = "first",
         mark_duplicates: bool = False,
+        add_hash: bool = False,
     ) -> list[dict[str, Any]]:
         """Remove duplicates from data list.
 
+        Records are compared by tuple keys; digests are only computed when
+        add_hash is set, and only then is the seen-hash set filled.
+
         Args:
             data: List of data dictionaries
             keep: Which duplicate to keep ("first" or "last")
             mark_duplicates: Add is_duplicate field instead of removing
+            add_hash: Add the record hash as a "_hash" field
 
         Returns:
             Deduplicated list
@@ -124,20 +177,33 @@ class Deduplicator:
         self.reset()
         results = []
         duplicates = 0
+        seen: set[Hashable] = set()
+        # Bound once so the loop body only touches locals
+        key_of = self._key
+        seen_add = seen.add
+        append = results.append
+        generate_hash = self.generate_hash
+        add_seen_hash = self._seen_hashes.add
 
         for record in data:
-            is_new, hash_value = self.check_and_add(record)
+            key = key_of(record)
+            is_new = key not in seen
+            if is_new:
+                seen_add(key)
+
+            if add_hash and (is_new or mark_duplicates):
+                hash_value = generate_hash(record)
+                add_seen_hash(hash_value)
+                record["_hash"] = hash_value
 
             if mark_duplicates:
-                record["_hash"] = hash_value
                 record["_is_duplicate"] = not is_new
-                results.append(record)
+                append(record)
                 if not is_new:
                     duplicates += 1
             else:
                 if is_new:
-                    record["_hash"] = hash_value
-                    results.append(record)
+                    append(record)
                 else:
                     duplicates += 1
 
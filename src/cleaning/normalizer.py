@@ -1,15 +1,28 @@
 """Data normalizers for different data types."""
 
 import re
+import time
 from abc import ABC, abstractmethod
-from datetime import datetime
-from typing import Any
-from urllib.parse import urljoin, urlparse
+from datetime import datetime, timedelta
+from typing import Any, Iterable
+from urllib.parse import urljoin, urlparse, urlunparse
 
 from src.monitoring.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Compiled once and shared by every normalizer instance
+_WHITESPACE_RE = re.compile(r"\s+")
+_SPECIAL_CHARS_RE = re.compile(r"[^\w\s]")
+_CURRENCY_CODE_RE = re.compile(r"[A-Z]{3}")
+_PRICE_RE = re.compile(r"[\d.]+")
+_NUMBER_RE = re.compile(r"-?[\d.]+")
+# Bare relative day words, answered without probing any strptime format
+_RELATIVE_DAYS = {"today": 0, "yesterday": 1, "tomorrow": -1}
+# Seconds a cached "today at midnight" is reused before the clock is read again
+_TODAY_TTL = 60.0
+_RELATIVE_DATE_RE = re.compile(r"(\d+)\s*(day|hour|minute|week|month)s?\s*ago")
+
 
 class BaseNormalizer(ABC):
     """Base class for normalizers."""
@@ -72,6 +85,9 @@ class TextNormalizer(BaseNormalizer):
         self.remove_special_chars = remove_special_chars
         self.allowed_chars = allowed_chars
         self.max_length = max_length
+        self._disallowed_re = re.compile(f"[^{allowed_chars}]") if allowed_chars else None
+        # Stripped text can be collapsed with split/join, which also covers "\n"
+        self._split_whitespace = strip and remove_extra_whitespace
 
     def normalize(self, value: Any) -> str:
         """Normalize text value.
@@ -91,16 +107,21 @@ class TextNormalizer(BaseNormalizer):
             text = text.strip()
 
         if self.remove_newlines:
-            text = text.replace("\n", " ").replace("\r", "")
+            text = text.replace("\r", "")
+            if not self._split_whitespace:
+                text = text.replace("\n", " ")
 
-        if self.remove_extra_whitespace:
-            text = re.sub(r"\s+", " ", text)
+        if self._split_whitespace:
+            # Once stripped, split/join collapses runs the same way the regex does
+            text = " ".join(text.split())
+        elif self.remove_extra_whitespace:
+            text = _WHITESPACE_RE.sub(" ", text)
 
         if self.remove_special_chars:
-            text = re.sub(r"[^\w\s]", "", text)
+            text = _SPECIAL_CHARS_RE.sub("", text)
 
-        if self.allowed_chars:
-            text = re.sub(f"[^{self.allowed_chars}]", "", text)
+        if self._disallowed_re:
+            text = self._disallowed_re.sub("", text)
 
         if self.lowercase:
             text = text.lower()
@@ -176,8 +197,10 @@ class PriceNormalizer(BaseNormalizer):
                 text = text.replace(symbol, "")
                 break
 
-        # Remove currency codes
-        text = re.sub(r"[A-Z]{3}", "", text).strip()
+        # Remove currency codes; text without capitals cannot contain one
+        if text != text.lower():
+            text = _CURRENCY_CODE_RE.sub("", text)
+        text = text.strip()
 
         # Handle Turkish/European format (1.234,56)
         if self.handle_turkish and "," in text and "." in text:
@@ -191,7 +214,7 @@ class PriceNormalizer(BaseNormalizer):
             text = text.replace(self.decimal_separator, ".")
 
         # Extract numeric value
-        match = re.search(r"[\d.]+", text)
+        match = _PRICE_RE.search(text)
         if not match:
             return None
 
@@ -248,10 +271,31 @@ class DateNormalizer(BaseNormalizer):
         self.output_format = output_format
         self.input_formats = input_formats or self.FORMATS
         self.return_datetime = return_datetime
+        # Format that parsed the previous value, tried first for the next one
+        self._last_fmt: str | None = None
+        # (monotonic time, today at midnight) for day-level relative words
+        self._today_cache: tuple[float, datetime | None] = (0.0, None)
+
+    def _today(self) -> datetime:
+        """Get today's date at midnight, re-reading the clock at most once a minute.
+
+        Returns:
+            Today at 00:00
+        """
+        checked_at, today = self._today_cache
+        now = time.monotonic()
+        if today is None or now - checked_at > _TODAY_TTL:
+            today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+            self._today_cache = (now, today)
+        return today
 
     def normalize(self, value: Any) -> str | datetime | None:
         """Normalize date value.
 
+        The format that matched the previous value is tried first, so a batch
+        in one layout parses with a single strptime call per value. Ambiguous
+        values such as 05/06/2024 therefore follow the batch's layout.
+
         Args:
             value: Date string to normalize
 
@@ -270,15 +314,26 @@ class DateNormalizer(BaseNormalizer):
         if not text:
             return None
 
+        days_ago = _RELATIVE_DAYS.get(text.lower())
+        if days_ago is not None:
+            dt = self._today() - timedelta(days=days_ago)
+            if self.return_datetime:
+                return dt
+            return dt.strftime(self.output_format)
+
+        last_fmt = self._last_fmt
+        formats = self.input_formats if last_fmt is None else (last_fmt, *self.input_formats)
+
         # Try each format
-        for fmt in self.input_formats:
+        for fmt in formats:
             try:
                 dt = datetime.strptime(text, fmt)
-                if self.return_datetime:
-                    return dt
-                return dt.strftime(self.output_format)
             except ValueError:
                 continue
+            self._last_fmt = fmt
+            if self.return_datetime:
+                return dt
+            return dt.strftime(self.output_format)
 
         # Try relative dates
         relative_date = self._parse_relative_date(text)
@@ -299,18 +354,16 @@ class DateNormalizer(BaseNormalizer):
         Returns:
             Datetime or None
         """
-        from datetime import timedelta
-
         text = text.lower()
         now = datetime.now()
 
         if "today" in text:
-            return now
+            return self._today()
         if "yesterday" in text:
-            return now - timedelta(days=1)
+            return self._today() - timedelta(days=1)
 
         # Pattern: X days/hours/minutes ago
-        match = re.search(r"(\d+)\s*(day|hour|minute|week|month)s?\s*ago", text)
+        match = _RELATIVE_DATE_RE.search(text)
         if match:
             amount = int(match.group(1))
             unit = match.group(2)
@@ -332,12 +385,28 @@ class DateNormalizer(BaseNormalizer):
 class URLNormalizer(BaseNormalizer):
     """Normalizer for URLs."""
 
+    # Common tracking parameters
+    TRACKING_PARAMS = frozenset(
+        {
+            "utm_source",
+            "utm_medium",
+            "utm_campaign",
+            "utm_term",
+            "utm_content",
+            "fbclid",
+            "gclid",
+            "ref",
+            "source",
+        }
+    )
+
     def __init__(
         self,
         base_url: str | None = None,
         remove_fragments: bool = True,
         remove_tracking_params: bool = True,
         force_https: bool = False,
+        extra_tracking_params: Iterable[str] | None = None,
     ) -> None:
         """Initialize URL normalizer.
 
@@ -346,24 +415,18 @@ class URLNormalizer(BaseNormalizer):
             remove_fragments: Remove URL fragments (#...)
             remove_tracking_params: Remove tracking parameters
             force_https: Convert http to https
+            extra_tracking_params: Additional query keys to strip
         """
         self.base_url = base_url
         self.remove_fragments = remove_fragments
         self.remove_tracking_params = remove_tracking_params
         self.force_https = force_https
-
-        # Common tracking parameters
-        self.tracking_params = {
-            "utm_source",
-            "utm_medium",
-            "utm_campaign",
-            "utm_term",
-            "utm_content",
-            "fbclid",
-            "gclid",
-            "ref",
-            "source",
-        }
+        # Instances without extras share the class-level frozenset
+        self.tracking_params = (
+            self.TRACKING_PARAMS | frozenset(extra_tracking_params)
+            if extra_tracking_params
+            else self.TRACKING_PARAMS
+        )
 
     def normalize(self, value: Any) -> str | None:
         """Normalize URL.
@@ -402,15 +465,14 @@ class URLNormalizer(BaseNormalizer):
         # Handle query parameters
         query = parsed.query
         if self.remove_tracking_params and query:
-            from urllib.parse import parse_qs, urlencode
-
-            params = parse_qs(query)
-            filtered_params = {k: v for k, v in params.items() if k not in self.tracking_params}
-            query = urlencode(filtered_params, doseq=True)
+            # Filter the raw pairs instead of a parse_qs/urlencode round trip,
+            # which also keeps the surviving pairs' order and encoding intact
+            tracking = self.tracking_params
+            query = "&".join(
+                pair for pair in query.split("&") if pair and pair.partition("=")[0] not in tracking
+            )
 
         # Rebuild URL
-        from urllib.parse import urlunparse
-
         return urlunparse((scheme, parsed.netloc, parsed.path, parsed.params, query, fragment))
 
 
@@ -455,7 +517,7 @@ class NumberNormalizer(BaseNormalizer):
             text = str(value).strip()
             # Extract number from text
             text = text.replace(",", ".")
-            match = re.search(r"-?[\d.]+", text)
+            match = _NUMBER_RE.search(text)
             if not match:
                 return self.default
             try:
@@ -471,12 +533,40 @@ class NumberNormalizer(BaseNormalizer):
 
         return self.return_type(num)
 
+    def normalize_batch(self, values: Iterable[Any]) -> list[float | int | None]:
+        """Normalize many values in one pass.
+
+        Plain ints and floats are clipped inline with the bounds and return
+        type bound once; anything else goes through ``normalize``.
+
+        Args:
+            values: Values to normalize
+
+        Returns:
+            Normalized numbers in input order
+        """
+        lo, hi, cast, normalize = self.min_value, self.max_value, self.return_type, self.normalize
+        results = []
+        append = results.append
+        for value in values:
+            if type(value) is float or type(value) is int:
+                if lo is not None and value < lo:
+                    value = lo
+                if hi is not None and value > hi:
+                    value = hi
+                append(cast(value))
+            else:
+                append(normalize(value))
+        return results
+
 
 class BooleanNormalizer(BaseNormalizer):
     """Normalizer for boolean data."""
 
     TRUE_VALUES = {"true", "yes", "1", "on", "evet", "doğru"}
     FALSE_VALUES = {"false", "no", "0", "off", "hayır", "yanlış"}
+    # Both sets folded into one table so a value costs a single lookup
+    _BOOL_MAP = {**dict.fromkeys(TRUE_VALUES, True), **dict.fromkeys(FALSE_VALUES, False)}
 
     def __init__(self, default: bool | None = None) -> None:
         """Initialize boolean normalizer.
@@ -501,11 +591,4 @@ class BooleanNormalizer(BaseNormalizer):
         if isinstance(value, bool):
             return value
 
-        text = str(value).strip().lower()
-
-        if text in self.TRUE_VALUES:
-            return True
-        if text in self.FALSE_VALUES:
-            return False
-
-        return self.default
+        return self._BOOL_MAP.get(str(value).strip().lower(), self.default)
@@ -53,6 +53,45 @@ class CleaningStep:
 
         return data
 
+    def compile(self) -> Callable[[dict[str, Any]], dict[str, Any] | None]:
+        """Build a callable equivalent to apply() for this step's configuration.
+
+        Steps that only filter, only transform or only normalize a field get a
+        dedicated closure, so per-record work skips the unused branches.
+
+        Returns:
+            Function taking a record and returning it cleaned, or None if filtered out
+        """
+        filter_func, transform = self.filter_func, self.transform
+        normalizer = self.normalizer if self.field else None
+
+        if filter_func and not transform and not normalizer:
+            return lambda data: data if filter_func(data) else None
+
+        if transform and not filter_func and not normalizer:
+            return transform
+
+        if normalizer and callable(normalizer) and not filter_func and not transform:
+            field, required, default = self.field, self.required, self.default
+            # Call normalize() directly instead of going through __call__
+            normalize = (
+                normalizer.normalize if isinstance(normalizer, BaseNormalizer) else normalizer
+            )
+
+            def normalize_field(data: dict[str, Any]) -> dict[str, Any] | None:
+                value = data.get(field)
+                if value is None:
+                    if required:
+                        return None
+                    data[field] = default
+                else:
+                    data[field] = normalize(value)
+                return data
+
+            return normalize_field
+
+        return self.apply
+
 
 @dataclass
 class FieldMapping:
@@ -88,6 +127,8 @@ class CleaningPipeline:
         self._field_mappings: list[FieldMapping] = []
         self._global_transforms: list[Callable[[dict[str, Any]], dict[str, Any]]] = []
         self._filters: list[Callable[[dict[str, Any]], bool]] = []
+        # Compiled steps with their names, rebuilt after the step list changes
+        self._compiled: list[tuple[Callable[[dict[str, Any]], Any], str]] | None = None
 
     def add_step(self, step: CleaningStep) -> "CleaningPipeline":
         """Add cleaning step to pipeline.
@@ -99,6 +140,7 @@ class CleaningPipeline:
             Self for chaining
         """
         self._steps.append(step)
+        self._compiled = None
         return self
 
     def add_normalizer(
@@ -127,6 +169,7 @@ class CleaningPipeline:
             default=default,
         )
         self._steps.append(step)
+        self._compiled = None
         return self
 
     def add_transform(
@@ -146,6 +189,7 @@ class CleaningPipeline:
         self._global_transforms.append(transform)
         step = CleaningStep(name=name, transform=transform)
         self._steps.append(step)
+        self._compiled = None
         return self
 
     def add_filter(
@@ -165,6 +209,7 @@ class CleaningPipeline:
         self._filters.append(filter_func)
         step = CleaningStep(name=name, filter_func=filter_func)
         self._steps.append(step)
+        self._compiled = None
         return self
 
     def add_field_mapping(self, mapping: FieldMapping) -> "CleaningPipeline":
@@ -215,8 +260,9 @@ class CleaningPipeline:
         # Apply field mappings first
         if self._field_mappings:
             mapped = {}
+            get = result.get
             for mapping in self._field_mappings:
-                value = result.get(mapping.source)
+                value = get(mapping.source)
 
                 if value is None:
                     if mapping.required:
@@ -229,11 +275,15 @@ class CleaningPipeline:
 
             result = mapped
 
+        compiled = self._compiled
+        if compiled is None:
+            compiled = self._compiled = [(step.compile(), step.name) for step in self._steps]
+
         # Apply steps
-        for step in self._steps:
-            result = step.apply(result)
+        for run, name in compiled:
+            result = run(result)
             if result is None:
-                logger.debug(f"Record filtered out at step: {step.name}")
+                logger.debug("Record filtered out at step: {}", name)
                 return None
 
         return result
@@ -253,13 +303,15 @@ class CleaningPipeline:
             List of cleaned data (filtered records excluded)
         """
         results = []
+        append = results.append
+        clean = self.clean
         errors = 0
 
         for i, record in enumerate(data):
             try:
-                cleaned = self.clean(record)
+                cleaned = clean(record)
                 if cleaned is not None:
-                    results.append(cleaned)
+                    append(cleaned)
             except Exception as e:
                 errors += 1
                 logger.warning(f"Cleaning error at index {i}: {e}")
@@ -66,6 +66,9 @@ class Settings(BaseSettings):
     selenium_headless: bool = Field(default=True, description="Run browser in headless mode")
     selenium_timeout: int = Field(default=30, ge=1, description="Page load timeout in seconds")
     selenium_implicit_wait: int = Field(default=10, ge=0, description="Implicit wait in seconds")
+    selenium_pool_maxsize: int = Field(
+        default=16, ge=1, description="Max pooled connections to the WebDriver server"
+    )
     browser_type: BrowserType = Field(default=BrowserType.CHROME, description="Browser type")
 
     # Proxy
@@ -95,6 +98,14 @@ class Settings(BaseSettings):
     worker_pool_size: int = Field(default=5, ge=1, description="Worker pool size")
     worker_max_concurrent: int = Field(default=10, ge=1, description="Max concurrent tasks")
     worker_task_timeout: int = Field(default=300, ge=1, description="Task timeout in seconds")
+    worker_max_browsers: int = Field(
+        default=5, ge=1, description="Max warm browsers shared by pooled workers"
+    )
+
+    # Health
+    health_disk_cache_ttl: float = Field(
+        default=30.0, ge=0, description="Seconds to reuse a disk usage probe"
+    )
 
     # Rate Limiting
     rate_limit_requests_per_minute: int = Field(
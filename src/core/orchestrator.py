@@ -121,6 +121,7 @@ class Orchestrator:
         self.retry_handler = RetryHandler(self.retry_policy)
 
         self._queue = TaskQueue()
+        self._queue_runner: asyncio.Task | None = None
         self._running = False
         self._callbacks: dict[str, list[Callable[[Task], None]]] = {
             "task_started": [],
@@ -195,6 +196,9 @@ class Orchestrator:
 
         self._running = False
 
+        if self._queue_runner is not None and not self._queue_runner.done():
+            self._queue_runner.cancel()
+
         if self.worker_pool:
             self.worker_pool.stop()
 
@@ -297,23 +301,29 @@ class Orchestrator:
         return task.id
 
     async def process_queue(self) -> None:
-        """Process tasks from queue continuously."""
-        logger.info("Starting queue processing")
-
-        while self._running:
-            try:
-                if self._queue.is_empty:
-                    await asyncio.sleep(0.5)
-                    continue
+        """Process tasks from queue continuously.
 
-                task = await asyncio.wait_for(self._queue.get(), timeout=1.0)
-                await self._execute_task(task)
-                self._queue.task_done()
+        Blocks on the queue until a task arrives rather than polling it with
+        short sleeps; stop() cancels the wait.
+        """
+        logger.info("Starting queue processing")
+        self._queue_runner = asyncio.current_task()
 
-            except asyncio.TimeoutError:
-                continue
-            except Exception as e:
-                logger.error(f"Queue processing error: {e}")
+        try:
+            while self._running:
+                task = await self._queue.get()
+                try:
+                    await self._execute_task(task)
+                except Exception as e:
+                    logger.error(f"Queue processing error: {e}")
+                finally:
+                    self._queue.task_done()
+        except asyncio.CancelledError:
+            # stop() cancels the runner; any other cancellation propagates
+            if self._running:
+                raise
+        finally:
+            self._queue_runner = None
 
     async def _execute_task(self, task: Task) -> bool:
         """Execute a single task with retry logic.
@@ -7,6 +7,7 @@ from pathlib import Path
 from sqlalchemy import create_engine, event
 from sqlalchemy.engine import Engine
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
 
 from src.core.config import settings
 from src.monitoring.logger import get_logger
@@ -29,8 +30,13 @@ def get_engine() -> Engine:
     global _engine
 
     if _engine is None:
+        # In-memory SQLite (":memory:" or a "mode=memory" URI) has no file
+        in_memory = settings.is_sqlite and (
+            ":memory:" in settings.database_url or "mode=memory" in settings.database_url
+        )
+
         # Ensure data directory exists for SQLite
-        if settings.is_sqlite:
+        if settings.is_sqlite and not in_memory:
             db_path = settings.database_url.replace("sqlite:///", "")
             Path(db_path).parent.mkdir(parents=True, exist_ok=True)
 
@@ -39,6 +45,8 @@ def get_engine() -> Engine:
             _engine = create_engine(
                 settings.database_url,
                 connect_args={"check_same_thread": False},
+                # One shared connection, so every session sees the same in-memory database
+                poolclass=StaticPool if in_memory else None,
                 echo=settings.debug and settings.log_level == "DEBUG",
             )
             # Enable foreign keys for SQLite
@@ -1,13 +1,66 @@
 """SQLAlchemy ORM models for RPAFlow."""
 
+import os
+import threading
+import time
 from datetime import datetime
 from enum import Enum
 from typing import Any
-from uuid import uuid4
-
-from sqlalchemy import JSON, Boolean, DateTime, Float, ForeignKey, Integer, String, Text
+from uuid import UUID
+
+from sqlalchemy import (
+    JSON,
+    Boolean,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    text,
+)
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
+_uuid7_lock = threading.Lock()
+_uuid7_last_ms = 0
+_uuid7_seq = 0
+
+
+def uuid7() -> UUID:
+    """Generate a time-ordered UUIDv7.
+
+    The leading 48 bits are the Unix timestamp in milliseconds, followed by
+    a 12-bit sequence that increases within the same millisecond, so ids
+    sort in creation order and new rows append to the right of the
+    primary-key index.
+
+    Returns:
+        UUID version 7
+    """
+    global _uuid7_last_ms, _uuid7_seq
+
+    with _uuid7_lock:
+        ms = time.time_ns() // 1_000_000
+        if ms > _uuid7_last_ms:
+            _uuid7_last_ms = ms
+            _uuid7_seq = int.from_bytes(os.urandom(2)) & 0x7FF
+        else:
+            _uuid7_seq += 1
+            if _uuid7_seq > 0xFFF:
+                _uuid7_last_ms += 1
+                _uuid7_seq = 0
+        ms, seq = _uuid7_last_ms, _uuid7_seq
+
+    rand_b = int.from_bytes(os.urandom(8)) & 0x3FFF_FFFF_FFFF_FFFF
+    value = (ms & 0xFFFF_FFFF_FFFF) << 80 | 0x7 << 76 | seq << 64 | 0b10 << 62 | rand_b
+    return UUID(int=value)
+
+
+def generate_id() -> str:
+    """Generate a new primary key value."""
+    return str(uuid7())
+
 
 class Base(DeclarativeBase):
     """Base class for all models."""
@@ -41,7 +94,7 @@ class Task(Base):
 
     __tablename__ = "tasks"
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid4()))
+    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=generate_id)
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     task_type: Mapped[str] = mapped_column(String(50), default=TaskType.SCRAPE.value)
     status: Mapped[str] = mapped_column(String(20), default=TaskStatus.PENDING.value, index=True)
@@ -115,7 +168,7 @@ class ScrapedData(Base):
 
     __tablename__ = "scraped_data"
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid4()))
+    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=generate_id)
     task_id: Mapped[str] = mapped_column(String(36), ForeignKey("tasks.id"), index=True)
 
     # Source info
@@ -155,8 +208,27 @@ class ProxyStatus(Base):
     """Model for tracking proxy health and usage."""
 
     __tablename__ = "proxy_status"
+    __table_args__ = (
+        # Partial indexes backing the proxy pickers (get_fastest, get_least_used,
+        # get_active_proxies) so they become index seeks instead of sorts.
+        # SQLite only uses a partial index when the query's WHERE terms imply
+        # its predicate, so it is spelled the way the ORM renders the filters.
+        Index(
+            "ix_proxy_active_healthy_rt",
+            "response_time",
+            postgresql_where=text("is_active AND is_healthy"),
+            sqlite_where=text("is_active = 1 AND is_healthy = 1"),
+        ),
+        Index(
+            "ix_proxy_active_healthy_usage",
+            "total_requests",
+            "last_used",
+            postgresql_where=text("is_active AND is_healthy"),
+            sqlite_where=text("is_active = 1 AND is_healthy = 1"),
+        ),
+    )
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid4()))
+    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=generate_id)
 
     # Proxy info
     address: Mapped[str] = mapped_column(String(255), unique=True, nullable=False)
@@ -217,7 +289,7 @@ class ScrapedPage(Base):
 
     __tablename__ = "scraped_pages"
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid4()))
+    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=generate_id)
     task_id: Mapped[str] = mapped_column(String(36), ForeignKey("tasks.id"), index=True)
 
     # Page info
@@ -257,7 +329,7 @@ class Book(Base):
 
     __tablename__ = "books"
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid4()))
+    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=generate_id)
     page_id: Mapped[str] = mapped_column(String(36), ForeignKey("scraped_pages.id"), index=True)
     task_id: Mapped[str] = mapped_column(String(36), ForeignKey("tasks.id"), index=True)
 
@@ -302,7 +374,7 @@ class BotMetrics(Base):
 
     __tablename__ = "bot_metrics"
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid4()))
+    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=generate_id)
     task_id: Mapped[str | None] = mapped_column(String(36), ForeignKey("tasks.id"), nullable=True)
     worker_id: Mapped[str | None] = mapped_column(String(36), nullable=True, index=True)
 
@@ -1,13 +1,26 @@
 """Repository pattern for database operations."""
 
+import threading
+import time
+from collections import deque
+from collections.abc import Iterator, Sequence
 from datetime import datetime
 from typing import Any, Generic, TypeVar
-from uuid import uuid4
 
-from sqlalchemy import func, select
+from sqlalchemy import func, insert, lambda_stmt, select
 from sqlalchemy.orm import Session
 
-from .models import Base, Book, BotMetrics, ProxyStatus, ScrapedData, ScrapedPage, Task, TaskStatus
+from .models import (
+    Base,
+    Book,
+    BotMetrics,
+    ProxyStatus,
+    ScrapedData,
+    ScrapedPage,
+    Task,
+    TaskStatus,
+    generate_id,
+)
 
 T = TypeVar("T", bound=Base)
 
@@ -36,7 +49,7 @@ class BaseRepository(Generic[T]):
         """
         return self.db.get(self.model, id)
 
-    def get_all(self, limit: int = 100, offset: int = 0) -> list[T]:
+    def get_all(self, limit: int = 100, offset: int = 0) -> Sequence[T]:
         """Get all records with pagination.
 
         Args:
@@ -47,23 +60,26 @@ class BaseRepository(Generic[T]):
             List of records
         """
         stmt = select(self.model).limit(limit).offset(offset)
-        return list(self.db.scalars(stmt).all())
+        return self.db.scalars(stmt).all()
 
-    def create(self, **kwargs: Any) -> T:
+    def create(self, *, refresh: bool = False, **kwargs: Any) -> T:
         """Create a new record.
 
         Args:
+            refresh: Re-load the row after commit (only needed for
+                server-generated columns)
             **kwargs: Field values
 
         Returns:
             Created record
         """
         if "id" not in kwargs:
-            kwargs["id"] = str(uuid4())
+            kwargs["id"] = generate_id()
         instance = self.model(**kwargs)
         self.db.add(instance)
         self.db.commit()
-        self.db.refresh(instance)
+        if refresh:
+            self.db.refresh(instance)
         return instance
 
     def update(self, id: str, **kwargs: Any) -> T | None:
@@ -117,7 +133,7 @@ class TaskRepository(BaseRepository[Task]):
     def __init__(self, db: Session) -> None:
         super().__init__(db, Task)
 
-    def get_by_status(self, status: TaskStatus, limit: int = 100) -> list[Task]:
+    def get_by_status(self, status: TaskStatus, limit: int = 100) -> Sequence[Task]:
         """Get tasks by status.
 
         Args:
@@ -127,15 +143,16 @@ class TaskRepository(BaseRepository[Task]):
         Returns:
             List of tasks
         """
-        stmt = (
-            select(Task)
-            .where(Task.status == status.value)
+        status_value = status.value
+        stmt = lambda_stmt(
+            lambda: select(Task)
+            .where(Task.status == status_value)
             .order_by(Task.priority.desc(), Task.created_at)
             .limit(limit)
         )
-        return list(self.db.scalars(stmt).all())
+        return self.db.scalars(stmt).all()
 
-    def get_pending_tasks(self, limit: int = 10) -> list[Task]:
+    def get_pending_tasks(self, limit: int = 10) -> Sequence[Task]:
         """Get pending tasks ordered by priority.
 
         Args:
@@ -144,22 +161,22 @@ class TaskRepository(BaseRepository[Task]):
         Returns:
             List of pending tasks
         """
-        stmt = (
-            select(Task)
+        stmt = lambda_stmt(
+            lambda: select(Task)
             .where(Task.status == TaskStatus.PENDING.value)
             .order_by(Task.priority.desc(), Task.created_at)
             .limit(limit)
         )
-        return list(self.db.scalars(stmt).all())
+        return self.db.scalars(stmt).all()
 
-    def get_running_tasks(self) -> list[Task]:
+    def get_running_tasks(self) -> Sequence[Task]:
         """Get all running tasks.
 
         Returns:
             List of running tasks
         """
         stmt = select(Task).where(Task.status == TaskStatus.RUNNING.value)
-        return list(self.db.scalars(stmt).all())
+        return self.db.scalars(stmt).all()
 
     def start_task(self, task_id: str, worker_id: str) -> Task | None:
         """Mark task as started.
@@ -264,7 +281,7 @@ class ScrapedDataRepository(BaseRepository[ScrapedData]):
     def __init__(self, db: Session) -> None:
         super().__init__(db, ScrapedData)
 
-    def get_by_task(self, task_id: str) -> list[ScrapedData]:
+    def get_by_task(self, task_id: str) -> Sequence[ScrapedData]:
         """Get all scraped data for a task.
 
         Args:
@@ -278,7 +295,25 @@ class ScrapedDataRepository(BaseRepository[ScrapedData]):
             .where(ScrapedData.task_id == task_id)
             .order_by(ScrapedData.page_number, ScrapedData.scraped_at)
         )
-        return list(self.db.scalars(stmt).all())
+        return self.db.scalars(stmt).all()
+
+    def iter_by_task(self, task_id: str, batch_size: int = 500) -> Iterator[ScrapedData]:
+        """Stream scraped data for a task without loading it all at once.
+
+        Args:
+            task_id: Task ID
+            batch_size: Rows fetched from the cursor per batch
+
+        Returns:
+            Iterator over scraped data
+        """
+        stmt = (
+            select(ScrapedData)
+            .where(ScrapedData.task_id == task_id)
+            .order_by(ScrapedData.page_number, ScrapedData.scraped_at)
+            .execution_options(yield_per=batch_size)
+        )
+        return iter(self.db.scalars(stmt))
 
     def check_duplicate(self, data_hash: str) -> bool:
         """Check if data with hash already exists.
@@ -289,7 +324,9 @@ class ScrapedDataRepository(BaseRepository[ScrapedData]):
         Returns:
             True if duplicate exists
         """
-        stmt = select(ScrapedData).where(ScrapedData.data_hash == data_hash).limit(1)
+        stmt = lambda_stmt(
+            lambda: select(ScrapedData.id).where(ScrapedData.data_hash == data_hash).limit(1)
+        )
         return self.db.scalar(stmt) is not None
 
     def bulk_insert(self, items: list[dict[str, Any]]) -> int:
@@ -304,14 +341,14 @@ class ScrapedDataRepository(BaseRepository[ScrapedData]):
         instances = []
         for item in items:
             if "id" not in item:
-                item["id"] = str(uuid4())
+                item["id"] = generate_id()
             instances.append(ScrapedData(**item))
 
         self.db.bulk_save_objects(instances)
         self.db.commit()
         return len(instances)
 
-    def get_non_duplicates(self, task_id: str) -> list[ScrapedData]:
+    def get_non_duplicates(self, task_id: str) -> Sequence[ScrapedData]:
         """Get non-duplicate scraped data for a task.
 
         Args:
@@ -325,7 +362,7 @@ class ScrapedDataRepository(BaseRepository[ScrapedData]):
             .where(ScrapedData.task_id == task_id, ScrapedData.is_duplicate == False)
             .order_by(ScrapedData.scraped_at)
         )
-        return list(self.db.scalars(stmt).all())
+        return self.db.scalars(stmt).all()
 
 
 class ProxyStatusRepository(BaseRepository[ProxyStatus]):
@@ -334,7 +371,7 @@ class ProxyStatusRepository(BaseRepository[ProxyStatus]):
     def __init__(self, db: Session) -> None:
         super().__init__(db, ProxyStatus)
 
-    def get_active_proxies(self) -> list[ProxyStatus]:
+    def get_active_proxies(self) -> Sequence[ProxyStatus]:
         """Get all active and healthy proxies.
 
         Returns:
@@ -345,7 +382,7 @@ class ProxyStatusRepository(BaseRepository[ProxyStatus]):
             .where(ProxyStatus.is_active == True, ProxyStatus.is_healthy == True)
             .order_by(ProxyStatus.response_time)
         )
-        return list(self.db.scalars(stmt).all())
+        return self.db.scalars(stmt).all()
 
     def get_by_address(self, address: str) -> ProxyStatus | None:
         """Get proxy by address.
@@ -356,7 +393,9 @@ class ProxyStatusRepository(BaseRepository[ProxyStatus]):
         Returns:
             Proxy status or None
         """
-        stmt = select(ProxyStatus).where(ProxyStatus.address == address).limit(1)
+        stmt = lambda_stmt(
+            lambda: select(ProxyStatus).where(ProxyStatus.address == address).limit(1)
+        )
         return self.db.scalar(stmt)
 
     def update_health(
@@ -441,14 +480,14 @@ class ScrapedPageRepository(BaseRepository[ScrapedPage]):
     def __init__(self, db: Session) -> None:
         super().__init__(db, ScrapedPage)
 
-    def get_by_task(self, task_id: str) -> list[ScrapedPage]:
+    def get_by_task(self, task_id: str) -> Sequence[ScrapedPage]:
         """Get all pages for a task."""
         stmt = (
             select(ScrapedPage)
             .where(ScrapedPage.task_id == task_id)
             .order_by(ScrapedPage.page_number)
         )
-        return list(self.db.scalars(stmt).all())
+        return self.db.scalars(stmt).all()
 
     def get_by_page_number(self, task_id: str, page_number: int) -> ScrapedPage | None:
         """Get page by task and page number."""
@@ -466,52 +505,62 @@ class BookRepository(BaseRepository[Book]):
     def __init__(self, db: Session) -> None:
         super().__init__(db, Book)
 
-    def get_by_task(self, task_id: str) -> list[Book]:
+    def get_by_task(self, task_id: str) -> Sequence[Book]:
         """Get all books for a task."""
         stmt = (
             select(Book)
             .where(Book.task_id == task_id)
             .order_by(Book.scraped_at)
         )
-        return list(self.db.scalars(stmt).all())
+        return self.db.scalars(stmt).all()
+
+    def iter_by_task(self, task_id: str, batch_size: int = 500) -> Iterator[Book]:
+        """Stream books for a task without loading them all at once."""
+        stmt = (
+            select(Book)
+            .where(Book.task_id == task_id)
+            .order_by(Book.scraped_at)
+            .execution_options(yield_per=batch_size)
+        )
+        return iter(self.db.scalars(stmt))
 
-    def get_by_page(self, page_id: str) -> list[Book]:
+    def get_by_page(self, page_id: str) -> Sequence[Book]:
         """Get all books for a page."""
         stmt = (
             select(Book)
             .where(Book.page_id == page_id)
             .order_by(Book.title)
         )
-        return list(self.db.scalars(stmt).all())
+        return self.db.scalars(stmt).all()
 
     def bulk_insert(self, books: list[dict[str, Any]]) -> int:
         """Bulk insert books."""
         instances = []
         for book in books:
             if "id" not in book:
-                book["id"] = str(uuid4())
+                book["id"] = generate_id()
             instances.append(Book(**book))
         self.db.bulk_save_objects(instances)
         self.db.commit()
         return len(instances)
 
-    def get_by_rating(self, min_rating: int = 1) -> list[Book]:
+    def get_by_rating(self, min_rating: int = 1) -> Sequence[Book]:
         """Get books with minimum rating."""
         stmt = (
             select(Book)
             .where(Book.rating >= min_rating)
             .order_by(Book.rating.desc(), Book.title)
         )
-        return list(self.db.scalars(stmt).all())
+        return self.db.scalars(stmt).all()
 
-    def get_price_range(self, min_price: float, max_price: float) -> list[Book]:
+    def get_price_range(self, min_price: float, max_price: float) -> Sequence[Book]:
         """Get books within price range."""
         stmt = (
             select(Book)
             .where(Book.price >= min_price, Book.price <= max_price)
             .order_by(Book.price)
         )
-        return list(self.db.scalars(stmt).all())
+        return self.db.scalars(stmt).all()
 
     def get_stats(self) -> dict[str, Any]:
         """Get book statistics."""
@@ -531,10 +580,22 @@ class BookRepository(BaseRepository[Book]):
 
 
 class BotMetricsRepository(BaseRepository[BotMetrics]):
-    """Repository for BotMetrics operations."""
+    """Repository for BotMetrics operations.
+
+    Metrics are buffered in memory and written with a single multi-row
+    INSERT once ``flush_size`` rows are pending or ``flush_interval``
+    seconds have passed since the last write. Call :meth:`flush` before
+    the session is closed to persist whatever is still buffered.
+    """
+
+    flush_size: int = 500
+    flush_interval: float = 1.0
 
     def __init__(self, db: Session) -> None:
         super().__init__(db, BotMetrics)
+        self._buffer: deque[dict[str, Any]] = deque()
+        self._lock = threading.Lock()
+        self._last_flush = time.monotonic()
 
     def record_metric(
         self,
@@ -545,8 +606,8 @@ class BotMetricsRepository(BaseRepository[BotMetrics]):
         success: bool = True,
         error_type: str | None = None,
         extra_data: dict[str, Any] | None = None,
-    ) -> BotMetrics:
-        """Record a new metric.
+    ) -> None:
+        """Buffer a new metric for writing.
 
         Args:
             metric_type: Type of metric
@@ -556,26 +617,64 @@ class BotMetricsRepository(BaseRepository[BotMetrics]):
             success: Whether operation succeeded
             error_type: Error type if failed
             extra_data: Additional data
+        """
+        row = {
+            "id": generate_id(),
+            "metric_type": metric_type,
+            "task_id": task_id,
+            "worker_id": worker_id,
+            "duration": duration,
+            "success": success,
+            "error_type": error_type,
+            "extra_data": extra_data,
+            "recorded_at": datetime.utcnow(),
+        }
+        with self._lock:
+            self._buffer.append(row)
+            due = (
+                len(self._buffer) >= self.flush_size
+                or time.monotonic() - self._last_flush > self.flush_interval
+            )
+        if due:
+            self.flush()
+
+    def flush(self) -> int:
+        """Write all buffered metrics in one INSERT.
 
         Returns:
-            Created metric
+            Number of metrics written
         """
-        return self.create(
-            metric_type=metric_type,
-            task_id=task_id,
-            worker_id=worker_id,
-            duration=duration,
-            success=success,
-            error_type=error_type,
-            extra_data=extra_data,
-        )
+        with self._lock:
+            rows = list(self._buffer)
+            self._buffer.clear()
+            self._last_flush = time.monotonic()
+
+        return self.bulk_record_metrics(rows)
+
+    def bulk_record_metrics(self, rows: list[dict[str, Any]]) -> int:
+        """Insert many metrics with a single multi-row INSERT.
+
+        Args:
+            rows: Metric column values, one dict per row
+
+        Returns:
+            Number of metrics written
+        """
+        if not rows:
+            return 0
+
+        for row in rows:
+            row.setdefault("id", generate_id())
+        self.db.execute(insert(BotMetrics), rows)
+        self.db.commit()
+        return len(rows)
 
     def get_by_type(
         self,
         metric_type: str,
         since: datetime | None = None,
         limit: int = 100,
-    ) -> list[BotMetrics]:
+    ) -> Sequence[BotMetrics]:
         """Get metrics by type.
 
         Args:
@@ -590,7 +689,7 @@ class BotMetricsRepository(BaseRepository[BotMetrics]):
         if since:
             stmt = stmt.where(BotMetrics.recorded_at >= since)
         stmt = stmt.order_by(BotMetrics.recorded_at.desc()).limit(limit)
-        return list(self.db.scalars(stmt).all())
+        return self.db.scalars(stmt).all()
 
     def get_aggregated_stats(
         self, metric_type: str, since: datetime | None = None
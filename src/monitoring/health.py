@@ -3,6 +3,8 @@
 import asyncio
 import os
 import platform
+import shutil
+import time
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Any
@@ -13,6 +15,9 @@ from src.monitoring.logger import get_logger
 
 logger = get_logger(__name__)
 
+# (monotonic timestamp, (total, used, free)) of the last disk usage probe
+_disk_usage_cache: tuple[float, tuple[int, int, int]] | None = None
+
 
 @dataclass
 class HealthStatus:
@@ -56,7 +61,7 @@ class HealthMonitor:
         if name not in self._checks:
             return HealthStatus(name=name, status="unknown", message="Check not found")
 
-        start = datetime.utcnow()
+        start = time.perf_counter()
         try:
             check_func = self._checks[name]
             if asyncio.iscoroutinefunction(check_func):
@@ -64,8 +69,7 @@ class HealthMonitor:
             else:
                 result = check_func()
 
-            latency = (datetime.utcnow() - start).total_seconds() * 1000
-            result.latency_ms = latency
+            result.latency_ms = (time.perf_counter() - start) * 1000
 
         except Exception as e:
             result = HealthStatus(
@@ -179,11 +183,16 @@ def check_disk_space() -> HealthStatus:
     Returns:
         Disk space health status
     """
-    try:
-        import shutil
+    global _disk_usage_cache
 
-        path = settings.data_dir
-        total, used, free = shutil.disk_usage(path)
+    try:
+        now = time.monotonic()
+        if (
+            _disk_usage_cache is None
+            or now - _disk_usage_cache[0] >= settings.health_disk_cache_ttl
+        ):
+            _disk_usage_cache = (now, tuple(shutil.disk_usage(settings.data_dir)))
+        total, used, free = _disk_usage_cache[1]
 
         free_gb = free / (1024**3)
         used_percent = (used / total) * 100
@@ -1,13 +1,62 @@
 """Centralized logging configuration using Loguru."""
 
+import atexit
 import sys
 from pathlib import Path
 from typing import Any
 
+import orjson
 from loguru import logger
 
 from src.core.config import settings
 
+# Loguru severity numbers used by the event helpers below
+_INFO = 20
+_WARNING = 30
+_ERROR = 40
+
+
+def _enabled(level_no: int) -> bool:
+    """Check whether any sink accepts records at this severity.
+
+    Lets the event helpers skip building their arguments entirely when the
+    record would be dropped anyway.
+
+    Args:
+        level_no: Loguru severity number
+
+    Returns:
+        True if the record would be emitted
+    """
+    return logger._core.min_level <= level_no
+
+
+def _json_format(record: dict[str, Any]) -> str:
+    """Serialize a record to one JSON line with orjson.
+
+    Used as a dynamic format so the file sink keeps Loguru's rotation,
+    retention and compression while skipping its stdlib-json serializer.
+
+    Args:
+        record: Loguru record
+
+    Returns:
+        Format template emitting the pre-serialized line
+    """
+    record["json"] = orjson.dumps(
+        {
+            "time": record["time"].timestamp(),
+            "level": record["level"].name,
+            "message": record["message"],
+            "name": record["name"],
+            "function": record["function"],
+            "line": record["line"],
+            "extra": record["extra"],
+        },
+        default=str,
+    ).decode()
+    return "{json}\n"
+
 
 def setup_logging() -> None:
     """Configure Loguru logging for the application."""
@@ -41,6 +90,8 @@ def setup_logging() -> None:
         diagnose=settings.debug,
     )
 
+    # File sinks are enqueued so disk writes and rotation/compression happen
+    # off the calling thread; the console sink stays synchronous.
     # Add file handler for all logs
     logs_dir = settings.logs_dir
     logger.add(
@@ -53,6 +104,7 @@ def setup_logging() -> None:
         serialize=False,
         backtrace=True,
         diagnose=True,
+        enqueue=True,
     )
 
     # Add separate file for errors
@@ -65,19 +117,24 @@ def setup_logging() -> None:
         compression="gz",
         backtrace=True,
         diagnose=True,
+        enqueue=True,
     )
 
     # Add JSON file for structured logging (useful for log aggregation)
     logger.add(
         logs_dir / "rpaflow_{time:YYYY-MM-DD}.json",
-        format="{message}",
+        format=_json_format,
         level="INFO",
         rotation="00:00",
         retention="14 days",
         compression="gz",
-        serialize=True,
+        enqueue=True,
     )
 
+    # Drain enqueued records on shutdown (re-registering on repeated setup)
+    atexit.unregister(logger.complete)
+    atexit.register(logger.complete)
+
     logger.info(
         f"Logging initialized | level={settings.log_level} | env={settings.app_env.value}"
     )
@@ -96,7 +153,11 @@ def get_logger(name: str) -> Any:
 
 
 class LogContext:
-    """Context manager for adding extra context to logs."""
+    """Context manager for adding extra context to logs.
+
+    Context is bound through ``logger.contextualize``, so it is scoped to the
+    current thread or asyncio task and removed again on exit.
+    """
 
     def __init__(self, **kwargs: Any) -> None:
         """Initialize with context data.
@@ -105,16 +166,19 @@ class LogContext:
             **kwargs: Key-value pairs to add to log context
         """
         self.context = kwargs
-        self._token = None
+        self._cm: Any = None
 
     def __enter__(self) -> "LogContext":
         """Enter context and bind extra data."""
-        self._token = logger.configure(extra=self.context)
+        self._cm = logger.contextualize(**self.context)
+        self._cm.__enter__()
         return self
 
     def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
-        """Exit context."""
-        pass
+        """Exit context and restore the previous extra data."""
+        cm, self._cm = self._cm, None
+        if cm is not None:
+            cm.__exit__(exc_type, exc_val, exc_tb)
 
 
 def log_task_start(task_id: str, task_type: str, **extra: Any) -> None:
@@ -125,8 +189,15 @@ def log_task_start(task_id: str, task_type: str, **extra: Any) -> None:
         task_type: Type of task
         **extra: Additional context
     """
-    logger.bind(task_id=task_id, task_type=task_type, **extra).info(
-        f"Task started | id={task_id} | type={task_type}"
+    if not _enabled(_INFO):
+        return
+
+    # Keyword arguments fill the template and also land in the record's extra
+    logger.info(
+        "Task started | id={task_id} | type={task_type}",
+        task_id=task_id,
+        task_type=task_type,
+        **extra,
     )
 
 
@@ -142,12 +213,14 @@ def log_task_complete(
         success: Whether task completed successfully
         **extra: Additional context
     """
-    status = "SUCCESS" if success else "FAILED"
+    if not _enabled(_INFO if success else _ERROR):
+        return
+
     log_func = logger.info if success else logger.error
 
     log_func(
-        f"Task completed | id={task_id} | type={task_type} | "
-        f"status={status} | duration={duration:.2f}s",
+        "Task completed | id={task_id} | type={task_type} | status={} | duration={duration:.2f}s",
+        "SUCCESS" if success else "FAILED",
         task_id=task_id,
         task_type=task_type,
         duration=duration,
@@ -168,12 +241,14 @@ def log_scraping_event(
         success: Whether scraping was successful
         **extra: Additional context
     """
-    status = "SUCCESS" if success else "FAILED"
+    if not _enabled(_INFO if success else _WARNING):
+        return
+
     log_func = logger.info if success else logger.warning
 
     log_func(
-        f"Scraping | url={url} | items={items_count} | "
-        f"status={status} | duration={duration:.2f}s",
+        "Scraping | url={url} | items={items_count} | status={} | duration={duration:.2f}s",
+        "SUCCESS" if success else "FAILED",
         url=url,
         items_count=items_count,
         duration=duration,
@@ -194,11 +269,22 @@ def log_proxy_event(
         response_time: Response time in seconds (for health checks)
         **extra: Additional context
     """
-    status = "SUCCESS" if success else "FAILED"
+    if not _enabled(_INFO if success else _WARNING):
+        return
+
     log_func = logger.info if success else logger.warning
 
-    msg = f"Proxy {action} | proxy={proxy} | status={status}"
-    if response_time is not None:
-        msg += f" | response_time={response_time:.3f}s"
+    if response_time is None:
+        template = "Proxy {action} | proxy={proxy} | status={}"
+    else:
+        template = "Proxy {action} | proxy={proxy} | status={} | response_time={response_time:.3f}s"
 
-    log_func(msg, proxy=proxy, action=action, success=success, response_time=response_time, **extra)
+    log_func(
+        template,
+        "SUCCESS" if success else "FAILED",
+        proxy=proxy,
+        action=action,
+        success=success,
+        response_time=response_time,
+        **extra,
+    )
@@ -1,41 +1,131 @@
 """Metrics collection and aggregation."""
 
+import atexit
+import functools
+import math
+import threading
 import time
-from dataclasses import dataclass, field
-from datetime import datetime
+from dataclasses import dataclass
+from datetime import datetime, timezone
 from typing import Any
 
-from src.database.connection import get_db_context
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+
+from src.database.connection import get_session_factory
 from src.database.repository import BotMetricsRepository
 from src.monitoring.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Internal metric key: the bare name, or (name, frozenset of tag items)
+MetricKey = str | tuple[str, frozenset[tuple[str, str]]]
+
+
+@functools.lru_cache(maxsize=1024)
+def _key_to_str(key: MetricKey) -> str:
+    """Render an internal metric key as ``name:k=v,...``.
+
+    Args:
+        key: Key from MetricsCollector._make_key
+
+    Returns:
+        Printable key
+    """
+    if isinstance(key, str):
+        return key
+    name, tags = key
+    tag_str = ",".join(f"{k}={v}" for k, v in sorted(tags))
+    return f"{name}:{tag_str}"
+
 
 @dataclass
-class MetricPoint:
-    """Single metric data point."""
+class TimerAgg:
+    """Running statistics for a timer, updated in O(1) per value."""
 
-    name: str
-    value: float
-    timestamp: datetime = field(default_factory=datetime.utcnow)
-    tags: dict[str, str] = field(default_factory=dict)
+    count: int = 0
+    sum: float = 0.0
+    min: float = math.inf
+    max: float = -math.inf
+    sum_sq: float = 0.0
+
+    def add(self, value: float) -> None:
+        """Fold a duration into the statistics.
+
+        Args:
+            value: Duration in seconds
+        """
+        self.count += 1
+        self.sum += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        self.sum_sq += value * value
+
+    def to_dict(self) -> dict[str, float]:
+        """Convert to the timer stats dictionary.
+
+        Returns:
+            count, min, max, avg and sum
+        """
+        return {
+            "count": self.count,
+            "min": self.min,
+            "max": self.max,
+            "avg": self.sum / self.count,
+            "sum": self.sum,
+        }
 
 
 class MetricsCollector:
-    """Collects and stores performance metrics."""
+    """Collects and stores performance metrics.
+
+    The counter, gauge and timer dictionaries are the only state. A
+    background thread periodically writes one row per key that changed since
+    the previous flush: counter deltas, latest gauge values, and timer
+    count/mean over the window (min/max are running values). The thread is
+    started by :meth:`start` or the first recorded metric, so creating a
+    collector has no side effects. Call :meth:`close` on shutdown to write
+    anything still pending.
+    """
 
-    def __init__(self, buffer_size: int = 100) -> None:
+    def __init__(self, buffer_size: int = 100, flush_interval: float = 10.0) -> None:
         """Initialize metrics collector.
 
         Args:
-            buffer_size: Max metrics to buffer before flush
+            buffer_size: Max changed keys before an early flush
+            flush_interval: Max seconds between flushes
         """
-        self._buffer: list[MetricPoint] = []
         self._buffer_size = buffer_size
-        self._counters: dict[str, float] = {}
-        self._gauges: dict[str, float] = {}
-        self._timers: dict[str, list[float]] = {}
+        self._flush_interval = flush_interval
+        self._lock = threading.Lock()
+        self._counters: dict[MetricKey, float] = {}
+        self._gauges: dict[MetricKey, float] = {}
+        self._timers: dict[MetricKey, TimerAgg] = {}
+        # Keys changed since the last flush, and totals as of that flush
+        self._dirty: set[tuple[str, MetricKey]] = set()
+        self._counter_marks: dict[MetricKey, float] = {}
+        self._timer_marks: dict[MetricKey, tuple[int, float, float]] = {}
+        self._wake = threading.Event()
+        self._closed = False
+        # Long-lived session reused across flushes; guarded by _db_lock
+        self._db: Session | None = None
+        self._db_lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        """Start the background flush thread if it is not running yet."""
+        with self._lock:
+            self._start_thread()
+
+    def _start_thread(self) -> None:
+        """Start the flush thread once (caller holds _lock)."""
+        if self._thread is not None or self._closed:
+            return
+        self._thread = threading.Thread(target=self._flush_loop, name="metrics-flush", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
 
     def increment(self, name: str, value: float = 1.0, tags: dict[str, str] | None = None) -> None:
         """Increment a counter.
@@ -46,8 +136,9 @@ class MetricsCollector:
             tags: Optional tags
         """
         key = self._make_key(name, tags)
-        self._counters[key] = self._counters.get(key, 0) + value
-        self._buffer_metric(name, self._counters[key], tags)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+            self._touch("counter", key)
 
     def gauge(self, name: str, value: float, tags: dict[str, str] | None = None) -> None:
         """Set a gauge value.
@@ -58,8 +149,9 @@ class MetricsCollector:
             tags: Optional tags
         """
         key = self._make_key(name, tags)
-        self._gauges[key] = value
-        self._buffer_metric(name, value, tags)
+        with self._lock:
+            self._gauges[key] = value
+            self._touch("gauge", key)
 
     def timing(self, name: str, value: float, tags: dict[str, str] | None = None) -> None:
         """Record a timing value.
@@ -70,10 +162,12 @@ class MetricsCollector:
             tags: Optional tags
         """
         key = self._make_key(name, tags)
-        if key not in self._timers:
-            self._timers[key] = []
-        self._timers[key].append(value)
-        self._buffer_metric(name, value, tags)
+        with self._lock:
+            agg = self._timers.get(key)
+            if agg is None:
+                agg = self._timers[key] = TimerAgg()
+            agg.add(value)
+            self._touch("timer", key)
 
     def timer(self, name: str, tags: dict[str, str] | None = None) -> "Timer":
         """Create a timer context manager.
@@ -87,7 +181,7 @@ class MetricsCollector:
         """
         return Timer(self, name, tags)
 
-    def _make_key(self, name: str, tags: dict[str, str] | None) -> str:
+    def _make_key(self, name: str, tags: dict[str, str] | None) -> MetricKey:
         """Create unique key from name and tags.
 
         Args:
@@ -95,45 +189,184 @@ class MetricsCollector:
             tags: Metric tags
 
         Returns:
-            Unique key
+            Hashable key (use _key_to_str for display)
         """
         if tags:
-            tag_str = ",".join(f"{k}={v}" for k, v in sorted(tags.items()))
-            return f"{name}:{tag_str}"
+            return (name, frozenset(tags.items()))
         return name
 
-    def _buffer_metric(self, name: str, value: float, tags: dict[str, str] | None) -> None:
-        """Add metric to buffer.
+    def _touch(self, kind: str, key: MetricKey) -> None:
+        """Mark a key as changed, waking the flush thread when enough have.
+
+        Starts the flush thread on the first change.
+
+        Must be called with the lock held.
 
         Args:
-            name: Metric name
-            value: Metric value
-            tags: Optional tags
+            kind: Metric kind (counter, gauge, timer)
+            key: Key from _make_key
         """
-        point = MetricPoint(name=name, value=value, tags=tags or {})
-        self._buffer.append(point)
-
-        if len(self._buffer) >= self._buffer_size:
+        if self._thread is None:
+            self._start_thread()
+        dirty = self._dirty
+        dirty.add((kind, key))
+        if len(dirty) >= self._buffer_size:
+            self._wake.set()
+
+    def _flush_loop(self) -> None:
+        """Background loop flushing on interval, size threshold or close."""
+        while not self._closed:
+            self._wake.wait(self._flush_interval)
+            self._wake.clear()
             self.flush()
 
     def flush(self) -> None:
-        """Flush buffered metrics to database."""
-        if not self._buffer:
+        """Flush metrics changed since the last flush to database."""
+        # recorded_at is stored as naive UTC, like the column's utcnow default
+        recorded_at = datetime.now(timezone.utc).replace(tzinfo=None)
+        # Flush marks only move once the rows are written, so a failed write
+        # leaves its deltas to be retried by the next flush
+        counter_marks: dict[MetricKey, float] = {}
+        timer_marks: dict[MetricKey, tuple[int, float, float]] = {}
+        with self._lock:
+            dirty, self._dirty = self._dirty, set()
+            built = [
+                self._build_row(kind, key, recorded_at, counter_marks, timer_marks)
+                for kind, key in dirty
+            ]
+        rows = [row for row in built if row is not None]
+
+        if not rows:
             return
 
         try:
-            with get_db_context() as db:
-                repo = BotMetricsRepository(db)
-                for point in self._buffer:
-                    repo.record_metric(
-                        metric_type=point.name,
-                        extra_data={"value": point.value, "tags": point.tags},
-                    )
-            logger.debug(f"Flushed {len(self._buffer)} metrics")
+            self._write_rows(rows)
         except Exception as e:
             logger.error(f"Failed to flush metrics: {e}")
-        finally:
-            self._buffer.clear()
+            with self._lock:
+                self._dirty |= dirty
+            return
+
+        with self._lock:
+            self._counter_marks.update(counter_marks)
+            self._timer_marks.update(timer_marks)
+        logger.debug(f"Flushed {len(rows)} metrics")
+
+    def _build_row(
+        self,
+        kind: str,
+        key: MetricKey,
+        recorded_at: datetime,
+        counter_marks: dict[MetricKey, float],
+        timer_marks: dict[MetricKey, tuple[int, float, float]],
+    ) -> dict[str, Any] | None:
+        """Build the DB row for one changed key.
+
+        Must be called with the lock held. The key's new flush mark is put in
+        counter_marks or timer_marks for the caller to commit after writing.
+
+        Args:
+            kind: Metric kind (counter, gauge, timer)
+            key: Key from _make_key
+            recorded_at: Timestamp for the row
+            counter_marks: Collects new counter marks
+            timer_marks: Collects new timer marks
+
+        Returns:
+            Metric row dictionary, or None if there is nothing to write
+        """
+        if isinstance(key, str):
+            name, tags = key, {}
+        else:
+            name, tags = key[0], dict(key[1])
+
+        if kind == "counter":
+            total = self._counters.get(key)
+            if total is None:
+                return None
+            delta = total - self._counter_marks.get(key, 0.0)
+            counter_marks[key] = total
+            data = {"kind": kind, "value": delta, "total": total, "tags": tags}
+        elif kind == "gauge":
+            value = self._gauges.get(key)
+            if value is None:
+                return None
+            data = {"kind": kind, "value": value, "tags": tags}
+        else:
+            agg = self._timers.get(key)
+            if agg is None:
+                return None
+            prev_count, prev_sum, prev_sum_sq = self._timer_marks.get(key, (0, 0.0, 0.0))
+            timer_marks[key] = (agg.count, agg.sum, agg.sum_sq)
+            count = agg.count - prev_count
+            if not count:
+                return None
+            window_sum = agg.sum - prev_sum
+            data = {
+                "kind": kind,
+                "value": window_sum / count,
+                "count": count,
+                "min": agg.min,
+                "max": agg.max,
+                "sum": window_sum,
+                "sum_sq": agg.sum_sq - prev_sum_sq,
+                "tags": tags,
+            }
+
+        return {"metric_type": name, "extra_data": data, "recorded_at": recorded_at}
+
+    def _write_rows(self, rows: list[dict[str, Any]], attempts: int = 3) -> None:
+        """Write metric rows through the collector's long-lived session.
+
+        The session is kept across flushes and rebuilt, with backoff, when
+        the connection drops.
+
+        Args:
+            rows: Metric row dictionaries
+            attempts: Max write attempts on connection errors
+        """
+        with self._db_lock:
+            for attempt in range(attempts):
+                if self._db is None:
+                    self._db = get_session_factory()()
+                try:
+                    BotMetricsRepository(self._db).bulk_record_metrics(rows)
+                    return
+                except OperationalError as e:
+                    self._discard_session()
+                    if attempt == attempts - 1:
+                        raise
+                    logger.warning(f"Metrics DB connection lost, reconnecting: {e}")
+                    time.sleep(0.5 * 2**attempt)
+                except Exception:
+                    self._discard_session()
+                    raise
+
+    def _discard_session(self) -> None:
+        """Roll back and close the long-lived session (caller holds _db_lock)."""
+        db, self._db = self._db, None
+        if db is None:
+            return
+        try:
+            db.rollback()
+            db.close()
+        except Exception as e:
+            logger.debug(f"Error closing metrics session: {e}")
+
+    def close(self, timeout: float | None = 5.0) -> None:
+        """Stop the flush thread after writing everything still pending.
+
+        Args:
+            timeout: Max seconds to wait for the final flush
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+        with self._db_lock:
+            self._discard_session()
 
     def get_counter(self, name: str, tags: dict[str, str] | None = None) -> float:
         """Get current counter value.
@@ -161,7 +394,9 @@ class MetricsCollector:
         key = self._make_key(name, tags)
         return self._gauges.get(key)
 
-    def get_timer_stats(self, name: str, tags: dict[str, str] | None = None) -> dict[str, float] | None:
+    def get_timer_stats(
+        self, name: str, tags: dict[str, str] | None = None
+    ) -> dict[str, float] | None:
         """Get timer statistics.
 
         Args:
@@ -171,19 +406,23 @@ class MetricsCollector:
         Returns:
             Timer stats dict or None
         """
-        key = self._make_key(name, tags)
-        values = self._timers.get(key)
+        return self._timer_stats(self._make_key(name, tags))
+
+    def _timer_stats(self, key: MetricKey) -> dict[str, float] | None:
+        """Get timer statistics for an internal key.
+
+        Args:
+            key: Key from _make_key
 
-        if not values:
+        Returns:
+            Timer stats dict or None
+        """
+        agg = self._timers.get(key)
+
+        if agg is None or not agg.count:
             return None
 
-        return {
-            "count": len(values),
-            "min": min(values),
-            "max": max(values),
-            "avg": sum(values) / len(values),
-            "sum": sum(values),
-        }
+        return agg.to_dict()
 
     def get_all_stats(self) -> dict[str, Any]:
         """Get all collected statistics.
@@ -192,17 +431,20 @@ class MetricsCollector:
             Statistics dictionary
         """
         return {
-            "counters": dict(self._counters),
-            "gauges": dict(self._gauges),
-            "timers": {k: self.get_timer_stats(k) for k in self._timers},
+            "counters": {_key_to_str(k): v for k, v in self._counters.items()},
+            "gauges": {_key_to_str(k): v for k, v in self._gauges.items()},
+            "timers": {_key_to_str(k): self._timer_stats(k) for k in self._timers},
         }
 
     def reset(self) -> None:
         """Reset all metrics."""
-        self._counters.clear()
-        self._gauges.clear()
-        self._timers.clear()
-        self._buffer.clear()
+        with self._lock:
+            self._counters.clear()
+            self._gauges.clear()
+            self._timers.clear()
+            self._dirty.clear()
+            self._counter_marks.clear()
+            self._timer_marks.clear()
 
 
 class Timer:
@@ -249,7 +491,7 @@ class Timer:
         return time.perf_counter() - self._start
 
 
-# Global metrics collector
+# Global metrics collector; its flush thread starts with the first metric
 metrics = MetricsCollector()
 
 
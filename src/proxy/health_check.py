@@ -1,10 +1,14 @@
 """Proxy health checking."""
 
 import asyncio
+import importlib.util
 import time
+from collections import defaultdict
+from contextlib import suppress
 from typing import TYPE_CHECKING
 
 import httpx
+import orjson
 
 from src.core.config import settings
 from src.monitoring.logger import get_logger, log_proxy_event
@@ -14,6 +18,9 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 
+# HTTP/2 needs the optional h2 package (httpx[http2])
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
 # Test URLs for health checks
 TEST_URLS = [
     "https://httpbin.org/ip",
@@ -23,13 +30,20 @@ TEST_URLS = [
 
 
 class ProxyHealthChecker:
-    """Health checker for proxy servers."""
+    """Health checker for proxy servers.
+
+    Deep checks, benchmarks and IP verification keep one pooled client per
+    proxy. Use the checker as an async context manager, or ``await aclose()``
+    when done, so those clients and their sockets are released;
+    :meth:`start_periodic_check` closes them itself when it stops.
+    """
 
     def __init__(
         self,
         manager: "ProxyManager",
         timeout: float | None = None,
         test_url: str | None = None,
+        tcp_timeout: float = 1.0,
     ) -> None:
         """Initialize health checker.
 
@@ -37,41 +51,159 @@ class ProxyHealthChecker:
             manager: ProxyManager instance
             timeout: Request timeout in seconds
             test_url: URL to test proxies against
+            tcp_timeout: Deadline for the TCP liveness probe in seconds
         """
         self.manager = manager
         self.timeout = timeout or settings.proxy_timeout
+        self.tcp_timeout = tcp_timeout
         self.test_url = test_url or TEST_URLS[0]
         self._is_running = False
+        self._current_interval: float | None = None
+        self._clients: dict[str, httpx.AsyncClient] = {}
+
+    def _client_for(self, proxy: "Proxy") -> httpx.AsyncClient:
+        """Get the pooled client routed through a proxy.
+
+        Clients are kept across checks so connections (and TLS sessions)
+        through each proxy are reused instead of rebuilt per request. With
+        HTTP/2 available, concurrent probes through the same proxy multiplex
+        over a single connection.
+
+        Args:
+            proxy: Proxy to route through
+
+        Returns:
+            Shared AsyncClient for this proxy
+        """
+        client = self._clients.get(proxy.url)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                proxy=proxy.url,
+                http2=HTTP2_AVAILABLE,
+                timeout=self.timeout,
+                verify=False,
+                limits=httpx.Limits(max_keepalive_connections=1),
+            )
+            self._clients[proxy.url] = client
+        return client
+
+    async def aclose(self) -> None:
+        """Close all pooled proxy clients.
+
+        Must be awaited after one-shot deep checks, benchmarks or IP
+        verification; the checker stays usable and reopens clients on demand.
+        """
+        clients = list(self._clients.values())
+        self._clients.clear()
+        for client in clients:
+            await client.aclose()
+
+    async def __aenter__(self) -> "ProxyHealthChecker":
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Async context manager exit, closing pooled clients."""
+        await self.aclose()
+
+    async def _tcp_probe(self, proxy: "Proxy") -> float | None:
+        """Check that the proxy accepts TCP connections.
+
+        Args:
+            proxy: Proxy to probe
+
+        Returns:
+            Connect time in seconds, or None if unreachable
+        """
+        start_time = time.time()
+        try:
+            _, writer = await asyncio.wait_for(
+                asyncio.open_connection(proxy.address, proxy.port),
+                timeout=self.tcp_timeout,
+            )
+        except (OSError, asyncio.TimeoutError):
+            return None
+
+        connect_time = time.time() - start_time
+        writer.close()
+        with suppress(Exception):
+            await writer.wait_closed()
+        return connect_time
+
+    async def _probe_status(self, client: httpx.AsyncClient) -> int:
+        """Request the test URL and return only its status code.
 
-    async def check_proxy(self, proxy: "Proxy") -> bool:
+        Uses HEAD so no body is transferred; servers that reject HEAD are
+        retried with a streamed GET that is closed before the body is read.
+
+        Args:
+            client: Client routed through the proxy
+
+        Returns:
+            HTTP status code
+        """
+        response = await client.head(self.test_url, follow_redirects=False)
+        if response.status_code in (405, 501):
+            async with client.stream("GET", self.test_url) as response:
+                pass
+        return response.status_code
+
+    def _record_result(
+        self, proxy: "Proxy", healthy: bool, response_time: float | None = None
+    ) -> bool:
+        """Apply a health check result to the pool.
+
+        Args:
+            proxy: Checked proxy
+            healthy: Check outcome
+            response_time: Measured response time
+
+        Returns:
+            The check outcome
+        """
+        if healthy:
+            self.manager.mark_healthy(proxy, response_time)
+        else:
+            self.manager.mark_unhealthy(proxy)
+        log_proxy_event(
+            proxy=proxy.url_no_auth,
+            action="health_check",
+            success=healthy,
+            response_time=response_time,
+        )
+        return healthy
+
+    async def check_proxy(self, proxy: "Proxy", deep: bool = True) -> bool:
         """Check if proxy is healthy.
 
+        A TCP connect is tried first, so dead proxies fail fast without
+        DNS, TLS or an HTTP round-trip. The HTTP request through the proxy
+        is only made for deep checks.
+
         Args:
             proxy: Proxy to check
+            deep: Also fetch the test URL through the proxy
 
         Returns:
             True if proxy is healthy
         """
+        connect_time = await self._tcp_probe(proxy)
+        if connect_time is None:
+            logger.debug(f"Proxy unreachable: {proxy.url_no_auth}")
+            return self._record_result(proxy, False)
+        if not deep:
+            # A TCP connect time is not comparable to the HTTP round-trip
+            # stored in response_time, so liveness probes leave it untouched
+            return self._record_result(proxy, True)
+
         start_time = time.time()
 
         try:
-            async with httpx.AsyncClient(
-                proxy=proxy.url,
-                timeout=self.timeout,
-                verify=False,
-            ) as client:
-                response = await client.get(self.test_url)
-                response_time = time.time() - start_time
+            status_code = await self._probe_status(self._client_for(proxy))
+            response_time = time.time() - start_time
 
-                if response.status_code == 200:
-                    self.manager.mark_healthy(proxy, response_time)
-                    log_proxy_event(
-                        proxy=proxy.url_no_auth,
-                        action="health_check",
-                        success=True,
-                        response_time=response_time,
-                    )
-                    return True
+            if status_code == 200:
+                return self._record_result(proxy, True, response_time)
 
         except httpx.TimeoutException:
             logger.debug(f"Proxy timeout: {proxy.url_no_auth}")
@@ -80,13 +212,7 @@ class ProxyHealthChecker:
         except Exception as e:
             logger.debug(f"Health check failed: {proxy.url_no_auth} | {e}")
 
-        self.manager.mark_unhealthy(proxy)
-        log_proxy_event(
-            proxy=proxy.url_no_auth,
-            action="health_check",
-            success=False,
-        )
-        return False
+        return self._record_result(proxy, False)
 
     def check_proxy_sync(self, proxy: "Proxy") -> bool:
         """Synchronous proxy health check.
@@ -105,7 +231,10 @@ class ProxyHealthChecker:
                 timeout=self.timeout,
                 verify=False,
             ) as client:
-                response = client.get(self.test_url)
+                response = client.head(self.test_url, follow_redirects=False)
+                if response.status_code in (405, 501):
+                    with client.stream("GET", self.test_url) as response:
+                        pass
                 response_time = time.time() - start_time
 
                 if response.status_code == 200:
@@ -118,11 +247,12 @@ class ProxyHealthChecker:
         self.manager.mark_unhealthy(proxy)
         return False
 
-    async def check_all(self, concurrency: int = 10) -> dict[str, int]:
+    async def check_all(self, concurrency: int = 10, deep: bool = True) -> dict[str, int]:
         """Check all proxies in pool.
 
         Args:
             concurrency: Maximum concurrent checks
+            deep: Run full HTTP checks instead of TCP-only liveness probes
 
         Returns:
             Dictionary with healthy and unhealthy counts
@@ -137,7 +267,7 @@ class ProxyHealthChecker:
 
         async def check_with_semaphore(proxy: "Proxy") -> bool:
             async with semaphore:
-                return await self.check_proxy(proxy)
+                return await self.check_proxy(proxy, deep=deep)
 
         results = await asyncio.gather(*[check_with_semaphore(p) for p in proxies])
 
@@ -177,24 +307,42 @@ class ProxyHealthChecker:
     async def start_periodic_check(self, interval: int | None = None) -> None:
         """Start periodic health checking.
 
+        Periodic sweeps only run the TCP liveness probe; use
+        :meth:`check_all` for a full HTTP verification. The sleep between
+        sweeps adapts to pool churn: it grows 1.5x (up to 10x the base
+        interval) while fewer than 1% of proxies fail, and halves (down to
+        0.25x) when more than 10% fail.
+
         Args:
-            interval: Check interval in seconds
+            interval: Base check interval in seconds
         """
         interval = interval or settings.proxy_health_check_interval
         self._is_running = True
+        self._current_interval = float(interval)
 
         logger.info(f"Starting periodic health check | interval={interval}s")
 
         while self._is_running:
             try:
-                await self.check_all()
+                result = await self.check_all(deep=False)
+                if result["total"]:
+                    unhealthy_frac = result["unhealthy"] / result["total"]
+                    if unhealthy_frac < 0.01:
+                        self._current_interval = min(self._current_interval * 1.5, interval * 10)
+                    elif unhealthy_frac > 0.1:
+                        self._current_interval = max(self._current_interval / 2, interval * 0.25)
             except Exception as e:
                 logger.error(f"Periodic health check error: {e}")
 
-            await asyncio.sleep(interval)
+            await asyncio.sleep(self._current_interval)
+
+        await self.aclose()
 
     def stop_periodic_check(self) -> None:
-        """Stop periodic health checking."""
+        """Stop periodic health checking.
+
+        Pooled clients are closed once the running loop exits.
+        """
         self._is_running = False
         logger.info("Stopped periodic health check")
 
@@ -208,54 +356,67 @@ class ProxyHealthChecker:
             External IP address or None
         """
         try:
-            async with httpx.AsyncClient(
-                proxy=proxy.url,
-                timeout=self.timeout,
-                verify=False,
-            ) as client:
-                response = await client.get("https://api.ipify.org?format=json")
-                if response.status_code == 200:
-                    data = response.json()
-                    ip = data.get("ip")
-                    logger.debug(f"Proxy {proxy.url_no_auth} external IP: {ip}")
-                    return ip
+            client = self._client_for(proxy)
+            response = await client.get("https://api.ipify.org?format=json")
+            if response.status_code == 200:
+                data = orjson.loads(response.content)
+                ip = data.get("ip")
+                logger.debug(f"Proxy {proxy.url_no_auth} external IP: {ip}")
+                return ip
 
         except Exception as e:
             logger.debug(f"IP verification failed: {proxy.url_no_auth} | {e}")
 
         return None
 
-    async def benchmark_proxies(self, iterations: int = 3) -> list[dict]:
+    async def _probe_once(self, proxy: "Proxy") -> tuple["Proxy", float | None]:
+        """Time a single request through a proxy.
+
+        Args:
+            proxy: Proxy to probe
+
+        Returns:
+            The proxy and its response time, or None on failure
+        """
+        start = time.time()
+        try:
+            status_code = await self._probe_status(self._client_for(proxy))
+            if status_code == 200:
+                return proxy, time.time() - start
+        except Exception:
+            pass
+        return proxy, None
+
+    async def benchmark_proxies(self, iterations: int = 3, concurrency: int = 10) -> list[dict]:
         """Benchmark all proxies with multiple iterations.
 
         Args:
             iterations: Number of test iterations per proxy
+            concurrency: Maximum concurrent probes
 
         Returns:
             List of benchmark results
         """
         proxies = self.manager.get_all()
-        results = []
+        semaphore = asyncio.Semaphore(concurrency)
 
-        for proxy in proxies:
-            times = []
-            successes = 0
-
-            for _ in range(iterations):
-                start = time.time()
-                try:
-                    async with httpx.AsyncClient(
-                        proxy=proxy.url,
-                        timeout=self.timeout,
-                        verify=False,
-                    ) as client:
-                        response = await client.get(self.test_url)
-                        if response.status_code == 200:
-                            times.append(time.time() - start)
-                            successes += 1
-                except Exception:
-                    pass
+        async def probe_with_semaphore(proxy: "Proxy") -> tuple["Proxy", float | None]:
+            async with semaphore:
+                return await self._probe_once(proxy)
 
+        probes = await asyncio.gather(
+            *[probe_with_semaphore(p) for p in proxies for _ in range(iterations)]
+        )
+
+        times_by_proxy: dict[int, list[float]] = defaultdict(list)
+        for proxy, elapsed in probes:
+            if elapsed is not None:
+                times_by_proxy[id(proxy)].append(elapsed)
+
+        results = []
+        for proxy in proxies:
+            times = times_by_proxy.get(id(proxy), [])
+            successes = len(times)
             avg_time = sum(times) / len(times) if times else None
             success_rate = (successes / iterations) * 100
 
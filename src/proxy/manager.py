@@ -1,6 +1,7 @@
 """Proxy pool management."""
 
 import re
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
@@ -10,8 +11,24 @@ from src.monitoring.logger import get_logger
 
 logger = get_logger(__name__)
 
+# URL format: protocol://[user:pass@]ip:port
+_PROXY_URL_RE = re.compile(r"^(https?|socks[45]?)://(?:([^:]+):([^@]+)@)?([^:]+):(\d+)$")
 
-@dataclass
+# Keys of Proxy.to_dict, in output order
+_PROXY_DICT_KEYS = (
+    "address",
+    "port",
+    "protocol",
+    "username",
+    "country",
+    "is_healthy",
+    "response_time",
+    "success_rate",
+    "total_requests",
+)
+
+
+@dataclass(slots=True)
 class Proxy:
     """Represents a proxy server."""
 
@@ -29,36 +46,25 @@ class Proxy:
     fail_count: int = 0
     total_requests: int = 0
 
-    @property
-    def url(self) -> str:
-        """Get proxy URL.
-
-        Returns:
-            Formatted proxy URL
-        """
+    # Proxy URL with and without credentials, built once in __post_init__
+    url: str = field(init=False, repr=False, compare=False)
+    url_no_auth: str = field(init=False, repr=False, compare=False)
+    # Success rate percentage, updated whenever a request is recorded
+    success_rate: float = field(default=0.0, init=False, repr=False, compare=False)
+    # Pool keeping running totals over this proxy's stats, if any
+    _pool: "ProxyPool | None" = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Precompute proxy URLs and success rate (connection details do not change)."""
+        if self.total_requests:
+            self.success_rate = (self.success_count / self.total_requests) * 100
+        self.url_no_auth = f"{self.protocol}://{self.address}:{self.port}"
         if self.username and self.password:
-            return f"{self.protocol}://{self.username}:{self.password}@{self.address}:{self.port}"
-        return f"{self.protocol}://{self.address}:{self.port}"
-
-    @property
-    def url_no_auth(self) -> str:
-        """Get proxy URL without authentication.
-
-        Returns:
-            Proxy URL without credentials
-        """
-        return f"{self.protocol}://{self.address}:{self.port}"
-
-    @property
-    def success_rate(self) -> float:
-        """Calculate success rate.
-
-        Returns:
-            Success rate percentage
-        """
-        if self.total_requests == 0:
-            return 0.0
-        return (self.success_count / self.total_requests) * 100
+            self.url = (
+                f"{self.protocol}://{self.username}:{self.password}@{self.address}:{self.port}"
+            )
+        else:
+            self.url = self.url_no_auth
 
     def record_success(self, response_time: float | None = None) -> None:
         """Record successful request.
@@ -66,18 +72,32 @@ class Proxy:
         Args:
             response_time: Response time in seconds
         """
+        pool = self._pool
+        if pool is not None:
+            pool._track(self, -1)
         self.success_count += 1
         self.total_requests += 1
+        self.success_rate = (self.success_count / self.total_requests) * 100
         if response_time is not None:
             self.response_time = response_time
+        if pool is not None:
+            pool._track(self, 1)
 
     def record_failure(self) -> None:
         """Record failed request."""
         self.fail_count += 1
         self.total_requests += 1
+        self.success_rate = (self.success_count / self.total_requests) * 100
+        if self._pool is not None:
+            self._pool._total_requests += 1
 
     @classmethod
-    def from_string(cls, proxy_str: str) -> "Proxy | None":
+    def from_string(
+        cls,
+        proxy_str: str,
+        _url_re: re.Pattern[str] = _PROXY_URL_RE,
+        _warn: Callable[..., None] = logger.warning,
+    ) -> "Proxy | None":
         """Parse proxy from string.
 
         Supported formats:
@@ -88,6 +108,8 @@ class Proxy:
 
         Args:
             proxy_str: Proxy string
+            _url_re: Bound URL pattern (local lookup in the per-line loop)
+            _warn: Bound warning logger
 
         Returns:
             Proxy instance or None if invalid
@@ -96,32 +118,49 @@ class Proxy:
         if not proxy_str or proxy_str.startswith("#"):
             return None
 
-        # URL format: protocol://[user:pass@]ip:port
-        url_pattern = r"^(https?|socks[45]?)://(?:([^:]+):([^@]+)@)?([^:]+):(\d+)$"
-        match = re.match(url_pattern, proxy_str)
-        if match:
-            return cls(
-                protocol=match.group(1),
-                username=match.group(2),
-                password=match.group(3),
-                address=match.group(4),
-                port=int(match.group(5)),
-            )
+        if "://" in proxy_str:
+            match = _url_re.match(proxy_str)
+            if match:
+                return cls(
+                    protocol=match.group(1),
+                    username=match.group(2),
+                    password=match.group(3),
+                    address=match.group(4),
+                    port=int(match.group(5)),
+                )
+        else:
+            # Simple format: ip:port or ip:port:user:pass
+            colons = proxy_str.count(":")
+            if colons == 1:
+                address, port = proxy_str.split(":")
+                return cls(address=address, port=int(port))
+            elif colons == 3:
+                address, port, username, password = proxy_str.split(":")
+                return cls(
+                    address=address,
+                    port=int(port),
+                    username=username,
+                    password=password,
+                )
+
+        _warn(f"Invalid proxy format: {proxy_str}")
+        return None
 
-        # Simple format: ip:port or ip:port:user:pass
-        parts = proxy_str.split(":")
-        if len(parts) == 2:
-            return cls(address=parts[0], port=int(parts[1]))
-        elif len(parts) == 4:
-            return cls(
-                address=parts[0],
-                port=int(parts[1]),
-                username=parts[2],
-                password=parts[3],
-            )
+    @classmethod
+    def _from_line_bytes(cls, line: bytes) -> "Proxy | None":
+        """Parse proxy from a raw file line.
 
-        logger.warning(f"Invalid proxy format: {proxy_str}")
-        return None
+        Blank and comment lines are rejected before any decoding.
+
+        Args:
+            line: Line from a proxy file opened in binary mode
+
+        Returns:
+            Proxy instance or None if empty, comment or invalid
+        """
+        if not line or line[:1] == b"#":
+            return None
+        return cls.from_string(line.decode())
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary.
@@ -129,24 +168,42 @@ class Proxy:
         Returns:
             Dictionary representation
         """
-        return {
-            "address": self.address,
-            "port": self.port,
-            "protocol": self.protocol,
-            "username": self.username,
-            "country": self.country,
-            "is_healthy": self.is_healthy,
-            "response_time": self.response_time,
-            "success_rate": self.success_rate,
-            "total_requests": self.total_requests,
-        }
+        return dict(
+            zip(
+                _PROXY_DICT_KEYS,
+                (
+                    self.address,
+                    self.port,
+                    self.protocol,
+                    self.username,
+                    self.country,
+                    self.is_healthy,
+                    self.response_time,
+                    self.success_rate,
+                    self.total_requests,
+                ),
+            )
+        )
 
 
-@dataclass
+@dataclass(slots=True)
 class ProxyPool:
     """Pool of proxy servers."""
 
     proxies: list[Proxy] = field(default_factory=list)
+    # (address, port) -> position in proxies, for O(1) lookups and removal
+    _index: dict[tuple[str, int], int] = field(default_factory=dict, init=False, repr=False)
+    # Running totals for ProxyManager.get_stats; response time covers healthy proxies
+    _total_requests: int = field(default=0, init=False, repr=False)
+    _total_success: int = field(default=0, init=False, repr=False)
+    _rt_sum: float = field(default=0.0, init=False, repr=False)
+    _rt_count: int = field(default=0, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Index proxies passed to the constructor, dropping duplicates."""
+        proxies, self.proxies = self.proxies, []
+        for proxy in proxies:
+            self.add(proxy)
 
     def add(self, proxy: Proxy) -> None:
         """Add proxy to pool.
@@ -155,9 +212,37 @@ class ProxyPool:
             proxy: Proxy to add
         """
         # Avoid duplicates
-        if not any(p.address == proxy.address and p.port == proxy.port for p in self.proxies):
-            self.proxies.append(proxy)
-            logger.debug(f"Added proxy: {proxy.url_no_auth}")
+        key = (proxy.address, proxy.port)
+        if key in self._index:
+            return
+        self._index[key] = len(self.proxies)
+        self.proxies.append(proxy)
+        proxy._pool = self
+        self._track(proxy, 1)
+        logger.debug("Added proxy: {}", proxy.url_no_auth)
+
+    def bulk_add(self, proxies: Iterable[Proxy]) -> int:
+        """Add many proxies to pool, skipping duplicates.
+
+        Args:
+            proxies: Proxies to add
+
+        Returns:
+            Number of proxies actually added
+        """
+        index = self._index
+        start = len(self.proxies)
+        added = []
+        for proxy in proxies:
+            key = (proxy.address, proxy.port)
+            if key not in index:
+                index[key] = start + len(added)
+                added.append(proxy)
+                proxy._pool = self
+                self._track(proxy, 1)
+        self.proxies.extend(added)
+        logger.debug(f"Added {len(added)} proxies")
+        return len(added)
 
     def remove(self, proxy: Proxy) -> None:
         """Remove proxy from pool.
@@ -165,7 +250,35 @@ class ProxyPool:
         Args:
             proxy: Proxy to remove
         """
-        self.proxies = [p for p in self.proxies if not (p.address == proxy.address and p.port == proxy.port)]
+        position = self._index.pop((proxy.address, proxy.port), None)
+        if position is None:
+            return
+
+        # Swap-and-pop: move the last proxy into the freed slot
+        removed = self.proxies[position]
+        last = self.proxies.pop()
+        if position < len(self.proxies):
+            self.proxies[position] = last
+            self._index[(last.address, last.port)] = position
+        self._track(removed, -1)
+        removed._pool = None
+
+    def _track(self, proxy: Proxy, sign: int) -> None:
+        """Add or subtract a proxy's contribution to the running totals.
+
+        Callers subtract before changing a pooled proxy's stats or health
+        and add back afterwards.
+
+        Args:
+            proxy: Proxy in this pool
+            sign: 1 to add, -1 to subtract
+        """
+        self._total_requests += sign * proxy.total_requests
+        self._total_success += sign * proxy.success_count
+        if proxy.is_healthy and proxy.response_time is not None:
+            self._rt_count += sign
+            # Reset at zero so float error cannot accumulate across churn
+            self._rt_sum = self._rt_sum + sign * proxy.response_time if self._rt_count else 0.0
 
     def get_healthy(self) -> list[Proxy]:
         """Get all healthy proxies.
@@ -185,10 +298,8 @@ class ProxyPool:
         Returns:
             Proxy or None
         """
-        for proxy in self.proxies:
-            if proxy.address == address and proxy.port == port:
-                return proxy
-        return None
+        position = self._index.get((address, port))
+        return None if position is None else self.proxies[position]
 
     @property
     def size(self) -> int:
@@ -210,7 +321,12 @@ class ProxyPool:
 
     def clear(self) -> None:
         """Clear all proxies from pool."""
+        for proxy in self.proxies:
+            proxy._pool = None
         self.proxies.clear()
+        self._index.clear()
+        self._total_requests = self._total_success = self._rt_count = 0
+        self._rt_sum = 0.0
 
     def to_list(self) -> list[dict[str, Any]]:
         """Convert to list of dictionaries.
@@ -228,6 +344,9 @@ class ProxyManager:
         """Initialize proxy manager."""
         self.pool = ProxyPool()
         self._enabled = settings.proxy_enabled
+        # Healthy proxies, rebuilt lazily after pool or health changes
+        self._healthy_cache: list[Proxy] = []
+        self._dirty = True
 
     @property
     def enabled(self) -> bool:
@@ -263,13 +382,11 @@ class ProxyManager:
             logger.warning(f"Proxy file not found: {filepath}")
             return 0
 
-        count = 0
-        with open(filepath, "r") as f:
-            for line in f:
-                proxy = Proxy.from_string(line)
-                if proxy:
-                    self.pool.add(proxy)
-                    count += 1
+        lines = filepath.read_bytes().splitlines()
+        parsed = [p for p in map(Proxy._from_line_bytes, lines) if p is not None]
+        self.pool.bulk_add(parsed)
+        self._dirty = True
+        count = len(parsed)
 
         logger.info(f"Loaded {count} proxies from {filepath}")
         return count
@@ -283,12 +400,10 @@ class ProxyManager:
         Returns:
             Number of proxies loaded
         """
-        count = 0
-        for proxy_str in proxy_strings:
-            proxy = Proxy.from_string(proxy_str)
-            if proxy:
-                self.pool.add(proxy)
-                count += 1
+        parsed = [p for p in map(Proxy.from_string, proxy_strings) if p is not None]
+        self.pool.bulk_add(parsed)
+        self._dirty = True
+        count = len(parsed)
 
         logger.info(f"Loaded {count} proxies from list")
         return count
@@ -324,6 +439,7 @@ class ProxyManager:
             country=country,
         )
         self.pool.add(proxy)
+        self._dirty = True
         return proxy
 
     def remove_proxy(self, address: str, port: int) -> bool:
@@ -339,6 +455,7 @@ class ProxyManager:
         proxy = self.pool.get_by_address(address, port)
         if proxy:
             self.pool.remove(proxy)
+            self._dirty = True
             return True
         return False
 
@@ -349,9 +466,16 @@ class ProxyManager:
             proxy: Proxy to mark
             response_time: Response time
         """
-        proxy.is_healthy = True
+        pool = proxy._pool
+        if pool is not None:
+            pool._track(proxy, -1)
+        if not proxy.is_healthy:
+            proxy.is_healthy = True
+            self._dirty = True
         if response_time is not None:
             proxy.response_time = response_time
+        if pool is not None:
+            pool._track(proxy, 1)
 
     def mark_unhealthy(self, proxy: Proxy) -> None:
         """Mark proxy as unhealthy.
@@ -359,7 +483,14 @@ class ProxyManager:
         Args:
             proxy: Proxy to mark
         """
-        proxy.is_healthy = False
+        if proxy.is_healthy:
+            pool = proxy._pool
+            if pool is not None:
+                pool._track(proxy, -1)
+            proxy.is_healthy = False
+            self._dirty = True
+            if pool is not None:
+                pool._track(proxy, 1)
         logger.warning(f"Proxy marked unhealthy: {proxy.url_no_auth}")
 
     def get_all(self) -> list[Proxy]:
@@ -373,10 +504,16 @@ class ProxyManager:
     def get_healthy(self) -> list[Proxy]:
         """Get healthy proxies.
 
+        The list is cached and shared between calls until the pool or a
+        proxy's health changes; callers must not modify it.
+
         Returns:
             Healthy proxies
         """
-        return self.pool.get_healthy()
+        if self._dirty:
+            self._healthy_cache = self.pool.get_healthy()
+            self._dirty = False
+        return self._healthy_cache
 
     def get_stats(self) -> dict[str, Any]:
         """Get proxy pool statistics.
@@ -384,22 +521,18 @@ class ProxyManager:
         Returns:
             Statistics dictionary
         """
-        all_proxies = self.pool.proxies
-        healthy = self.pool.get_healthy()
-
-        total_requests = sum(p.total_requests for p in all_proxies)
-        total_success = sum(p.success_count for p in all_proxies)
-
-        avg_response_time = None
-        proxies_with_time = [p for p in healthy if p.response_time is not None]
-        if proxies_with_time:
-            avg_response_time = sum(p.response_time for p in proxies_with_time) / len(proxies_with_time)
+        # O(1): totals are maintained incrementally by the pool
+        pool = self.pool
+        total_requests = pool._total_requests
+        total_success = pool._total_success
+        avg_response_time = pool._rt_sum / pool._rt_count if pool._rt_count else None
+        healthy_count = len(self.get_healthy())
 
         return {
             "enabled": self._enabled,
-            "total": self.pool.size,
-            "healthy": self.pool.healthy_count,
-            "unhealthy": self.pool.size - self.pool.healthy_count,
+            "total": pool.size,
+            "healthy": healthy_count,
+            "unhealthy": pool.size - healthy_count,
             "total_requests": total_requests,
             "success_rate": (total_success / total_requests * 100) if total_requests > 0 else 0,
             "avg_response_time": round(avg_response_time, 3) if avg_response_time else None,
@@ -414,11 +547,12 @@ class ProxyManager:
         filepath = Path(filepath)
         filepath.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(filepath, "w") as f:
-            for proxy in self.pool.proxies:
-                if proxy.username and proxy.password:
-                    f.write(f"{proxy.address}:{proxy.port}:{proxy.username}:{proxy.password}\n")
-                else:
-                    f.write(f"{proxy.address}:{proxy.port}\n")
+        lines = [
+            f"{p.address}:{p.port}:{p.username}:{p.password}\n"
+            if p.username and p.password
+            else f"{p.address}:{p.port}\n"
+            for p in self.pool.proxies
+        ]
+        filepath.write_text("".join(lines))
 
         logger.info(f"Saved {self.pool.size} proxies to {filepath}")
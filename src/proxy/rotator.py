@@ -1,8 +1,12 @@
 """Proxy rotation strategies."""
 
+import heapq
+import itertools
 import random
 from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterator
 from enum import Enum
+from operator import attrgetter
 from typing import TYPE_CHECKING
 
 from src.monitoring.logger import get_logger
@@ -12,6 +16,9 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 
+# C-level key function for FastestRotator
+_response_time = attrgetter("response_time")
+
 
 class RotationStrategy(str, Enum):
     """Available rotation strategies."""
@@ -43,7 +50,12 @@ class RoundRobinRotator(BaseRotator):
     """Round-robin rotation - cycle through proxies in order."""
 
     def __init__(self) -> None:
-        self._index = 0
+        self._cycle: Iterator["Proxy"] | None = None
+        # List the cycle was built from; holding it also keeps its id stable
+        self._source: list["Proxy"] | None = None
+        self._source_len = 0
+        # Proxies handed out so far, so a rebuilt cycle resumes where it left off
+        self._pos = 0
 
     def get_next(self, proxies: list["Proxy"]) -> "Proxy | None":
         """Get next proxy in round-robin order.
@@ -57,13 +69,16 @@ class RoundRobinRotator(BaseRotator):
         if not proxies:
             return None
 
-        # Reset index if out of bounds
-        if self._index >= len(proxies):
-            self._index = 0
+        # Rebuild the cycle when handed a different (or resized) list, resuming
+        # at the same position rather than always restarting at proxies[0]
+        if self._cycle is None or proxies is not self._source or len(proxies) != self._source_len:
+            start = self._pos % len(proxies)
+            self._cycle = itertools.chain(proxies[start:], itertools.cycle(proxies))
+            self._source = proxies
+            self._source_len = len(proxies)
 
-        proxy = proxies[self._index]
-        self._index = (self._index + 1) % len(proxies)
-        return proxy
+        self._pos += 1
+        return next(self._cycle)
 
 
 class RandomRotator(BaseRotator):
@@ -84,7 +99,17 @@ class RandomRotator(BaseRotator):
 
 
 class LeastUsedRotator(BaseRotator):
-    """Least used rotation - prefer proxies with fewer requests."""
+    """Least used rotation - prefer proxies with fewer requests.
+
+    Keeps a min-heap of (usage, position, proxy). Selecting a proxy bumps its
+    usage so the next call moves on, and entries lagging behind the proxy's
+    recorded total_requests are corrected lazily when they reach the top.
+    """
+
+    def __init__(self) -> None:
+        self._heap: list[tuple[int, int, "Proxy"]] = []
+        self._source: list["Proxy"] | None = None
+        self._source_len = 0
 
     def get_next(self, proxies: list["Proxy"]) -> "Proxy | None":
         """Get least used proxy.
@@ -97,7 +122,22 @@ class LeastUsedRotator(BaseRotator):
         """
         if not proxies:
             return None
-        return min(proxies, key=lambda p: p.total_requests)
+
+        # Rebuild when handed a different (or resized) list
+        if proxies is not self._source or len(proxies) != self._source_len:
+            self._heap = [(p.total_requests, i, p) for i, p in enumerate(proxies)]
+            heapq.heapify(self._heap)
+            self._source = proxies
+            self._source_len = len(proxies)
+
+        heap = self._heap
+        while True:
+            usage, position, proxy = heap[0]
+            if proxy.total_requests > usage:
+                heapq.heapreplace(heap, (proxy.total_requests, position, proxy))
+                continue
+            heapq.heapreplace(heap, (usage + 1, position, proxy))
+            return proxy
 
 
 class FastestRotator(BaseRotator):
@@ -115,18 +155,39 @@ class FastestRotator(BaseRotator):
         if not proxies:
             return None
 
-        # Filter proxies with response time data
-        with_time = [p for p in proxies if p.response_time is not None]
-
-        if with_time:
-            return min(with_time, key=lambda p: p.response_time)
+        # Single pass over proxies with response time data
+        fastest = min(
+            (p for p in proxies if p.response_time is not None),
+            key=_response_time,
+            default=None,
+        )
+        if fastest is not None:
+            return fastest
 
         # Fallback to random if no timing data
         return random.choice(proxies)
 
 
 class WeightedRotator(BaseRotator):
-    """Weighted rotation - prefer proxies with higher success rate."""
+    """Weighted rotation - prefer proxies with higher success rate.
+
+    Samples from a Walker alias table in O(1) per call. Success rates drift
+    slowly, so the table is rebuilt every ``refresh_interval`` selections
+    (or when the proxy list changes) rather than on every stat update.
+    """
+
+    def __init__(self, refresh_interval: int = 100) -> None:
+        """Initialize weighted rotator.
+
+        Args:
+            refresh_interval: Selections between alias table rebuilds
+        """
+        self.refresh_interval = refresh_interval
+        self._prob: list[float] = []
+        self._alias: list[int] = []
+        self._source: list["Proxy"] | None = None
+        self._source_len = 0
+        self._remaining = 0
 
     def get_next(self, proxies: list["Proxy"]) -> "Proxy | None":
         """Get proxy weighted by success rate.
@@ -140,25 +201,48 @@ class WeightedRotator(BaseRotator):
         if not proxies:
             return None
 
-        # Calculate weights based on success rate
-        weights = []
-        for proxy in proxies:
-            if proxy.total_requests == 0:
-                weights.append(50.0)  # Default weight for unused proxies
-            else:
-                weights.append(max(proxy.success_rate, 1.0))  # Minimum weight of 1
+        n = len(proxies)
+        if self._remaining <= 0 or proxies is not self._source or n != self._source_len:
+            # Default weight 50 for unused proxies, minimum weight of 1 otherwise
+            weights = [max(p.success_rate, 1.0) if p.total_requests else 50.0 for p in proxies]
+            self._prob, self._alias = _build_alias_table(weights)
+            self._source = proxies
+            self._source_len = n
+            self._remaining = self.refresh_interval
+        self._remaining -= 1
+
+        i = int(random.random() * n)
+        return proxies[i] if random.random() < self._prob[i] else proxies[self._alias[i]]
+
+
+def _build_alias_table(weights: list[float]) -> tuple[list[float], list[int]]:
+    """Build a Walker alias table using Vose's method.
+
+    Args:
+        weights: Positive sampling weights
+
+    Returns:
+        Acceptance probability and alias index for each slot
+    """
+    n = len(weights)
+    scale = n / sum(weights)
+    prob = [w * scale for w in weights]
+    alias = list(range(n))
+    small = [i for i, p in enumerate(prob) if p < 1.0]
+    large = [i for i, p in enumerate(prob) if p >= 1.0]
 
-        # Weighted random selection
-        total_weight = sum(weights)
-        r = random.uniform(0, total_weight)
+    while small and large:
+        s = small.pop()
+        g = large.pop()
+        alias[s] = g
+        prob[g] += prob[s] - 1.0
+        (small if prob[g] < 1.0 else large).append(g)
 
-        cumulative = 0
-        for proxy, weight in zip(proxies, weights):
-            cumulative += weight
-            if r <= cumulative:
-                return proxy
+    # Leftovers are 1.0 up to float error
+    for i in small + large:
+        prob[i] = 1.0
 
-        return proxies[-1]
+    return prob, alias
 
 
 class ProxyRotator:
@@ -180,6 +264,7 @@ class ProxyRotator:
             RotationStrategy.FASTEST: FastestRotator(),
             RotationStrategy.WEIGHTED: WeightedRotator(),
         }
+        self._active_get_next = self._resolve(strategy)
         self._current_proxy: "Proxy | None" = None
 
     @property
@@ -199,8 +284,21 @@ class ProxyRotator:
             value: New strategy
         """
         self._strategy = value
+        self._active_get_next = self._resolve(value)
         logger.info(f"Rotation strategy changed to: {value.value}")
 
+    def _resolve(self, strategy: RotationStrategy) -> Callable[[list["Proxy"]], "Proxy | None"]:
+        """Resolve a strategy to its rotator's bound get_next.
+
+        Args:
+            strategy: Rotation strategy
+
+        Returns:
+            Selection function, falling back to round-robin
+        """
+        rotator = self._rotators.get(strategy, self._rotators[RotationStrategy.ROUND_ROBIN])
+        return rotator.get_next
+
     @property
     def current_proxy(self) -> "Proxy | None":
         """Get current proxy.
@@ -225,12 +323,14 @@ class ProxyRotator:
             logger.warning("No healthy proxies available")
             return None
 
-        rotator = self._rotators.get(self._strategy, self._rotators[RotationStrategy.ROUND_ROBIN])
-        proxy = rotator.get_next(healthy_proxies)
+        proxy = self._active_get_next(healthy_proxies)
 
         if proxy:
             self._current_proxy = proxy
-            logger.debug(f"Selected proxy: {proxy.url_no_auth} | strategy={self._strategy.value}")
+            # Lazy template: only formatted when a sink accepts DEBUG
+            logger.debug(
+                "Selected proxy: {} | strategy={}", proxy.url_no_auth, self._strategy.value
+            )
 
         return proxy
 
@@ -250,7 +350,7 @@ class ProxyRotator:
         """
         if self._current_proxy:
             self._current_proxy.record_success(response_time)
-            logger.debug(f"Recorded success for proxy: {self._current_proxy.url_no_auth}")
+            logger.debug("Recorded success for proxy: {}", self._current_proxy.url_no_auth)
 
     def record_failure(self, auto_rotate: bool = True) -> "Proxy | None":
         """Record failed request with current proxy.
@@ -263,7 +363,7 @@ class ProxyRotator:
         """
         if self._current_proxy:
             self._current_proxy.record_failure()
-            logger.debug(f"Recorded failure for proxy: {self._current_proxy.url_no_auth}")
+            logger.debug("Recorded failure for proxy: {}", self._current_proxy.url_no_auth)
 
             # Mark as unhealthy if too many failures
             if self._current_proxy.total_requests >= 5 and self._current_proxy.success_rate < 20:
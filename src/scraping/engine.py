@@ -1,11 +1,19 @@
 """Main scraping engine."""
 
+import asyncio
 import hashlib
+import importlib.util
+import pickle
 import random
 import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
 from dataclasses import dataclass, field
-from typing import Any, Callable, Generator
+from pathlib import Path
+from typing import Any, Callable, Generator, Iterator
 
+import httpx
+import orjson
 from selenium.webdriver.remote.webdriver import WebDriver
 
 from src.automation.actions import AutomationActions
@@ -14,11 +22,41 @@ from src.automation.selectors import SelectorManager
 from src.core.config import settings
 from src.monitoring.logger import get_logger, log_scraping_event
 
-from .pagination import PaginationHandler, PaginationType
+from .pagination import PaginationHandler, PaginationType, page_url_template
 from .parser import DOMParser
 
 logger = get_logger(__name__)
 
+# uvloop (libuv event loop) ships with uvicorn[standard] on Linux/macOS
+UVLOOP_AVAILABLE = importlib.util.find_spec("uvloop") is not None
+
+# outerHTML of item containers past a given index, for incremental pagination
+_NEW_ITEMS_JS = (
+    "return Array.from(document.querySelectorAll(arguments[0]))"
+    ".slice(arguments[1]).map(e => e.outerHTML);"
+)
+
+# Pagination types that append items to the same document
+_APPENDING_PAGINATION = (PaginationType.INFINITE_SCROLL, PaginationType.LOAD_MORE)
+
+# Responses that signal the site wants us to slow down
+_THROTTLE_STATUSES = frozenset({429, 503})
+
+# Number of recent page outcomes the adaptive delay looks at
+_DELAY_WINDOW = 20
+
+# Share of the configured delay still slept while recent pages are all clean
+_HEALTHY_DELAY_SCALE = 0.25
+# Upper bound on the delay multiplier while the site is throttling us
+_MAX_DELAY_SCALE = 4
+
+
+def _parse_page(
+    html: str, parser: str, item_selector: str, field_map: dict[str, str | dict[str, Any]]
+) -> list[dict[str, Any]]:
+    """Extract items from page HTML (runs in a parse worker process)."""
+    return DOMParser(html, parser=parser).extract_data(item_selector, field_map)
+
 
 @dataclass
 class ScrapingConfig:
@@ -42,11 +80,38 @@ class ScrapingConfig:
     wait_for_selector: str | None = None
     scroll_to_bottom: bool = False
     javascript_render: bool = True
+    html_parser: str = "lxml"  # BeautifulSoup backend (lxml, html.parser, html5lib)
+    # Fetch over keep-alive HTTP instead of Selenium; applies to every entry point
+    # and only when no browser feature is needed (see needs_browser)
+    use_http_client: bool = False
+    dedup_fields: list[str] | None = None  # Drop rows repeating these field values
+    strict_delay: bool = False  # Always sleep between pages, even when the site is healthy
+    parallel_parse: bool = False  # Parse pages in worker processes while navigating
 
     # Callbacks
     pre_scrape: Callable[[WebDriver], None] | None = None
     post_scrape: Callable[[list[dict]], list[dict]] | None = None
 
+    @property
+    def needs_browser(self) -> bool:
+        """Check whether this job runs through Selenium rather than plain HTTP.
+
+        The single transport rule shared by scrape() and scrape_urls_async():
+        a job goes over HTTP only if it opts in with use_http_client and
+        needs no JS rendering, driver callback, scrolling, or pagination
+        other than URL_PARAM.
+
+        Returns:
+            True if the job must use the browser
+        """
+        return not (
+            self.use_http_client
+            and not self.javascript_render
+            and self.pre_scrape is None
+            and not self.scroll_to_bottom
+            and self.pagination_type in (None, PaginationType.URL_PARAM)
+        )
+
 
 @dataclass
 class ScrapingResult:
@@ -92,6 +157,15 @@ class ScrapingEngine:
         self._external_driver = driver
         self._driver: WebDriver | None = None
         self._owns_browser = False
+        # Items already extracted from the current document (appending pagination)
+        self._last_item_count = 0
+        # Keep-alive client for use_http_client jobs, created on first use
+        self._http: httpx.Client | None = None
+        # Recent page outcomes (True = throttled) for the adaptive delay
+        self._page_errors: deque[bool] = deque(maxlen=_DELAY_WINDOW)
+        # Worker processes for parallel_parse jobs, created on first use
+        self._parse_pool: ProcessPoolExecutor | None = None
+        self._actions: AutomationActions | None = None
 
     @property
     def driver(self) -> WebDriver:
@@ -107,6 +181,17 @@ class ScrapingEngine:
             raise RuntimeError("Engine not started. Call start() first.")
         return self._driver
 
+    @property
+    def actions(self) -> AutomationActions:
+        """Get the automation actions bound to the engine's driver.
+
+        Returns:
+            AutomationActions instance
+        """
+        if self._actions is None:
+            self._actions = AutomationActions(self.driver)
+        return self._actions
+
     def start(self) -> None:
         """Start the scraping engine."""
         if self._browser:
@@ -121,6 +206,7 @@ class ScrapingEngine:
             self._driver = self._browser.start()
             self._owns_browser = True
 
+        self._actions = AutomationActions(self._driver)
         logger.info("Scraping engine started")
 
     def stop(self) -> None:
@@ -128,6 +214,13 @@ class ScrapingEngine:
         if self._owns_browser and self._browser:
             self._browser.stop()
         self._driver = None
+        self._actions = None
+        if self._http is not None:
+            self._http.close()
+            self._http = None
+        if self._parse_pool is not None:
+            self._parse_pool.shutdown(cancel_futures=True)
+            self._parse_pool = None
         logger.info("Scraping engine stopped")
 
     def __enter__(self) -> "ScrapingEngine":
@@ -153,42 +246,12 @@ class ScrapingEngine:
         all_data = []
 
         try:
-            # Navigate to URL
-            logger.info(f"Starting scrape: {config.url}")
-            self.driver.get(config.url)
-            self._wait_for_page(config)
-
-            # Execute pre-scrape callback
-            if config.pre_scrape:
-                config.pre_scrape(self.driver)
-
-            # Scroll to bottom if needed
-            if config.scroll_to_bottom:
-                self._scroll_to_bottom()
-
-            # Setup pagination
-            if config.pagination_type:
-                pagination = PaginationHandler(
-                    driver=self.driver,
-                    pagination_type=config.pagination_type,
-                    max_pages=config.max_pages,
-                    page_delay=config.page_delay or settings.scraping_delay_min,
-                )
-
-                # Iterate through pages
-                for page_num in pagination.iterate_pages(
-                    next_selector=config.pagination_selector
-                ):
-                    page_data = self._scrape_page(config)
-                    all_data.extend(page_data)
-                    result.pages_scraped = page_num
-                    self._random_delay(config)
-
-            else:
-                # Single page scrape
-                page_data = self._scrape_page(config)
+            for page_num, page_data in self._iter_pages(config):
                 all_data.extend(page_data)
-                result.pages_scraped = 1
+                result.pages_scraped = page_num
+
+            if config.dedup_fields:
+                all_data = self._dedup(all_data, config.dedup_fields)
 
             # Execute post-scrape callback
             if config.post_scrape:
@@ -201,6 +264,7 @@ class ScrapingEngine:
         except Exception as e:
             logger.error(f"Scraping failed: {e}")
             result.errors.append(str(e))
+            self._page_errors.append(self._is_throttled(e))
 
         result.duration = time.time() - start_time
 
@@ -214,6 +278,226 @@ class ScrapingEngine:
 
         return result
 
+    def scrape_stream(self, config: ScrapingConfig) -> Generator[dict[str, Any], None, None]:
+        """Scrape a job, yielding items as each page is parsed.
+
+        Only the current page is held in memory. dedup_fields is honoured;
+        post_scrape is not, since it needs the full result list.
+
+        Args:
+            config: Scraping configuration
+
+        Yields:
+            Scraped items
+        """
+        seen: set[bytes] = set()
+        try:
+            for _, page_data in self._iter_pages(config):
+                for item in page_data:
+                    if config.dedup_fields:
+                        key = self._dedup_key(item, config.dedup_fields)
+                        if key in seen:
+                            continue
+                        seen.add(key)
+                    yield item
+        except Exception as e:
+            self._page_errors.append(self._is_throttled(e))
+            raise
+
+    def scrape_to_jsonl(self, config: ScrapingConfig, path: str | Path) -> int:
+        """Stream a job's items to a JSON Lines file.
+
+        Args:
+            config: Scraping configuration
+            path: Output file path
+
+        Returns:
+            Number of items written
+        """
+        start_time = time.time()
+        count = 0
+        success = False
+
+        try:
+            with open(path, "wb") as f:
+                for item in self.scrape_stream(config):
+                    f.write(orjson.dumps(item, default=str) + b"\n")
+                    count += 1
+            success = True
+        finally:
+            log_scraping_event(
+                url=config.url,
+                items_count=count,
+                duration=time.time() - start_time,
+                success=success,
+            )
+
+        return count
+
+    def _iter_pages(
+        self, config: ScrapingConfig
+    ) -> Generator[tuple[int, list[dict[str, Any]]], None, None]:
+        """Iterate over the configured pages.
+
+        Args:
+            config: Scraping configuration
+
+        Yields:
+            Tuple of (page number, items extracted from that page)
+        """
+        self._last_item_count = 0
+        if not config.needs_browser:
+            return self._iter_pages_http(config)
+        return self._iter_pages_browser(config)
+
+    def _iter_pages_browser(
+        self, config: ScrapingConfig
+    ) -> Generator[tuple[int, list[dict[str, Any]]], None, None]:
+        """Scrape the configured pages through the browser.
+
+        Args:
+            config: Scraping configuration
+
+        Yields:
+            Tuple of (page number, items extracted from that page)
+        """
+        # Navigate to URL
+        logger.info(f"Starting scrape: {config.url}")
+        self.driver.get(config.url)
+        self._wait_for_page(config)
+
+        # Execute pre-scrape callback
+        if config.pre_scrape:
+            config.pre_scrape(self.driver)
+
+        # Scroll to bottom if needed
+        if config.scroll_to_bottom:
+            self._scroll_to_bottom()
+
+        # Setup pagination
+        if config.pagination_type:
+            pagination = PaginationHandler(
+                driver=self.driver,
+                pagination_type=config.pagination_type,
+                max_pages=config.max_pages,
+                page_delay=config.page_delay or settings.scraping_delay_min,
+                item_selector=config.item_selector,
+            )
+
+            pages = pagination.iterate_pages(next_selector=config.pagination_selector)
+            if self._parses_in_pool(config):
+                yield from self._iter_pages_pipelined(config, pages)
+                return
+
+            # Iterate through pages
+            for page_num in pages:
+                page_data = self._scrape_page(config)
+                self._page_errors.append(False)
+                yield page_num, page_data
+                self._random_delay(config)
+
+        else:
+            # Single page scrape
+            yield 1, self._scrape_page(config)
+
+    def _iter_pages_pipelined(
+        self, config: ScrapingConfig, pages: Iterator[int]
+    ) -> Generator[tuple[int, list[dict[str, Any]]], None, None]:
+        """Parse each page in a worker process while the driver moves to the next.
+
+        Args:
+            config: Scraping configuration
+            pages: Page number iterator that navigates the driver on advance
+
+        Yields:
+            Tuple of (page number, items extracted from that page)
+        """
+        if self._parse_pool is None:
+            self._parse_pool = ProcessPoolExecutor(max_workers=2)
+
+        pending: tuple[int, Future] | None = None
+        for page_num in pages:
+            future = self._parse_pool.submit(
+                _parse_page,
+                self.driver.page_source,
+                config.html_parser,
+                config.item_selector,
+                config.field_map,
+            )
+            if pending is not None:
+                yield pending[0], pending[1].result()
+                self._page_errors.append(False)
+                self._random_delay(config)
+            pending = (page_num, future)
+
+        if pending is not None:
+            yield pending[0], pending[1].result()
+            self._page_errors.append(False)
+
+    @staticmethod
+    def _parses_in_pool(config: ScrapingConfig) -> bool:
+        """Check whether a job's pages can be parsed in worker processes.
+
+        Args:
+            config: Scraping configuration
+
+        Returns:
+            True if parallel parsing is enabled and the field map can be pickled
+        """
+        if not config.parallel_parse or config.pagination_type in _APPENDING_PAGINATION:
+            return False
+        try:
+            pickle.dumps(config.field_map)
+        except (pickle.PicklingError, AttributeError, TypeError):
+            logger.debug("Field map is not picklable, parsing pages inline")
+            return False
+        return True
+
+    def _iter_pages_http(
+        self, config: ScrapingConfig
+    ) -> Generator[tuple[int, list[dict[str, Any]]], None, None]:
+        """Scrape the configured pages over a persistent HTTP connection.
+
+        Args:
+            config: Scraping configuration
+
+        Yields:
+            Tuple of (page number, items extracted from that page)
+        """
+        if self._http is None:
+            self._http = httpx.Client(timeout=settings.selenium_timeout, follow_redirects=True)
+
+        logger.info(f"Starting HTTP scrape: {config.url}")
+        if config.pagination_type is None:
+            yield 1, self._fetch_items(config.url, config)
+            return
+
+        template = page_url_template(config.url, "page")
+        for page_num in range(1, config.max_pages + 1):
+            url = config.url if page_num == 1 else template.format(page=page_num)
+            page_data = self._fetch_items(url, config)
+            if not page_data:
+                break
+            yield page_num, page_data
+            self._random_delay(config)
+
+    def _fetch_items(self, url: str, config: ScrapingConfig) -> list[dict[str, Any]]:
+        """Fetch a page with the keep-alive client and extract its items.
+
+        Args:
+            url: Page URL
+            config: Scraping configuration
+
+        Returns:
+            List of extracted items
+        """
+        response = self._http.get(url)
+        response.raise_for_status()
+        # Failures are recorded by the caller, so throttling counts once
+        self._page_errors.append(False)
+        parser = DOMParser(response.text, parser=config.html_parser)
+        return parser.extract_data(config.item_selector, config.field_map)
+
     def _scrape_page(self, config: ScrapingConfig) -> list[dict[str, Any]]:
         """Scrape single page.
 
@@ -223,16 +507,41 @@ class ScrapingEngine:
         Returns:
             List of scraped items
         """
-        parser = DOMParser(self.driver.page_source)
+        if config.pagination_type in _APPENDING_PAGINATION:
+            return self._scrape_new_items(config)
+
+        parser = DOMParser(self.driver.page_source, parser=config.html_parser)
         return parser.extract_data(config.item_selector, config.field_map)
 
+    def _scrape_new_items(self, config: ScrapingConfig) -> list[dict[str, Any]]:
+        """Scrape only items appended since the previous call.
+
+        Pulls just the new containers' outerHTML from the browser, not the
+        whole page source, and parses that fragment.
+
+        Args:
+            config: Scraping configuration
+
+        Returns:
+            List of newly scraped items
+        """
+        fragments = self.driver.execute_script(
+            _NEW_ITEMS_JS, config.item_selector, self._last_item_count
+        )
+        if not fragments:
+            return []
+
+        self._last_item_count += len(fragments)
+        parser = DOMParser("".join(fragments), parser=config.html_parser)
+        return parser.extract_top_level(config.field_map)
+
     def _wait_for_page(self, config: ScrapingConfig) -> None:
         """Wait for page to be ready.
 
         Args:
             config: Scraping configuration
         """
-        actions = AutomationActions(self.driver)
+        actions = self.actions
         actions.wait_for_page_load()
 
         if config.wait_for_selector:
@@ -246,19 +555,54 @@ class ScrapingEngine:
 
     def _scroll_to_bottom(self) -> None:
         """Scroll page to bottom."""
-        actions = AutomationActions(self.driver)
-        actions.scroll_to_bottom()
+        self.actions.scroll_to_bottom()
 
     def _random_delay(self, config: ScrapingConfig) -> None:
         """Add random delay between requests.
 
+        The delay adapts to recent page outcomes: it shrinks to a quarter of
+        the configured delay while the site is not throttling, and is scaled
+        by the number of recent throttled pages (up to 4x) otherwise. Other
+        failures, such as 404s or parse errors, do not slow the crawl down.
+        ``strict_delay`` restores the fixed delay.
+
+        Args:
+            config: Scraping configuration
+        """
+        if config.strict_delay:
+            time.sleep(self._delay_for(config))
+            return
+
+        throttled = min(sum(self._page_errors), _MAX_DELAY_SCALE)
+        time.sleep(self._delay_for(config) * (throttled or _HEALTHY_DELAY_SCALE))
+
+    @staticmethod
+    def _is_throttled(error: Exception) -> bool:
+        """Check whether a failure means the site wants us to slow down.
+
+        Args:
+            error: Exception that ended the job
+
+        Returns:
+            True for 429/503 responses and connect/read timeouts
+        """
+        if isinstance(error, httpx.HTTPStatusError):
+            return error.response.status_code in _THROTTLE_STATUSES
+        return isinstance(error, (httpx.ConnectTimeout, httpx.ReadTimeout))
+
+    @staticmethod
+    def _delay_for(config: ScrapingConfig) -> float:
+        """Pick a random request delay for a job.
+
         Args:
             config: Scraping configuration
+
+        Returns:
+            Delay in seconds
         """
         min_delay = config.request_delay_min or settings.scraping_delay_min
         max_delay = config.request_delay_max or settings.scraping_delay_max
-        delay = random.uniform(min_delay, max_delay)
-        time.sleep(delay)
+        return random.uniform(min_delay, max_delay)
 
     def scrape_urls(
         self,
@@ -280,6 +624,129 @@ class ScrapingEngine:
             yield result
             self._random_delay(config)
 
+    async def scrape_urls_async(
+        self,
+        urls: list[str],
+        config_factory: Callable[[str], ScrapingConfig],
+        concurrency: int = 32,
+    ) -> list[ScrapingResult]:
+        """Scrape multiple URLs concurrently.
+
+        Single-page jobs that don't need a browser (see
+        ScrapingConfig.needs_browser) are fetched over a shared keep-alive
+        HTTP client, up to ``concurrency`` at a time. The rest run through
+        scrape() one at a time in a worker thread, which picks the same
+        transport as a direct scrape() call; the engine must be started if
+        any of them need the browser.
+
+        Args:
+            urls: List of URLs to scrape
+            config_factory: Function that creates config for each URL
+            concurrency: Max in-flight HTTP requests
+
+        Returns:
+            ScrapingResult for each URL, in input order
+        """
+        configs = [config_factory(url) for url in urls]
+        semaphore = asyncio.Semaphore(concurrency)
+        driver_lock = asyncio.Lock()
+
+        async def run(config: ScrapingConfig) -> ScrapingResult:
+            if config.needs_browser or config.pagination_type is not None:
+                async with driver_lock:
+                    result = await asyncio.to_thread(self.scrape, config)
+                    await asyncio.sleep(self._delay_for(config))
+                return result
+            async with semaphore:
+                result = await self._scrape_http(client, config)
+                # Per-slot politeness delay instead of a global sleep
+                await asyncio.sleep(self._delay_for(config))
+            return result
+
+        limits = httpx.Limits(max_connections=concurrency, keepalive_expiry=30)
+        async with httpx.AsyncClient(
+            limits=limits, timeout=settings.selenium_timeout, follow_redirects=True
+        ) as client:
+            return await asyncio.gather(*(run(config) for config in configs))
+
+    def scrape_urls_concurrent(
+        self,
+        urls: list[str],
+        config_factory: Callable[[str], ScrapingConfig],
+        concurrency: int = 32,
+    ) -> list[ScrapingResult]:
+        """Synchronous wrapper around scrape_urls_async.
+
+        Runs on a uvloop event loop when available, which cuts per-request
+        event loop and socket overhead on large crawls.
+
+        Args:
+            urls: List of URLs to scrape
+            config_factory: Function that creates config for each URL
+            concurrency: Max in-flight HTTP requests
+
+        Returns:
+            ScrapingResult for each URL, in input order
+        """
+        loop_factory = None
+        if UVLOOP_AVAILABLE:
+            import uvloop
+
+            loop_factory = uvloop.new_event_loop
+
+        with asyncio.Runner(loop_factory=loop_factory) as runner:
+            return runner.run(self.scrape_urls_async(urls, config_factory, concurrency))
+
+    async def _scrape_http(
+        self, client: httpx.AsyncClient, config: ScrapingConfig
+    ) -> ScrapingResult:
+        """Scrape a single static page over HTTP.
+
+        Args:
+            client: Shared async HTTP client
+            config: Scraping configuration
+
+        Returns:
+            ScrapingResult with scraped data
+        """
+        start_time = time.time()
+        result = ScrapingResult(success=False)
+
+        try:
+            logger.info(f"Starting HTTP scrape: {config.url}")
+            response = await client.get(config.url)
+            response.raise_for_status()
+
+            parser = DOMParser(response.text, parser=config.html_parser)
+            data = parser.extract_data(config.item_selector, config.field_map)
+
+            if config.dedup_fields:
+                data = self._dedup(data, config.dedup_fields)
+
+            if config.post_scrape:
+                data = config.post_scrape(data)
+
+            result.success = True
+            result.data = data
+            result.items_count = len(data)
+            result.pages_scraped = 1
+
+        except Exception as e:
+            logger.error(f"Scraping failed: {e}")
+            result.errors.append(str(e))
+
+        result.duration = time.time() - start_time
+
+        log_scraping_event(
+            url=config.url,
+            items_count=result.items_count,
+            duration=result.duration,
+            success=result.success,
+            pages=result.pages_scraped,
+        )
+
+        return result
+
     def quick_scrape(
         self,
         url: str,
@@ -305,23 +772,72 @@ class ScrapingEngine:
         return result.data
 
     @staticmethod
-    def generate_hash(data: dict[str, Any], fields: list[str] | None = None) -> str:
+    def _dedup(rows: list[dict[str, Any]], fields: list[str]) -> list[dict[str, Any]]:
+        """Drop rows whose dedup fields repeat an earlier row.
+
+        Args:
+            rows: Extracted rows
+            fields: Fields that identify a row
+
+        Returns:
+            Rows in original order, first occurrence kept
+        """
+        seen: set[bytes] = set()
+        unique = []
+        for row in rows:
+            key = ScrapingEngine._dedup_key(row, fields)
+            if key not in seen:
+                seen.add(key)
+                unique.append(row)
+
+        if len(unique) != len(rows):
+            logger.debug("Dropped {} duplicate rows", len(rows) - len(unique))
+        return unique
+
+    @staticmethod
+    def _dedup_key(row: dict[str, Any], fields: list[str]) -> bytes:
+        """Fingerprint a row by its dedup field values.
+
+        Args:
+            row: Extracted row
+            fields: Fields that identify a row
+
+        Returns:
+            64-bit BLAKE2b digest
+        """
+        return hashlib.blake2b(
+            b"\x00".join([str(row.get(f)).encode() for f in fields]), digest_size=8
+        ).digest()
+
+    @staticmethod
+    def generate_hash(
+        data: dict[str, Any], fields: list[str] | None = None, algorithm: str = "sha256"
+    ) -> str:
         """Generate hash for deduplication.
 
+        Keys and values are fed to the digest one by one in key order, so no
+        intermediate sorted list or repr of the whole row is built. Each is
+        fed as its repr, so "1" and 1 still hash differently.
+
         Args:
             data: Data dictionary
             fields: Fields to use for hash (all if None)
+            algorithm: "sha256", or "blake2b" for a faster 128-bit digest
 
         Returns:
-            SHA256 hash string
+            Hex digest string
         """
-        if fields:
-            hash_data = {k: v for k, v in data.items() if k in fields}
-        else:
-            hash_data = data
+        h = hashlib.blake2b(digest_size=16) if algorithm == "blake2b" else hashlib.sha256()
+        keys = sorted(k for k in data if k in fields) if fields else sorted(data)
+
+        for key in keys:
+            value = data[key]
+            h.update(repr(key).encode())
+            h.update(b"\x00")
+            h.update(repr(value).encode())
+            h.update(b"\x01")
 
-        content = str(sorted(hash_data.items()))
-        return hashlib.sha256(content.encode()).hexdigest()
+        return h.hexdigest()
 
 
 class ScrapingSession:
@@ -4,7 +4,7 @@ import re
 import time
 from enum import Enum
 from typing import Any, Callable, Generator
-from urllib.parse import parse_qs, urlencode, urlparse, urlunparse
+from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
 
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webdriver import WebDriver
@@ -14,6 +14,90 @@ from src.monitoring.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Count matches for each selector in one round trip: {selector: count}
+_COUNT_SELECTORS_JS = (
+    "const r = {}; for (const sel of arguments[0]) "
+    "r[sel] = document.querySelectorAll(sel).length; return r;"
+)
+
+# First link matching arguments[0] that points at page arguments[1], or null
+_FIND_PAGE_LINK_JS = (
+    "const p = String(arguments[1]); "
+    "for (const a of document.querySelectorAll(arguments[0])) { "
+    "const h = a.href || ''; "
+    "if ((a.innerText || '').trim() === p || h.includes('page=' + p) "
+    "|| h.includes('page/' + p)) return a; } return null;"
+)
+
+# "Page 2 of 10" style pager texts, in order of specificity
+_TOTAL_PAGE_PATTERNS = tuple(
+    re.compile(p, re.IGNORECASE) for p in (r"Page \d+ of (\d+)", r"(\d+) pages", r"of (\d+)")
+)
+
+# Page number query parameter in a URL
+_URL_PAGE_PARAM_RE = re.compile(r"[?&]page=\d+")
+
+# Scroll to the bottom and resolve once the page height stops growing (or the
+# pause budget in arguments[0] seconds runs out): true if new content loaded.
+# Stable polls only count after the height has grown once, so slow lazy loads
+# still get the whole budget before pagination gives up.
+_SCROLL_UNTIL_STABLE_JS = """
+const done = arguments[arguments.length - 1];
+const start = document.body.scrollHeight;
+let last = start, stable = 0;
+window.scrollTo(0, start);
+const poll = setInterval(() => {
+    const h = document.body.scrollHeight;
+    if (h === last) {
+        if (h > start && ++stable > 3) { clearInterval(poll); clearTimeout(cap); done(true); }
+    } else {
+        last = h; stable = 0; window.scrollTo(0, h);
+    }
+}, 100);
+const cap = setTimeout(() => {
+    clearInterval(poll); done(document.body.scrollHeight > start);
+}, arguments[0] * 1000);
+"""
+
+
+def page_url_template(url: str, param_name: str) -> str:
+    """Build a format template for a URL with its page parameter as a placeholder.
+
+    The URL is parsed once; each page URL is then a single ``str.format`` call.
+
+    Args:
+        url: Page URL
+        param_name: URL parameter name for page
+
+    Returns:
+        Template with a ``{page}`` field
+    """
+    parsed = urlparse(url)
+    params = [(k, v) for k, v in parse_qsl(parsed.query, keep_blank_values=True) if k != param_name]
+    query = urlencode(params)
+    query = f"{query}&{param_name}=" if query else f"{param_name}="
+    head = urlunparse(parsed._replace(query=query, fragment=""))
+    tail = f"#{parsed.fragment}" if parsed.fragment else ""
+    return f"{_escape_braces(head)}{{page}}{_escape_braces(tail)}"
+
+
+def _escape_braces(text: str) -> str:
+    return text.replace("{", "{{").replace("}", "}}")
+
+
+def build_page_url(url: str, param_name: str, page: int) -> str:
+    """Set the page number query parameter on a URL.
+
+    Args:
+        url: Page URL
+        param_name: URL parameter name for page
+        page: Page number
+
+    Returns:
+        URL pointing at the given page
+    """
+    return page_url_template(url, param_name).format(page=page)
+
 
 class PaginationType(str, Enum):
     """Types of pagination."""
@@ -28,12 +112,36 @@ class PaginationType(str, Enum):
 class PaginationHandler:
     """Handles different types of pagination."""
 
+    # Default selectors, built once at class definition
+    _NEXT_SELECTORS = (
+        "a.next",
+        ".pagination .next",
+        "[rel='next']",
+        "button.next",
+        ".pager-next",
+    )
+    _PAGE_SELECTORS = (
+        ".pagination a",
+        ".pager a",
+        ".page-numbers",
+    )
+    _LOAD_MORE_SELECTORS = (
+        ".load-more",
+        "button.more",
+        "[data-action='load-more']",
+    )
+    _DETECT_SELECTORS = _NEXT_SELECTORS + _PAGE_SELECTORS + _LOAD_MORE_SELECTORS
+    _LOAD_MORE_SELECTOR = ", ".join(_LOAD_MORE_SELECTORS)
+    _DEFAULT_NEXT_BUTTON = "a.next, .pagination .next a, [rel='next'], button.next"
+    _DEFAULT_PAGE_LINKS = ".pagination a, .pager a, .page-numbers a"
+
     def __init__(
         self,
         driver: WebDriver,
         pagination_type: PaginationType = PaginationType.NEXT_BUTTON,
         max_pages: int = 10,
         page_delay: float = 1.0,
+        item_selector: str | None = None,
     ) -> None:
         """Initialize pagination handler.
 
@@ -42,13 +150,19 @@ class PaginationHandler:
             pagination_type: Type of pagination
             max_pages: Maximum pages to scrape
             page_delay: Delay between pages in seconds
+            item_selector: CSS selector for items, used to detect newly loaded content
         """
         self.driver = driver
         self.actions = AutomationActions(driver)
         self.pagination_type = pagination_type
         self.max_pages = max_pages
         self.page_delay = page_delay
+        self.item_selector = item_selector
         self._current_page = 1
+        # Page URL template for URL_PARAM navigation, built on first use
+        self._url_template: str | None = None
+        # scroll_pause the driver's async script timeout was last sized for
+        self._script_timeout: float | None = None
 
     @property
     def current_page(self) -> int:
@@ -62,6 +176,7 @@ class PaginationHandler:
     def reset(self) -> None:
         """Reset pagination state."""
         self._current_page = 1
+        self._url_template = None
 
     def iterate_pages(
         self,
@@ -142,7 +257,7 @@ class PaginationHandler:
             True if navigation successful
         """
         if not selector:
-            selector = "a.next, .pagination .next a, [rel='next'], button.next"
+            selector = self._DEFAULT_NEXT_BUTTON
 
         try:
             element = self.actions.find_element(By.CSS_SELECTOR, selector, timeout=5)
@@ -174,22 +289,16 @@ class PaginationHandler:
             True if navigation successful
         """
         if not selector:
-            selector = ".pagination a, .pager a, .page-numbers a"
+            selector = self._DEFAULT_PAGE_LINKS
 
         try:
-            next_page = self._current_page + 1
-            # Try to find link with page number
-            page_links = self.actions.find_elements(By.CSS_SELECTOR, selector)
-
-            for link in page_links:
-                text = link.text.strip()
-                href = link.get_attribute("href") or ""
-
-                # Check if this is the next page link
-                if text == str(next_page) or f"page={next_page}" in href or f"page/{next_page}" in href:
-                    self.actions.click(element=link)
-                    self.actions.wait_for_page_load()
-                    return True
+            # Match the next page's link in-page rather than reading each link's
+            # text and href over separate driver round trips
+            link = self.driver.execute_script(_FIND_PAGE_LINK_JS, selector, self._current_page + 1)
+            if link:
+                self.actions.click(element=link)
+                self.actions.wait_for_page_load()
+                return True
 
         except Exception as e:
             logger.debug(f"Page number navigation failed: {e}")
@@ -206,16 +315,11 @@ class PaginationHandler:
             True if more content loaded
         """
         try:
-            # Get current scroll height
-            last_height = self.driver.execute_script("return document.body.scrollHeight")
-
-            # Scroll to bottom
-            self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(scroll_pause)
-
-            # Check if more content loaded
-            new_height = self.driver.execute_script("return document.body.scrollHeight")
-            return new_height > last_height
+            # Scroll and wait for the height to settle in-page: one round trip
+            if self._script_timeout != scroll_pause:
+                self.driver.set_script_timeout(scroll_pause + 2)
+                self._script_timeout = scroll_pause
+            return bool(self.driver.execute_async_script(_SCROLL_UNTIL_STABLE_JS, scroll_pause))
 
         except Exception as e:
             logger.debug(f"Infinite scroll navigation failed: {e}")
@@ -232,19 +336,19 @@ class PaginationHandler:
             True if navigation successful
         """
         if not selector:
-            selector = ".load-more, button.more, [data-action='load-more']"
+            selector = self._LOAD_MORE_SELECTOR
 
         try:
             element = self.actions.find_element(By.CSS_SELECTOR, selector, timeout=5)
             if element and element.is_displayed():
                 # Get current item count
-                old_count = len(self.driver.find_elements(By.CSS_SELECTOR, "*"))
+                old_count = self._count_items()
 
                 self.actions.click(element=element)
                 time.sleep(self.page_delay)
 
                 # Check if new items loaded
-                new_count = len(self.driver.find_elements(By.CSS_SELECTOR, "*"))
+                new_count = self._count_items()
                 return new_count > old_count
 
         except Exception as e:
@@ -252,6 +356,19 @@ class PaginationHandler:
 
         return False
 
+    def _count_items(self) -> int:
+        """Count items on the page in the browser.
+
+        Returns a single integer over the wire instead of a stub for every
+        element. Counts all elements when no item selector is set.
+
+        Returns:
+            Number of matching elements
+        """
+        return self.driver.execute_script(
+            "return document.querySelectorAll(arguments[0]).length", self.item_selector or "*"
+        )
+
     def _navigate_url_param(self, param_name: str = "page", base_url: str | None = None) -> bool:
         """Navigate by modifying URL parameter.
 
@@ -263,21 +380,11 @@ class PaginationHandler:
             True if navigation successful
         """
         try:
-            current_url = base_url or self.driver.current_url
-            parsed = urlparse(current_url)
-            params = parse_qs(parsed.query)
-
-            # Update page parameter
-            next_page = self._current_page + 1
-            params[param_name] = [str(next_page)]
-
-            # Rebuild URL
-            new_query = urlencode(params, doseq=True)
-            new_url = urlunparse(
-                (parsed.scheme, parsed.netloc, parsed.path, parsed.params, new_query, parsed.fragment)
-            )
+            if self._url_template is None:
+                current_url = base_url or self.driver.current_url
+                self._url_template = page_url_template(current_url, param_name)
 
-            self.driver.get(new_url)
+            self.driver.get(self._url_template.format(page=self._current_page + 1))
             self.actions.wait_for_page_load()
             return True
 
@@ -292,45 +399,31 @@ class PaginationHandler:
         Returns:
             Detected pagination type or None
         """
+        # Count every candidate selector in a single WebDriver round trip
+        try:
+            counts = self.driver.execute_script(_COUNT_SELECTORS_JS, list(self._DETECT_SELECTORS))
+        except Exception as e:
+            logger.debug(f"Pagination selector probe failed: {e}")
+            counts = {}
+
         # Check for next button
-        next_selectors = [
-            "a.next",
-            ".pagination .next",
-            "[rel='next']",
-            "button.next",
-            ".pager-next",
-        ]
-        for selector in next_selectors:
-            if self.actions.is_element_present(By.CSS_SELECTOR, selector):
-                logger.debug("Detected pagination type: NEXT_BUTTON")
-                return PaginationType.NEXT_BUTTON
+        if any(counts.get(sel, 0) > 0 for sel in self._NEXT_SELECTORS):
+            logger.debug("Detected pagination type: NEXT_BUTTON")
+            return PaginationType.NEXT_BUTTON
 
         # Check for page numbers
-        page_selectors = [
-            ".pagination a",
-            ".pager a",
-            ".page-numbers",
-        ]
-        for selector in page_selectors:
-            elements = self.actions.find_elements(By.CSS_SELECTOR, selector, wait=False)
-            if len(elements) > 2:
-                logger.debug("Detected pagination type: PAGE_NUMBERS")
-                return PaginationType.PAGE_NUMBERS
+        if any(counts.get(sel, 0) > 2 for sel in self._PAGE_SELECTORS):
+            logger.debug("Detected pagination type: PAGE_NUMBERS")
+            return PaginationType.PAGE_NUMBERS
 
         # Check for load more button
-        load_more_selectors = [
-            ".load-more",
-            "button.more",
-            "[data-action='load-more']",
-        ]
-        for selector in load_more_selectors:
-            if self.actions.is_element_present(By.CSS_SELECTOR, selector):
-                logger.debug("Detected pagination type: LOAD_MORE")
-                return PaginationType.LOAD_MORE
+        if any(counts.get(sel, 0) > 0 for sel in self._LOAD_MORE_SELECTORS):
+            logger.debug("Detected pagination type: LOAD_MORE")
+            return PaginationType.LOAD_MORE
 
         # Check URL for page parameter
         current_url = self.driver.current_url
-        if re.search(r"[?&]page=\d+", current_url):
+        if _URL_PAGE_PARAM_RE.search(current_url):
             logger.debug("Detected pagination type: URL_PARAM")
             return PaginationType.URL_PARAM
 
@@ -347,13 +440,6 @@ class PaginationHandler:
             Total pages or None if not detectable
         """
         try:
-            # Try common patterns
-            patterns = [
-                r"Page \d+ of (\d+)",
-                r"(\d+) pages",
-                r"of (\d+)",
-            ]
-
             # Check pagination text
             text_selectors = [
                 ".pagination-info",
@@ -365,8 +451,8 @@ class PaginationHandler:
                 element = self.actions.find_element(By.CSS_SELECTOR, sel, wait=False)
                 if element:
                     text = element.text
-                    for pattern in patterns:
-                        match = re.search(pattern, text, re.IGNORECASE)
+                    for pattern in _TOTAL_PAGE_PATTERNS:
+                        match = pattern.search(text)
                         if match:
                             return int(match.group(1))
 
@@ -1,38 +1,163 @@
 """DOM parsing with BeautifulSoup."""
 
-from typing import Any, Callable
+import functools
+import re
+from typing import Any, Callable, Iterable
+from urllib.parse import urljoin
 
+import lxml.html
+import soupsieve
 from bs4 import BeautifulSoup, Tag
+from lxml import etree
 
 from src.monitoring.logger import get_logger
 
 logger = get_logger(__name__)
 
 
+@functools.lru_cache(maxsize=512)
+def _compiled(selector: str) -> soupsieve.SoupSieve:
+    """Compile a CSS selector once for reuse across pages and items.
+
+    Args:
+        selector: CSS selector
+
+    Returns:
+        Compiled selector
+    """
+    return soupsieve.compile(selector)
+
+
+@functools.lru_cache(maxsize=256)
+def _compiled_xpath(expression: str) -> etree.XPath:
+    """Compile an XPath expression once for reuse across pages.
+
+    Args:
+        expression: XPath expression
+
+    Returns:
+        Compiled XPath evaluator
+    """
+    return etree.XPath(expression)
+
+
+# Text nodes of an element, skipping script/style like BeautifulSoup's get_text
+_TEXT_NODES_XPATH = "descendant-or-self::text()[not(ancestor::script or ancestor::style)]"
+
+# lxml parser for HTML we encode to UTF-8 ourselves
+# (lxml.html elements, for drop_tree())
+_UTF8_HTML_PARSER = lxml.html.HTMLParser(encoding="utf-8")
+
+# URLs that are already absolute and must not be joined to a base URL
+_ABS_PREFIXES = ("http://", "https://", "//")
+_ABS_PREFIXES_IMG = _ABS_PREFIXES + ("data:",)
+
+# Control whitespace that stripped text reads as plain spaces
+_WS_TABLE = str.maketrans("\t\r\n\v\f", "     ")
+
+# Elements get_clean_text strips before reading text
+_NOISE_TAGS = ("script", "style", "noscript", "header", "footer", "nav")
+_NOISE_SELECTOR = ", ".join(_NOISE_TAGS)
+_NOISE_TAG_RE = re.compile(rf"<(?:{'|'.join(_NOISE_TAGS)})\b", re.IGNORECASE)
+
+# Selectors that are a bare tag name and can be walked with lxml's iter()
+_TAG_NAME_RE = re.compile(r"[a-zA-Z][a-zA-Z0-9]*")
+
+
+def _build_extractor(
+    fields: tuple[tuple[str, str, str, Callable | None], ...],
+) -> Callable[[Tag], dict[str, Any]]:
+    """Generate an item extractor specialised for one field map.
+
+    The field loop is unrolled into straight-line code, so extracting an item
+    does no per-field type checks or config lookups. Selectors and transforms
+    are bound through the function's globals, never pasted into the source.
+
+    Args:
+        fields: Tuples of (field name, CSS selector, attribute, transform)
+
+    Returns:
+        Function extracting one item dictionary from a container
+    """
+    namespace: dict[str, Any] = {"_WS_TABLE": _WS_TABLE}
+    lines = ["def _extract(container):"]
+    values = []
+    for i, (field_name, selector, attribute, transform) in enumerate(fields):
+        namespace[f"_s{i}"] = _compiled(selector)
+        lines.append(f"    e{i} = _s{i}.select_one(container)")
+
+        if attribute == "text":
+            read = f'e{i}.get_text(separator=" ").translate(_WS_TABLE).strip()'
+        else:
+            read = f"e{i}.get({attribute!r})"
+        if transform is not None:
+            namespace[f"_t{i}"] = transform
+            read = f"_t{i}({read})"
+
+        values.append(f"        {field_name!r}: None if e{i} is None else {read},")
+
+    lines += ["    return {", *values, "    }"]
+    exec("\n".join(lines), namespace)
+    return namespace["_extract"]
+
+
+_cached_extractor = functools.lru_cache(maxsize=128)(_build_extractor)
+
+
+def lxml_text(element: etree._Element, strip: bool = True, separator: str = " ") -> str:
+    """Extract text from an lxml element returned by DOMParser.xpath.
+
+    Args:
+        element: lxml element
+        strip: Strip whitespace
+        separator: Text separator
+
+    Returns:
+        Element text content
+    """
+    text = separator.join(_compiled_xpath(_TEXT_NODES_XPATH)(element))
+    return text.translate(_WS_TABLE).strip() if strip else text
+
+
 class DOMParser:
     """DOM parser using BeautifulSoup."""
 
     def __init__(self, html: str, parser: str = "lxml") -> None:
         """Initialize parser with HTML content.
 
+        Trees are built lazily: the BeautifulSoup tree on first CSS use and
+        the lxml tree on first XPath use, so callers pay only for what they use.
+
         Args:
             html: HTML content to parse
             parser: BeautifulSoup parser (lxml, html.parser, html5lib)
         """
-        self.soup = BeautifulSoup(html, parser)
         self._parser = parser
+        # Source for both trees; None once the soup has been modified
+        self._html: str | None = html
+        self._lxml_tree: etree._Element | None = None
+
+    @functools.cached_property
+    def soup(self) -> BeautifulSoup:
+        """BeautifulSoup tree, parsed on first access."""
+        if self._html is None:
+            # The lxml tree was modified first; it is the current document
+            html = etree.tostring(self._lxml_tree, method="html", encoding="unicode")
+            return BeautifulSoup(html, self._parser)
+        return BeautifulSoup(self._html, self._parser)
 
     @classmethod
-    def from_selenium(cls, driver) -> "DOMParser":
+    def from_selenium(cls, driver, parser: str = "lxml") -> "DOMParser":
         """Create parser from Selenium driver.
 
         Args:
             driver: Selenium WebDriver
+            parser: BeautifulSoup parser (lxml, html.parser, html5lib)
 
         Returns:
             DOMParser instance
         """
-        return cls(driver.page_source)
+        return cls(driver.page_source, parser=parser)
 
     def select(self, selector: str) -> list[Tag]:
         """Select elements using CSS selector.
@@ -44,7 +169,7 @@ class DOMParser:
             List of matching elements
         """
         try:
-            return self.soup.select(selector)
+            return _compiled(selector).select(self.soup)
         except Exception as e:
             logger.warning(f"CSS select failed: {selector} | {e}")
             return []
@@ -59,7 +184,7 @@ class DOMParser:
             First matching element or None
         """
         try:
-            return self.soup.select_one(selector)
+            return _compiled(selector).select_one(self.soup)
         except Exception as e:
             logger.warning(f"CSS select_one failed: {selector} | {e}")
             return None
@@ -91,37 +216,37 @@ class DOMParser:
         """
         return self.soup.find_all(tag, attrs=attrs, limit=limit, **kwargs)
 
-    def xpath(self, expression: str) -> list[Tag]:
-        """Select elements using XPath (requires lxml).
+    def xpath(self, expression: str) -> list[Any]:
+        """Select elements using XPath.
+
+        The document is parsed into an lxml tree once and shared by all XPath
+        queries on this parser. Use lxml_text() to read element text.
 
         Args:
             expression: XPath expression
 
         Returns:
-            List of matching elements
+            List of matching lxml elements (or strings for text/attribute queries)
         """
         try:
-            from lxml import etree
-
-            tree = etree.HTML(str(self.soup))
-            elements = tree.xpath(expression)
-
-            # Convert lxml elements back to BeautifulSoup tags
-            results = []
-            for el in elements:
-                html_str = etree.tostring(el, encoding="unicode")
-                soup = BeautifulSoup(html_str, self._parser)
-                if soup.contents:
-                    results.append(soup.contents[0])
-            return results
-
-        except ImportError:
-            logger.error("lxml not installed, XPath not available")
-            return []
+            return _compiled_xpath(expression)(self._get_lxml())
         except Exception as e:
             logger.warning(f"XPath failed: {expression} | {e}")
             return []
 
+    def _get_lxml(self) -> etree._Element:
+        """Get the lxml tree for this document, parsing it on first use.
+
+        Returns:
+            lxml root element
+        """
+        if self._lxml_tree is None:
+            html = self._html if self._html is not None else str(self.soup)
+            # Bytes with a fixed encoding: lxml rejects str input that carries
+            # an XML encoding declaration, and the text is already decoded
+            self._lxml_tree = etree.HTML(html.encode(), parser=_UTF8_HTML_PARSER)
+        return self._lxml_tree
+
     def get_text(self, element: Tag | str, strip: bool = True, separator: str = " ") -> str:
         """Extract text from element.
 
@@ -140,7 +265,7 @@ class DOMParser:
             return ""
 
         text = element.get_text(separator=separator)
-        return text.strip() if strip else text
+        return text.translate(_WS_TABLE).strip() if strip else text
 
     def get_attribute(self, element: Tag | str, attr: str) -> str | None:
         """Get element attribute value.
@@ -211,39 +336,64 @@ class DOMParser:
             ... )
         """
         containers = self.select(container_selector)
-        results = []
-
-        for container in containers:
-            item = {}
-            for field_name, config in field_map.items():
-                if isinstance(config, str):
-                    # Simple selector - extract text
-                    element = container.select_one(config)
-                    item[field_name] = self.get_text(element) if element else None
-                elif isinstance(config, dict):
-                    selector = config.get("selector", "")
-                    attribute = config.get("attribute", "text")
-                    transform = config.get("transform")
-
-                    element = container.select_one(selector)
-                    if element:
-                        if attribute == "text":
-                            value = self.get_text(element)
-                        else:
-                            value = element.get(attribute)
-
-                        if transform and callable(transform):
-                            value = transform(value)
-
-                        item[field_name] = value
-                    else:
-                        item[field_name] = None
-
-            results.append(item)
+        extract = self._extractor_for(field_map)
+        results = [extract(container) for container in containers]
 
         logger.debug(f"Extracted {len(results)} items from {container_selector}")
         return results
 
+    def extract_top_level(self, field_map: dict[str, str | dict[str, Any]]) -> list[dict[str, Any]]:
+        """Extract structured data treating each top-level element as an item.
+
+        Meant for fragments that contain only item containers, such as the
+        outerHTML of items appended by infinite scroll.
+
+        Args:
+            field_map: Field map as for extract_data
+
+        Returns:
+            List of extracted data dictionaries
+        """
+        root = self.soup.body or self.soup
+        containers = root.find_all(True, recursive=False)
+        extract = self._extractor_for(field_map)
+        return [extract(container) for container in containers]
+
+    @staticmethod
+    def _extractor_for(
+        field_map: dict[str, str | dict[str, Any]],
+    ) -> Callable[[Tag], dict[str, Any]]:
+        """Get the generated item extractor for a field map.
+
+        Args:
+            field_map: Field map as for extract_data
+
+        Returns:
+            Function extracting one item dictionary from a container
+        """
+        fields = []
+        for field_name, config in field_map.items():
+            if isinstance(config, str):
+                # Simple selector - extract text
+                fields.append((field_name, config, "text", None))
+            elif isinstance(config, dict):
+                transform = config.get("transform")
+                fields.append(
+                    (
+                        field_name,
+                        config.get("selector", ""),
+                        config.get("attribute", "text"),
+                        transform if callable(transform) else None,
+                    )
+                )
+
+        fields = tuple(fields)
+        try:
+            return _cached_extractor(fields)
+        except TypeError:
+            # Unhashable transform: build without caching
+            return _build_extractor(fields)
+
     def extract_table(
         self,
         table_selector: str = "table",
@@ -260,38 +410,42 @@ class DOMParser:
         Returns:
             List of row dictionaries
         """
-        table = self.select_one(table_selector)
-        if not table:
+        tables, text_of = self._select_fast(table_selector)
+        table = next(iter(tables), None)
+        if table is None:
             return []
 
-        rows = table.select("tr")
+        rows = self._descendants(table, "tr")
         if not rows:
             return []
 
         # Extract headers
         headers = []
         if has_header and len(rows) > header_row:
-            header_cells = rows[header_row].select("th, td")
-            headers = [self.get_text(cell) for cell in header_cells]
+            header_cells = self._descendants(rows[header_row], "th", "td")
+            headers = [text_of(cell) for cell in header_cells]
             data_rows = rows[header_row + 1:]
         else:
             data_rows = rows
 
         # Extract data
         results = []
+        n_headers = len(headers)
         for row in data_rows:
-            cells = row.select("td")
-            if not cells:
+            texts = [text_of(cell) for cell in self._descendants(row, "td")]
+            if not texts:
                 continue
 
             if headers:
-                row_data = {}
-                for i, cell in enumerate(cells):
-                    key = headers[i] if i < len(headers) else f"col_{i}"
-                    row_data[key] = self.get_text(cell)
-                results.append(row_data)
+                row_data = dict(zip(headers, texts))
+                # Cells beyond the header row get positional keys
+                if len(texts) > n_headers:
+                    row_data.update(
+                        (f"col_{i}", text) for i, text in enumerate(texts[n_headers:], n_headers)
+                    )
             else:
-                results.append({f"col_{i}": self.get_text(cell) for i, cell in enumerate(cells)})
+                row_data = {f"col_{i}": text for i, text in enumerate(texts)}
+            results.append(row_data)
 
         return results
 
@@ -311,19 +465,20 @@ class DOMParser:
         Returns:
             List of link dictionaries with href and text
         """
-        links = self.select(selector)
+        links, text_of = self._select_fast(selector)
+        base = f"{base_url.rstrip('/')}/" if base_url else None
         results = []
 
         for link in links:
             href = link.get("href", "")
-            text = self.get_text(link)
+            text = text_of(link)
 
             if not href:
                 continue
 
             # Make absolute URL
-            if base_url and not href.startswith(("http://", "https://", "//")):
-                href = f"{base_url.rstrip('/')}/{href.lstrip('/')}"
+            if base and not href.startswith(_ABS_PREFIXES):
+                href = urljoin(base, href)
 
             # Apply filter
             if filter_func and not filter_func(href):
@@ -347,7 +502,8 @@ class DOMParser:
         Returns:
             List of image dictionaries with src and alt
         """
-        images = self.select(selector)
+        images, _ = self._select_fast(selector)
+        base = f"{base_url.rstrip('/')}/" if base_url else None
         results = []
 
         for img in images:
@@ -358,13 +514,41 @@ class DOMParser:
                 continue
 
             # Make absolute URL
-            if base_url and not src.startswith(("http://", "https://", "//", "data:")):
-                src = f"{base_url.rstrip('/')}/{src.lstrip('/')}"
+            if base and not src.startswith(_ABS_PREFIXES_IMG):
+                src = urljoin(base, src)
 
             results.append({"src": src, "alt": alt})
 
         return results
 
+    def _select_fast(self, selector: str) -> tuple[Iterable[Any], Callable[[Any], str]]:
+        """Select elements, walking the lxml tree for bare tag-name selectors.
+
+        Args:
+            selector: CSS selector
+
+        Returns:
+            Tuple of (matching elements, function reading an element's text)
+        """
+        if _TAG_NAME_RE.fullmatch(selector):
+            return self._get_lxml().iter(selector.lower()), lxml_text
+        return self.select(selector), self.get_text
+
+    @staticmethod
+    def _descendants(element: Any, *tags: str) -> list[Any]:
+        """List descendants with the given tag names in document order.
+
+        Args:
+            element: lxml element or BeautifulSoup Tag
+            *tags: Tag names
+
+        Returns:
+            Matching descendants
+        """
+        if isinstance(element, etree._Element):
+            return list(element.iter(*tags))
+        return _compiled(", ".join(tags)).select(element)
+
     def get_meta(self, name: str | None = None, property: str | None = None) -> str | None:
         """Get meta tag content.
 
@@ -376,13 +560,25 @@ class DOMParser:
             Meta content or None
         """
         if name:
-            meta = self.find("meta", attrs={"name": name})
-        elif property:
-            meta = self.find("meta", attrs={"property": property})
-        else:
-            return None
+            return self._meta_index.get(("name", name))
+        if property:
+            return self._meta_index.get(("property", property))
+        return None
+
+    @functools.cached_property
+    def _meta_index(self) -> dict[tuple[str, str], str | None]:
+        """Index meta tag content by (attribute, value), first tag winning.
 
-        return meta.get("content") if meta else None
+        Returns:
+            Mapping of ("name" | "property", value) to content
+        """
+        index: dict[tuple[str, str], str | None] = {}
+        for meta in self.soup.find_all("meta"):
+            for key in ("name", "property"):
+                value = meta.get(key)
+                if value:
+                    index.setdefault((key, value), meta.get("content"))
+        return index
 
     def get_title(self) -> str:
         """Get page title.
@@ -402,9 +598,25 @@ class DOMParser:
         Returns:
             Number of elements removed
         """
+        if "soup" not in self.__dict__ and _TAG_NAME_RE.fullmatch(selector):
+            # No soup built yet: drop the nodes from the lxml tree in C, and
+            # let the soup be built from that tree if it is ever needed
+            tree = self._get_lxml()
+            nodes = [n for n in tree.iter(selector.lower()) if n.getparent() is not None]
+            for node in nodes:
+                node.drop_tree()
+            if nodes:
+                self._html = None
+                self.__dict__.pop("_meta_index", None)
+            return len(nodes)
+
         elements = self.select(selector)
         for el in elements:
             el.decompose()
+        if elements:
+            self._html = None
+            self._lxml_tree = None
+            self.__dict__.pop("_meta_index", None)
         return len(elements)
 
     def get_clean_text(self, selector: str | None = None) -> str:
@@ -416,17 +628,25 @@ class DOMParser:
         Returns:
             Clean text content
         """
-        # Make a copy to avoid modifying original
+        # Without any unwanted elements the text can be read in place; a scan
+        # of the source is far cheaper than copying the tree
         if selector:
             element = self.select_one(selector)
             if not element:
                 return ""
-            soup = BeautifulSoup(str(element), self._parser)
+            if element.find(_NOISE_TAGS) is None:
+                return element.get_text(separator=" ", strip=True)
+            source = str(element)
         else:
-            soup = BeautifulSoup(str(self.soup), self._parser)
+            source = self._html if self._html is not None else str(self.soup)
+            if not _NOISE_TAG_RE.search(source):
+                return self.soup.get_text(separator=" ", strip=True)
+
+        # Make a copy to avoid modifying original
+        soup = BeautifulSoup(source, self._parser)
 
         # Remove unwanted elements
-        for tag in soup.select("script, style, noscript, header, footer, nav"):
+        for tag in _compiled(_NOISE_SELECTOR).select(soup):
             tag.decompose()
 
         return soup.get_text(separator=" ", strip=True)
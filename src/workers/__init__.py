@@ -1,7 +1,7 @@
 """Workers module - Task workers, pool management, retry logic."""
 
-from .base import BaseWorker, WorkerState
+from .base import BaseWorker, BrowserPool, WorkerState
 from .pool import WorkerPool
 from .retry import RetryHandler, RetryPolicy
 
-__all__ = ["BaseWorker", "WorkerState", "WorkerPool", "RetryHandler", "RetryPolicy"]
+__all__ = ["BaseWorker", "BrowserPool", "WorkerState", "WorkerPool", "RetryHandler", "RetryPolicy"]
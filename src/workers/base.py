@@ -3,6 +3,7 @@
 import asyncio
 import time
 from abc import ABC, abstractmethod
+from collections import deque
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any
@@ -26,15 +27,18 @@ class WorkerState(str, Enum):
     ERROR = "error"
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkerStats:
-    """Worker statistics."""
+    """Worker statistics.
+
+    Slotted to keep per-worker state compact in large pools.
+    """
 
     tasks_completed: int = 0
     tasks_failed: int = 0
     total_duration: float = 0.0
     last_task_at: float | None = None
-    errors: list[str] = field(default_factory=list)
+    errors: deque[str] = field(default_factory=lambda: deque(maxlen=5))  # Most recent only
 
     @property
     def success_rate(self) -> float:
@@ -66,16 +70,132 @@ class WorkerStats:
         Returns:
             Dictionary representation
         """
+        total = self.tasks_completed + self.tasks_failed
+        success_rate = (self.tasks_completed / total) * 100 if total else 0.0
+        avg_duration = self.total_duration / total if total else 0.0
+
         return {
             "tasks_completed": self.tasks_completed,
             "tasks_failed": self.tasks_failed,
-            "success_rate": round(self.success_rate, 2),
-            "avg_duration": round(self.avg_duration, 2),
+            "success_rate": round(success_rate, 2),
+            "avg_duration": round(avg_duration, 2),
             "total_duration": round(self.total_duration, 2),
-            "recent_errors": self.errors[-5:],
+            "recent_errors": list(self.errors),
         }
 
 
+class BrowserPool:
+    """Pool of warm browsers leased to workers for one task at a time.
+
+    Browsers are started on demand up to ``size`` and then reused, so
+    short tasks do not pay a browser cold start each. Browsers whose session
+    died are discarded on release, freeing their slot for a fresh one.
+    """
+
+    def __init__(self, size: int | None = None, headless: bool | None = None) -> None:
+        """Initialize browser pool.
+
+        Args:
+            size: Max browsers (uses settings if None)
+            headless: Headless mode (uses settings if None)
+        """
+        self.size = size or settings.worker_max_browsers
+        self.headless = headless if headless is not None else settings.selenium_headless
+
+        # Idle browsers; None marks a slot freed by a discarded browser, so a
+        # caller already waiting here starts a replacement
+        self._idle: asyncio.Queue[BrowserManager | None] = asyncio.Queue()
+        self._browsers: list[BrowserManager] = []
+        self._closed = False
+
+    async def acquire(self) -> BrowserManager:
+        """Lease a browser, starting one if the pool is not full.
+
+        Returns:
+            Started BrowserManager
+        """
+        if self._idle.empty() and len(self._browsers) < self.size:
+            return await self._start_browser()
+
+        browser = await self._idle.get()
+        if browser is None:
+            return await self._start_browser()
+        return browser
+
+    async def _start_browser(self) -> BrowserManager:
+        """Start a browser in a free slot.
+
+        Returns:
+            Started BrowserManager
+        """
+        browser = BrowserManager(headless=self.headless)
+        # Claim the slot before starting so concurrent callers respect size
+        self._browsers.append(browser)
+        try:
+            await asyncio.to_thread(browser.start)
+        except Exception:
+            self._browsers.remove(browser)
+            self._idle.put_nowait(None)
+            raise
+        logger.debug("Started pooled browser {}/{}", len(self._browsers), self.size)
+        return browser
+
+    @staticmethod
+    def is_alive(browser: BrowserManager) -> bool:
+        """Check that a browser's WebDriver session still responds.
+
+        Blocking; call it from a worker thread inside async code.
+
+        Args:
+            browser: Browser to check
+
+        Returns:
+            True if the session answered
+        """
+        try:
+            browser.driver.current_url
+        except Exception:
+            return False
+        return True
+
+    def release(self, browser: BrowserManager, discard: bool = False) -> None:
+        """Return a leased browser to the pool.
+
+        Args:
+            browser: Browser from acquire()
+            discard: Stop the browser and free its slot instead, e.g. when
+                its session died
+        """
+        if not discard and not self._closed:
+            self._idle.put_nowait(browser)
+            return
+
+        browser.stop()
+        if browser in self._browsers:
+            self._browsers.remove(browser)
+        if not self._closed:
+            self._idle.put_nowait(None)
+            logger.debug("Discarded pooled browser {}", browser)
+
+    async def release_checked(self, browser: BrowserManager) -> None:
+        """Return a browser after a failed task, discarding it if its session died.
+
+        Args:
+            browser: Browser from acquire()
+        """
+        alive = await asyncio.to_thread(self.is_alive, browser)
+        self.release(browser, discard=not alive)
+
+    def close(self) -> None:
+        """Stop idle browsers; leased ones are stopped when they are released."""
+        self._closed = True
+        while not self._idle.empty():
+            browser = self._idle.get_nowait()
+            if browser is not None:
+                browser.stop()
+                self._browsers.remove(browser)
+
+
 class BaseWorker(ABC):
     """Base worker class for executing tasks."""
 
@@ -84,6 +204,7 @@ class BaseWorker(ABC):
         worker_id: str | None = None,
         use_browser: bool = True,
         browser_headless: bool | None = None,
+        browser_pool: BrowserPool | None = None,
     ) -> None:
         """Initialize worker.
 
@@ -91,6 +212,8 @@ class BaseWorker(ABC):
             worker_id: Unique worker identifier
             use_browser: Whether worker needs browser
             browser_headless: Headless mode (uses settings if None)
+            browser_pool: Shared pool to lease a browser from per task
+                (the worker starts its own browser if None)
         """
         self.worker_id = worker_id or str(uuid4())[:8]
         self.use_browser = use_browser
@@ -100,6 +223,9 @@ class BaseWorker(ABC):
         self._stats = WorkerStats()
         self._current_task: Task | None = None
         self._browser: BrowserManager | None = None
+        self._browser_pool = browser_pool
+        # Set while an ``async with`` block holds a pooled browser
+        self._lease_held = False
 
     @property
     def state(self) -> WorkerState:
@@ -145,7 +271,8 @@ class BaseWorker(ABC):
 
         logger.info(f"Starting worker {self.worker_id}")
 
-        if self.use_browser:
+        # Pooled workers lease a browser per task in execute()
+        if self.use_browser and self._browser_pool is None:
             self._browser = BrowserManager(headless=self.browser_headless)
             self._browser.start()
 
@@ -192,7 +319,7 @@ class BaseWorker(ABC):
 
         self._state = WorkerState.RUNNING
         self._current_task = task
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
 
         log_task_start(
             task_id=task.id,
@@ -200,9 +327,15 @@ class BaseWorker(ABC):
             worker_id=self.worker_id,
         )
 
+        # Browser pool to lease from for this task only, if any
+        pool = self._browser_pool if self.use_browser and not self._lease_held else None
+        failed = False
+
         try:
+            if pool is not None:
+                self._browser = await pool.acquire()
             result = await self.run_task(task)
-            duration = time.time() - start_time
+            duration = (time.perf_counter_ns() - start_ns) * 1e-9
 
             self._stats.tasks_completed += 1
             self._stats.total_duration += duration
@@ -219,13 +352,14 @@ class BaseWorker(ABC):
             return result
 
         except Exception as e:
-            duration = time.time() - start_time
+            duration = (time.perf_counter_ns() - start_ns) * 1e-9
             error_msg = str(e)
 
             self._stats.tasks_failed += 1
             self._stats.total_duration += duration
             self._stats.errors.append(error_msg)
             self._state = WorkerState.ERROR
+            failed = True
 
             log_task_complete(
                 task_id=task.id,
@@ -240,6 +374,13 @@ class BaseWorker(ABC):
             return False
 
         finally:
+            browser = self._browser
+            if pool is not None and browser is not None:
+                self._browser = None
+                if failed:
+                    await pool.release_checked(browser)
+                else:
+                    pool.release(browser)
             self._current_task = None
             if self._state == WorkerState.RUNNING:
                 self._state = WorkerState.IDLE
@@ -265,6 +406,31 @@ class BaseWorker(ABC):
         """Context manager exit."""
         self.stop()
 
+    async def __aenter__(self) -> "BaseWorker":
+        """Async context manager entry.
+
+        Pooled workers lease one browser for the whole block, so every task
+        executed inside it reuses that browser; others start as usual.
+        """
+        pool = self._browser_pool
+        if self.use_browser and pool is not None:
+            self._browser = await pool.acquire()
+            self._lease_held = True
+        else:
+            await asyncio.to_thread(self.start)
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Async context manager exit."""
+        pool, browser = self._browser_pool, self._browser
+        if self._lease_held and pool is not None and browser is not None:
+            self._browser = None
+            self._lease_held = False
+            # Tasks in the block may have crashed the shared browser
+            await pool.release_checked(browser)
+        else:
+            await asyncio.to_thread(self.stop)
+
 
 class ScrapingWorker(BaseWorker):
     """Worker specialized for scraping tasks."""
@@ -316,14 +482,15 @@ class NavigationWorker(BaseWorker):
     async def run_task(self, task: Task) -> bool:
         """Run navigation task.
 
+        Steps run in order. A step of the form ``{"parallel": [step, ...]}``
+        runs its sub-steps concurrently, e.g. to fill independent form fields.
+
         Args:
             task: Task with navigation steps
 
         Returns:
             True if successful
         """
-        from selenium.webdriver.common.by import By
-
         from src.automation.actions import AutomationActions
 
         if not self._browser:
@@ -335,24 +502,44 @@ class NavigationWorker(BaseWorker):
         actions = AutomationActions(self._browser.driver)
 
         for step in steps:
-            action_type = step.get("action")
-            selector = step.get("selector")
-            value = step.get("value")
+            if "parallel" in step:
+                await asyncio.gather(*(self._run_step(actions, s) for s in step["parallel"]))
+            else:
+                await self._run_step(actions, step)
 
-            if action_type == "navigate":
-                self._browser.navigate(value)
-                actions.wait_for_page_load()
+        return True
 
-            elif action_type == "click":
-                actions.click(by=By.CSS_SELECTOR, value=selector)
+    async def _run_step(self, actions: Any, step: dict[str, Any]) -> None:
+        """Run one navigation step without blocking the event loop.
 
-            elif action_type == "fill":
-                actions.fill_input(by=By.CSS_SELECTOR, value=selector, text=value)
+        Selenium calls are blocking, so they run in a worker thread.
 
-            elif action_type == "wait":
-                await asyncio.sleep(float(value))
+        Args:
+            actions: AutomationActions bound to the worker's driver
+            step: Step definition
+        """
+        from selenium.webdriver.common.by import By
 
-            elif action_type == "scroll":
-                actions.scroll_to_bottom()
+        action_type = step.get("action")
+        selector = step.get("selector")
+        value: Any = step.get("value")
 
-        return True
+        if action_type == "navigate":
+            browser = self._browser
+            assert browser is not None  # run_task checked it before the steps
+            await asyncio.to_thread(browser.navigate, value)
+            await asyncio.to_thread(actions.wait_for_page_load)
+
+        elif action_type == "click":
+            await asyncio.to_thread(actions.click, by=By.CSS_SELECTOR, value=selector)
+
+        elif action_type == "fill":
+            await asyncio.to_thread(
+                actions.fill_input, by=By.CSS_SELECTOR, value=selector, text=value
+            )
+
+        elif action_type == "wait":
+            await asyncio.sleep(float(value))
+
+        elif action_type == "scroll":
+            await asyncio.to_thread(actions.scroll_to_bottom)
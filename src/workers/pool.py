@@ -1,6 +1,7 @@
 """Worker pool management."""
 
 import asyncio
+from contextlib import nullcontext
 from typing import Any, Type
 from uuid import uuid4
 
@@ -8,10 +9,13 @@ from src.core.config import settings
 from src.database.models import Task, TaskStatus
 from src.monitoring.logger import get_logger
 
-from .base import BaseWorker, ScrapingWorker, WorkerState
+from .base import BaseWorker, BrowserPool, ScrapingWorker, WorkerState
 
 logger = get_logger(__name__)
 
+# Stand-in for the semaphore when the idle queue already caps concurrency
+_NO_LIMIT = nullcontext()
+
 
 class WorkerPool:
     """Pool of workers for parallel task execution."""
@@ -21,6 +25,7 @@ class WorkerPool:
         pool_size: int | None = None,
         worker_class: Type[BaseWorker] = ScrapingWorker,
         max_concurrent: int | None = None,
+        share_browsers: bool = False,
         **worker_kwargs,
     ) -> None:
         """Initialize worker pool.
@@ -29,15 +34,32 @@ class WorkerPool:
             pool_size: Number of workers
             worker_class: Worker class to instantiate
             max_concurrent: Max concurrent tasks
+            share_browsers: Lease warm browsers from a shared BrowserPool per
+                task instead of one browser per worker
             **worker_kwargs: Arguments for worker initialization
         """
         self.pool_size = pool_size or settings.worker_pool_size
         self.worker_class = worker_class
         self.max_concurrent = max_concurrent or settings.worker_max_concurrent
         self.worker_kwargs = worker_kwargs
-
-        self._workers: list[BaseWorker] = []
-        self._task_queue: asyncio.Queue[Task] = asyncio.Queue()
+        self._browser_pool: BrowserPool | None = None
+        if share_browsers:
+            self._browser_pool = BrowserPool(headless=worker_kwargs.get("browser_headless"))
+            self.worker_kwargs["browser_pool"] = self._browser_pool
+
+        # Keyed by worker_id; dicts keep insertion order for iteration
+        self._workers: dict[str, BaseWorker] = {}
+        self._worker_seq = 0
+        # Worker totals for get_stats; cleared whenever a pooled worker changes hands
+        self._stats_cache: dict[str, Any] | None = None
+        # Every registered worker not handed out to a task; unavailable ones
+        # (paused, errored) stay queued and are skipped until they recover
+        self._idle: asyncio.Queue[BaseWorker] = asyncio.Queue()
+        self._checked_out = 0
+        self._returned = asyncio.Event()
+        # Bounded so submit() applies backpressure instead of buffering without limit
+        self._task_queue: asyncio.Queue[Task] = asyncio.Queue(maxsize=self.max_concurrent * 4)
+        self._queue_runner: asyncio.Task | None = None
         self._results: dict[str, Any] = {}
         self._running = False
         self._semaphore: asyncio.Semaphore | None = None
@@ -49,7 +71,7 @@ class WorkerPool:
         Returns:
             List of workers
         """
-        return self._workers
+        return list(self._workers.values())
 
     @property
     def available_workers(self) -> list[BaseWorker]:
@@ -58,7 +80,7 @@ class WorkerPool:
         Returns:
             List of available workers
         """
-        return [w for w in self._workers if w.is_available]
+        return [w for w in self._workers.values() if w.is_available]
 
     @property
     def is_running(self) -> bool:
@@ -77,13 +99,10 @@ class WorkerPool:
 
         logger.info(f"Starting worker pool | size={self.pool_size}")
 
-        for i in range(self.pool_size):
-            worker_id = f"worker-{i + 1}"
-            worker = self.worker_class(worker_id=worker_id, **self.worker_kwargs)
-            worker.start()
-            self._workers.append(worker)
+        for _ in range(self.pool_size):
+            self._spawn_worker()
 
-        self._semaphore = asyncio.Semaphore(self.max_concurrent)
+        self._update_semaphore()
         self._running = True
 
         logger.info(f"Worker pool started | workers={len(self._workers)}")
@@ -94,10 +113,21 @@ class WorkerPool:
 
         self._running = False
 
-        for worker in self._workers:
+        if self._queue_runner is not None and not self._queue_runner.done():
+            self._queue_runner.cancel()
+
+        for worker in self._workers.values():
             worker.stop()
 
+        if self._browser_pool is not None:
+            self._browser_pool.close()
+
         self._workers.clear()
+        self._worker_seq = 0
+        self._stats_cache = None
+        self._idle = asyncio.Queue()
+        self._checked_out = 0
+        self._returned = asyncio.Event()
         self._results.clear()
 
         logger.info("Worker pool stopped")
@@ -108,11 +138,25 @@ class WorkerPool:
         Returns:
             New worker
         """
-        worker_id = f"worker-{len(self._workers) + 1}"
+        worker = self._spawn_worker()
+        self._update_semaphore()
+        logger.info(f"Added worker {worker.worker_id}")
+        return worker
+
+    def _spawn_worker(self) -> BaseWorker:
+        """Create, start and register a worker under the next free ID.
+
+        Returns:
+            New worker
+        """
+        # A running sequence, so IDs freed by remove_worker are never reused
+        self._worker_seq += 1
+        worker_id = f"worker-{self._worker_seq}"
         worker = self.worker_class(worker_id=worker_id, **self.worker_kwargs)
         worker.start()
-        self._workers.append(worker)
-        logger.info(f"Added worker {worker_id}")
+        self._workers[worker_id] = worker
+        self._idle.put_nowait(worker)
+        self._stats_cache = None
         return worker
 
     def remove_worker(self, worker_id: str) -> bool:
@@ -124,16 +168,31 @@ class WorkerPool:
         Returns:
             True if removed
         """
-        for worker in self._workers:
-            if worker.worker_id == worker_id:
-                if worker.state == WorkerState.RUNNING:
-                    logger.warning(f"Cannot remove running worker {worker_id}")
-                    return False
-                worker.stop()
-                self._workers.remove(worker)
-                logger.info(f"Removed worker {worker_id}")
-                return True
-        return False
+        worker = self._workers.get(worker_id)
+        if worker is None:
+            return False
+
+        if worker.state == WorkerState.RUNNING:
+            logger.warning(f"Cannot remove running worker {worker_id}")
+            return False
+
+        worker.stop()
+        del self._workers[worker_id]
+        self._stats_cache = None
+        self._update_semaphore()
+        logger.info(f"Removed worker {worker_id}")
+        return True
+
+    def _update_semaphore(self) -> None:
+        """Only gate on a semaphore while workers outnumber max_concurrent.
+
+        Each task holds a worker from the idle queue, so with no more workers
+        than max_concurrent the semaphore could never block.
+        """
+        if len(self._workers) <= self.max_concurrent:
+            self._semaphore = None
+        elif self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrent)
 
     def get_worker(self) -> BaseWorker | None:
         """Get an available worker.
@@ -141,14 +200,70 @@ class WorkerPool:
         Returns:
             Available worker or None
         """
-        for worker in self._workers:
+        for worker in self._workers.values():
             if worker.is_available:
                 return worker
         return None
 
+    def _is_pooled(self, worker: BaseWorker) -> bool:
+        """Check that a queued worker is still registered and not stopped.
+
+        Args:
+            worker: Worker to check
+
+        Returns:
+            True if the worker still belongs in the idle queue
+        """
+        return self._workers.get(worker.worker_id) is worker and worker.state != WorkerState.STOPPED
+
+    async def _acquire_worker(self) -> BaseWorker | None:
+        """Take the next available worker, waiting while pooled tasks hold them.
+
+        Paused or errored workers are skipped but kept queued, so they can be
+        handed out again once they recover; removed or stopped workers are
+        dropped.
+
+        Returns:
+            Available worker, or None if none is available and none will be
+            returned by a running task
+        """
+        while True:
+            for _ in range(self._idle.qsize()):
+                worker = self._idle.get_nowait()
+                if not self._is_pooled(worker):
+                    continue
+                if worker.is_available:
+                    self._checked_out += 1
+                    self._stats_cache = None
+                    return worker
+                self._idle.put_nowait(worker)
+
+            if not self._checked_out:
+                return None
+            # No await between the scan and clear, so no release can be missed
+            self._returned.clear()
+            await self._returned.wait()
+
+    def _release_worker(self, worker: BaseWorker) -> None:
+        """Return a worker to the idle queue once its task has finished.
+
+        The worker is queued even if its task left it unavailable, and every
+        waiter is woken to rescan, so none waits on a worker that won't come.
+
+        Args:
+            worker: Worker to return
+        """
+        self._checked_out -= 1
+        self._stats_cache = None
+        if self._is_pooled(worker):
+            self._idle.put_nowait(worker)
+        self._returned.set()
+
     async def submit(self, task: Task) -> str:
         """Submit task to the pool.
 
+        Waits for room when the queue is full.
+
         Args:
             task: Task to submit
 
@@ -156,7 +271,7 @@ class WorkerPool:
             Task ID
         """
         await self._task_queue.put(task)
-        logger.debug(f"Task {task.id} submitted to queue")
+        logger.debug("Task {} submitted to queue", task.id)
         return task.id
 
     async def execute(self, task: Task) -> bool:
@@ -171,13 +286,16 @@ class WorkerPool:
         if not self._running:
             raise RuntimeError("Worker pool not running")
 
-        async with self._semaphore:
-            worker = self.get_worker()
+        async with self._semaphore or _NO_LIMIT:
+            worker = await self._acquire_worker()
             if not worker:
                 logger.warning("No available workers")
                 return False
 
-            result = await worker.execute(task)
+            try:
+                result = await worker.execute(task)
+            finally:
+                self._release_worker(worker)
             self._results[task.id] = result
             return result
 
@@ -193,36 +311,62 @@ class WorkerPool:
         if not self._running:
             raise RuntimeError("Worker pool not running")
 
-        async def run_task(task: Task) -> tuple[str, bool]:
-            async with self._semaphore:
-                worker = None
-                while worker is None:
-                    worker = self.get_worker()
-                    if worker is None:
-                        await asyncio.sleep(0.1)
+        # Results keep submission order; tasks that never get a worker stay False
+        results = dict.fromkeys((t.id for t in tasks), False)
+        pending = iter(tasks)
 
-                result = await worker.execute(task)
-                return task.id, result
+        # A fixed set of consumers pulls from the shared iterator, so a large
+        # batch costs max_concurrent coroutines rather than one per task
+        async def consume() -> None:
+            for task in pending:
+                async with self._semaphore or _NO_LIMIT:
+                    worker = await self._acquire_worker()
+                    if not worker:
+                        logger.warning(f"No available workers for task {task.id}")
+                        continue
+
+                    try:
+                        results[task.id] = await worker.execute(task)
+                    finally:
+                        self._release_worker(worker)
 
-        results = await asyncio.gather(*[run_task(t) for t in tasks])
-        return dict(results)
+        await asyncio.gather(*(consume() for _ in range(min(len(tasks), self.max_concurrent))))
+        return results
 
     async def run_queue(self) -> None:
-        """Process tasks from queue continuously."""
+        """Process tasks from queue continuously.
+
+        Each wake-up drains up to ``max_concurrent`` queued tasks and runs them
+        together. Returns once the pool is stopped.
+        """
         if not self._running:
             raise RuntimeError("Worker pool not running")
 
         logger.info("Starting queue processing")
-
-        while self._running:
-            try:
-                task = await asyncio.wait_for(self._task_queue.get(), timeout=1.0)
-                await self.execute(task)
-                self._task_queue.task_done()
-            except asyncio.TimeoutError:
-                continue
-            except Exception as e:
-                logger.error(f"Queue processing error: {e}")
+        self._queue_runner = asyncio.current_task()
+
+        try:
+            while self._running:
+                batch = [await self._task_queue.get()]
+                while len(batch) < self.max_concurrent:
+                    try:
+                        batch.append(self._task_queue.get_nowait())
+                    except asyncio.QueueEmpty:
+                        break
+
+                results = await asyncio.gather(
+                    *(self.execute(t) for t in batch), return_exceptions=True
+                )
+                for result in results:
+                    if isinstance(result, Exception):
+                        logger.error(f"Queue processing error: {result}")
+                    self._task_queue.task_done()
+        except asyncio.CancelledError:
+            # stop() cancels the runner; any other cancellation propagates
+            if self._running:
+                raise
+        finally:
+            self._queue_runner = None
 
     def get_result(self, task_id: str) -> Any | None:
         """Get result for a task.
@@ -238,18 +382,42 @@ class WorkerPool:
     def get_stats(self) -> dict[str, Any]:
         """Get pool statistics.
 
+        Worker totals are cached until a pooled task starts or finishes, or the
+        worker set changes; tasks run directly on a worker are not tracked.
+
         Returns:
             Statistics dictionary
         """
-        total_completed = sum(w.stats.tasks_completed for w in self._workers)
-        total_failed = sum(w.stats.tasks_failed for w in self._workers)
-        total_duration = sum(w.stats.total_duration for w in self._workers)
+        totals = self._stats_cache
+        if totals is None:
+            totals = self._stats_cache = self._worker_totals()
 
         return {
             "pool_size": len(self._workers),
             "available_workers": len(self.available_workers),
             "running": self._running,
             "queue_size": self._task_queue.qsize(),
+            **totals,
+        }
+
+    def _worker_totals(self) -> dict[str, Any]:
+        """Aggregate worker statistics for get_stats.
+
+        Returns:
+            Totals and per-worker rows
+        """
+        # One pass over the workers for both the totals and the per-worker rows
+        total_completed = total_failed = 0
+        total_duration = 0.0
+        workers = []
+        for w in self._workers.values():
+            stats = w.stats
+            total_completed += stats.tasks_completed
+            total_failed += stats.tasks_failed
+            total_duration += stats.total_duration
+            workers.append({"id": w.worker_id, "state": w.state.value, "stats": stats.to_dict()})
+
+        return {
             "total_tasks_completed": total_completed,
             "total_tasks_failed": total_failed,
             "overall_success_rate": (
@@ -258,14 +426,7 @@ class WorkerPool:
                 else 0
             ),
             "total_duration": round(total_duration, 2),
-            "workers": [
-                {
-                    "id": w.worker_id,
-                    "state": w.state.value,
-                    "stats": w.stats.to_dict(),
-                }
-                for w in self._workers
-            ],
+            "workers": workers,
         }
 
     def __enter__(self) -> "WorkerPool":
@@ -277,6 +438,35 @@ class WorkerPool:
         """Context manager exit."""
         self.stop()
 
+    async def __aenter__(self) -> "WorkerPool":
+        """Async context manager entry."""
+        self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Async context manager exit, draining queued tasks before stopping."""
+        await self.drain()
+        self.stop()
+
+    async def drain(self, timeout: float = 30.0) -> bool:
+        """Wait for every submitted task to finish.
+
+        Relies on run_queue marking tasks done, so it only completes while a
+        queue runner is active.
+
+        Args:
+            timeout: Maximum seconds to wait
+
+        Returns:
+            True if the queue drained in time
+        """
+        try:
+            await asyncio.wait_for(self._task_queue.join(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            logger.warning(f"Queue drain timed out | pending={self._task_queue.qsize()}")
+            return False
+
 
 class DynamicWorkerPool(WorkerPool):
     """Worker pool with dynamic scaling."""
@@ -326,7 +516,7 @@ class DynamicWorkerPool(WorkerPool):
 
         # Scale down if many workers idle
         elif available > total * self.scale_down_threshold and total > self.min_workers:
-            for worker in self._workers:
+            for worker in self._workers.values():
                 if worker.is_available and len(self._workers) > self.min_workers:
                     self.remove_worker(worker.worker_id)
                     logger.info(f"Scaled down | workers={len(self._workers)}")
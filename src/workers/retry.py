@@ -13,6 +13,34 @@ logger = get_logger(__name__)
 
 T = TypeVar("T")
 
+# Longest delay table a policy precomputes; later attempts are computed on demand
+_MAX_DELAY_TABLE = 64
+
+
+def _wake(future: asyncio.Future) -> None:
+    """Resolve a backoff future unless its waiter was cancelled."""
+    if not future.done():
+        future.set_result(None)
+
+
+async def _backoff(loop: asyncio.AbstractEventLoop, delay: float) -> None:
+    """Sleep for a retry delay on a timer scheduled directly on the loop.
+
+    Args:
+        loop: Running event loop
+        delay: Delay in seconds
+    """
+    if delay <= 0:
+        # Nothing to wait for, so just yield once instead of arming a timer
+        await asyncio.sleep(0)
+        return
+    future = loop.create_future()
+    handle = loop.call_later(delay, _wake, future)
+    try:
+        await future
+    finally:
+        handle.cancel()
+
 
 class RetryStrategy(str, Enum):
     """Retry strategy types."""
@@ -23,9 +51,12 @@ class RetryStrategy(str, Enum):
     EXPONENTIAL_JITTER = "exponential_jitter"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RetryPolicy:
-    """Configuration for retry behavior."""
+    """Configuration for retry behavior.
+
+    Immutable, since the delay schedule is derived from it at construction.
+    """
 
     max_retries: int = 3
     initial_delay: float = 1.0
@@ -39,32 +70,67 @@ class RetryPolicy:
     # Exceptions to NOT retry
     non_retryable_exceptions: tuple[type[Exception], ...] = ()
 
-    def calculate_delay(self, attempt: int) -> float:
-        """Calculate delay for given attempt.
+    # Deterministic part of each delay, built once per policy; already capped at
+    # max_delay unless the strategy applies jitter afterwards
+    _base_delays: tuple[float, ...] = field(init=False, repr=False, compare=False)
+    # Jitter as low + span * r, drawn from a per-policy RNG instead of the shared module one
+    _jitter_low: float = field(init=False, repr=False, compare=False)
+    _jitter_span: float = field(init=False, repr=False, compare=False)
+    _rng: random.Random = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Precompute the base delay of every attempt the policy allows."""
+        # Frozen, so derived fields are set through object.__setattr__
+        set_field = object.__setattr__
+        # Normalize plain strings so strategy checks can compare by identity
+        set_field(self, "strategy", RetryStrategy(self.strategy))
+        # isinstance() takes tuples only; accept lists or sets from callers too
+        set_field(self, "retryable_exceptions", tuple(self.retryable_exceptions))
+        set_field(self, "non_retryable_exceptions", tuple(self.non_retryable_exceptions))
+        table_size = min(self.max_retries + 1, _MAX_DELAY_TABLE)
+        delays = (self._base_delay(a) for a in range(table_size))
+        if self.strategy is not RetryStrategy.EXPONENTIAL_JITTER:
+            delays = (min(d, self.max_delay) for d in delays)
+        set_field(self, "_base_delays", tuple(delays))
+        low, high = self.jitter_range
+        set_field(self, "_jitter_low", low)
+        set_field(self, "_jitter_span", high - low)
+        set_field(self, "_rng", random.Random())
+
+    def _base_delay(self, attempt: int) -> float:
+        """Compute the delay for an attempt before jitter and capping.
 
         Args:
-            attempt: Current attempt number (0-indexed)
+            attempt: Attempt number (0-indexed)
 
         Returns:
             Delay in seconds
         """
-        if self.strategy == RetryStrategy.FIXED:
-            delay = self.initial_delay
-
-        elif self.strategy == RetryStrategy.LINEAR:
-            delay = self.initial_delay * (attempt + 1)
+        match self.strategy:
+            case RetryStrategy.LINEAR:
+                return self.initial_delay * (attempt + 1)
+            case RetryStrategy.EXPONENTIAL | RetryStrategy.EXPONENTIAL_JITTER:
+                return self.initial_delay * (self.multiplier ** attempt)
+            case _:
+                return self.initial_delay
 
-        elif self.strategy == RetryStrategy.EXPONENTIAL:
-            delay = self.initial_delay * (self.multiplier ** attempt)
-
-        elif self.strategy == RetryStrategy.EXPONENTIAL_JITTER:
-            base_delay = self.initial_delay * (self.multiplier ** attempt)
-            jitter = random.uniform(*self.jitter_range)
-            delay = base_delay * jitter
+    def calculate_delay(self, attempt: int) -> float:
+        """Calculate delay for given attempt.
 
-        else:
-            delay = self.initial_delay
+        Args:
+            attempt: Current attempt number (0-indexed)
 
+        Returns:
+            Delay in seconds
+        """
+        delays = self._base_delays
+        if self.strategy is not RetryStrategy.EXPONENTIAL_JITTER:
+            if attempt < len(delays):
+                return delays[attempt]
+            return min(self._base_delay(attempt), self.max_delay)
+
+        delay = delays[attempt] if attempt < len(delays) else self._base_delay(attempt)
+        delay *= self._jitter_low + self._jitter_span * self._rng.random()
         return min(delay, self.max_delay)
 
     def should_retry(self, exception: Exception) -> bool:
@@ -76,15 +142,13 @@ class RetryPolicy:
         Returns:
             True if should retry
         """
-        # Check non-retryable first
-        if isinstance(exception, self.non_retryable_exceptions):
-            return False
+        # Non-retryable wins; each check is one isinstance call over a tuple
+        return not isinstance(exception, self.non_retryable_exceptions) and isinstance(
+            exception, self.retryable_exceptions
+        )
 
-        # Then check retryable
-        return isinstance(exception, self.retryable_exceptions)
 
-
-@dataclass
+@dataclass(slots=True)
 class RetryState:
     """State of retry operation."""
 
@@ -122,6 +186,52 @@ class RetryHandler:
         """
         self.policy = policy or RetryPolicy()
 
+    def _handle_exception(
+        self,
+        state: RetryState,
+        error: Exception,
+        on_retry: Callable[[int, Exception, float], None] | None,
+    ) -> float:
+        """Record a failed attempt and decide how long to back off.
+
+        Must be called from the ``except`` block handling ``error``, so a bare
+        ``raise`` re-raises it with its original traceback.
+
+        Args:
+            state: Retry state of the current call
+            error: Exception raised by the attempt
+            on_retry: Callback on retry
+
+        Returns:
+            Delay in seconds before the next attempt
+        """
+        state.record_error(error)
+
+        if not self.policy.should_retry(error):
+            logger.warning("Non-retryable exception: {}", error)
+            raise
+
+        if state.attempt >= self.policy.max_retries:
+            logger.error("Max retries ({}) exceeded", self.policy.max_retries)
+            raise
+
+        delay = self.policy.calculate_delay(state.attempt)
+        state.total_delay += delay
+
+        logger.warning(
+            "Retry {}/{} | error={} | delay={:.2f}s",
+            state.attempt + 1,
+            self.policy.max_retries,
+            type(error).__name__,
+            delay,
+        )
+
+        if on_retry:
+            on_retry(state.attempt, error, delay)
+
+        state.attempt += 1
+        return delay
+
     def execute_sync(
         self,
         func: Callable[..., T],
@@ -143,43 +253,17 @@ class RetryHandler:
         Raises:
             Last exception if all retries fail
         """
-        state = RetryState()
-        last_exception: Exception | None = None
+        # Retry bookkeeping is only allocated once an attempt fails
+        state: RetryState | None = None
 
-        while state.attempt <= self.policy.max_retries:
+        while True:
             try:
                 return func(*args, **kwargs)
 
             except Exception as e:
-                last_exception = e
-                state.record_error(e)
-
-                if not self.policy.should_retry(e):
-                    logger.warning(f"Non-retryable exception: {e}")
-                    raise
-
-                if state.attempt >= self.policy.max_retries:
-                    logger.error(f"Max retries ({self.policy.max_retries}) exceeded")
-                    raise
-
-                delay = self.policy.calculate_delay(state.attempt)
-                state.total_delay += delay
-
-                logger.warning(
-                    f"Retry {state.attempt + 1}/{self.policy.max_retries} | "
-                    f"error={type(e).__name__} | delay={delay:.2f}s"
-                )
-
-                if on_retry:
-                    on_retry(state.attempt, e, delay)
-
-                time.sleep(delay)
-                state.attempt += 1
-
-        # Should not reach here, but just in case
-        if last_exception:
-            raise last_exception
-        raise RuntimeError("Unexpected retry handler state")
+                if state is None:
+                    state = RetryState()
+                time.sleep(self._handle_exception(state, e, on_retry))
 
     async def execute_async(
         self,
@@ -202,44 +286,44 @@ class RetryHandler:
         Raises:
             Last exception if all retries fail
         """
-        state = RetryState()
-        last_exception: Exception | None = None
+        return await self._execute_async(
+            func, asyncio.iscoroutinefunction(func), args, kwargs, on_retry
+        )
+
+    async def _execute_async(
+        self,
+        func: Callable[..., T],
+        is_coro: bool,
+        args: tuple,
+        kwargs: dict[str, Any],
+        on_retry: Callable[[int, Exception, float], None] | None,
+    ) -> T:
+        """Retry loop behind execute_async with the coroutine check resolved.
+
+        Args:
+            func: Function to execute
+            is_coro: Whether func is a coroutine function
+            args: Function arguments
+            kwargs: Function keyword arguments
+            on_retry: Callback on retry
+
+        Returns:
+            Function result
+        """
+        # Retry bookkeeping is only allocated once an attempt fails
+        state: RetryState | None = None
+        loop = asyncio.get_running_loop()
 
-        while state.attempt <= self.policy.max_retries:
+        while True:
             try:
-                if asyncio.iscoroutinefunction(func):
+                if is_coro:
                     return await func(*args, **kwargs)
                 return func(*args, **kwargs)
 
             except Exception as e:
-                last_exception = e
-                state.record_error(e)
-
-                if not self.policy.should_retry(e):
-                    logger.warning(f"Non-retryable exception: {e}")
-                    raise
-
-                if state.attempt >= self.policy.max_retries:
-                    logger.error(f"Max retries ({self.policy.max_retries}) exceeded")
-                    raise
-
-                delay = self.policy.calculate_delay(state.attempt)
-                state.total_delay += delay
-
-                logger.warning(
-                    f"Retry {state.attempt + 1}/{self.policy.max_retries} | "
-                    f"error={type(e).__name__} | delay={delay:.2f}s"
-                )
-
-                if on_retry:
-                    on_retry(state.attempt, e, delay)
-
-                await asyncio.sleep(delay)
-                state.attempt += 1
-
-        if last_exception:
-            raise last_exception
-        raise RuntimeError("Unexpected retry handler state")
+                if state is None:
+                    state = RetryState()
+                await _backoff(loop, self._handle_exception(state, e, on_retry))
 
     def __call__(self, func: Callable[..., T]) -> Callable[..., T]:
         """Decorator for adding retry logic to function.
@@ -251,8 +335,10 @@ class RetryHandler:
             Decorated function
         """
         if asyncio.iscoroutinefunction(func):
+            # Resolved once here, so calls skip the check entirely
             async def async_wrapper(*args, **kwargs):
-                return await self.execute_async(func, *args, **kwargs)
+                on_retry = kwargs.pop("on_retry", None)
+                return await self._execute_async(func, True, args, kwargs, on_retry)
             return async_wrapper
         else:
             def sync_wrapper(*args, **kwargs):
@@ -290,6 +376,16 @@ def retry(
 class CircuitBreaker:
     """Circuit breaker pattern for failure handling."""
 
+    __slots__ = (
+        "failure_threshold",
+        "success_threshold",
+        "timeout",
+        "_state",
+        "_failure_count",
+        "_success_count",
+        "_last_failure_time",
+    )
+
     class State(str, Enum):
         CLOSED = "closed"  # Normal operation
         OPEN = "open"  # Failing, reject requests
@@ -324,27 +420,30 @@ class CircuitBreaker:
         Returns:
             Current circuit breaker state
         """
-        if self._state == self.State.OPEN:
-            if self._last_failure_time and (time.time() - self._last_failure_time) > self.timeout:
+        if self._state is self.State.OPEN:
+            last_failure = self._last_failure_time
+            if last_failure is not None and (time.monotonic() - last_failure) > self.timeout:
                 self._state = self.State.HALF_OPEN
                 self._success_count = 0
         return self._state
 
     def record_success(self) -> None:
         """Record successful operation."""
-        if self.state == self.State.HALF_OPEN:
+        state = self.state
+        if state is self.State.HALF_OPEN:
             self._success_count += 1
             if self._success_count >= self.success_threshold:
                 self._close()
-        elif self.state == self.State.CLOSED:
+        elif state is self.State.CLOSED:
             self._failure_count = 0
 
     def record_failure(self) -> None:
         """Record failed operation."""
         self._failure_count += 1
-        self._last_failure_time = time.time()
+        # Monotonic, so a wall-clock step cannot keep the circuit open
+        self._last_failure_time = time.monotonic()
 
-        if self.state == self.State.HALF_OPEN:
+        if self.state is self.State.HALF_OPEN:
             self._open()
         elif self._failure_count >= self.failure_threshold:
             self._open()
@@ -366,7 +465,10 @@ class CircuitBreaker:
         Returns:
             True if request is allowed
         """
-        return self.state != self.State.OPEN
+        # Closed is the common case and never needs the clock
+        if self._state is self.State.CLOSED:
+            return True
+        return self.state is not self.State.OPEN
 
     def execute(self, func: Callable[..., T], *args, **kwargs) -> T:
         """Execute function through circuit breaker.
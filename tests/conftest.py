@@ -13,22 +13,64 @@ sys.path.insert(0, str(project_root))
 # Set test environment
 os.environ["APP_ENV"] = "development"
 os.environ["DEBUG"] = "true"
-os.environ["DATABASE_URL"] = "sqlite:///./test_data/test.db"
+# Shared-cache in-memory SQLite: no files to create or clean up
+TEST_DATABASE_URL = "sqlite+pysqlite:///file:rpaflow_test?mode=memory&cache=shared&uri=true"
+os.environ["DATABASE_URL"] = TEST_DATABASE_URL
 
 
-@pytest.fixture(scope="session", autouse=True)
-def setup_test_environment():
-    """Setup test environment."""
-    # Create test data directory
-    test_data_dir = project_root / "test_data"
-    test_data_dir.mkdir(exist_ok=True)
+@pytest.fixture(scope="session")
+def api_client():
+    """FastAPI test client shared by the whole session, with tables created once."""
+    from fastapi.testclient import TestClient
+    from sqlalchemy import event
 
-    yield
+    from src.api.main import app
+    from src.database.connection import get_engine, init_db
+    from src.database.models import Base
 
-    # Cleanup
-    import shutil
-    if test_data_dir.exists():
-        shutil.rmtree(test_data_dir)
+    engine = get_engine()
+    # Let SQLAlchemy emit BEGIN itself so SAVEPOINT/ROLLBACK work on pysqlite
+    with engine.connect() as connection:
+        connection.connection.driver_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+    init_db()
+
+    with TestClient(app) as c:
+        yield c
+
+    Base.metadata.drop_all(bind=engine)
+
+
+@pytest.fixture
+def client(api_client):
+    """Test client whose database writes are rolled back after each test."""
+    from sqlalchemy.orm import Session
+
+    from src.api.main import app
+    from src.database.connection import get_db, get_engine
+
+    connection = get_engine().connect()
+    transaction = connection.begin()
+    # Commits inside the API only release a savepoint of the outer transaction
+    session = Session(
+        bind=connection, join_transaction_mode="create_savepoint", expire_on_commit=False
+    )
+
+    def override_get_db():
+        yield session
+
+    app.dependency_overrides[get_db] = override_get_db
+    try:
+        yield api_client
+    finally:
+        app.dependency_overrides.pop(get_db, None)
+        session.close()
+        transaction.rollback()
+        connection.close()
 
 
 @pytest.fixture
@@ -1,29 +1,7 @@
-"""Integration tests for API endpoints."""
+"""Integration tests for API endpoints.
 
-import pytest
-from fastapi.testclient import TestClient
-
-from src.api.main import app
-from src.database.connection import init_db, get_engine
-from src.database.models import Base
-
-
-@pytest.fixture(scope="module")
-def client():
-    """Create test client with test database."""
-    # Use in-memory SQLite for tests
-    import os
-    os.environ["DATABASE_URL"] = "sqlite:///./test_data/test.db"
-
-    # Create tables
-    init_db()
-
-    with TestClient(app) as c:
-        yield c
-
-    # Cleanup
-    engine = get_engine()
-    Base.metadata.drop_all(bind=engine)
+The ``client`` fixture lives in ``tests/conftest.py``.
+"""
 
 
 class TestHealthEndpoints:
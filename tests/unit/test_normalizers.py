@@ -155,6 +155,19 @@ class TestURLNormalizer:
         assert "utm_source" not in result
         assert "id=123" in result
 
+    def test_tracking_params_keep_order(self):
+        """Test surviving query parameters keep their order and encoding."""
+        normalizer = URLNormalizer()
+        result = normalizer.normalize("https://example.com/?q=a%20b&fbclid=x&page=2&ref=home")
+        assert result == "https://example.com/?q=a%20b&page=2"
+
+    def test_extra_tracking_params(self):
+        """Test extra tracking parameters are merged with the defaults."""
+        normalizer = URLNormalizer(extra_tracking_params=["_ga"])
+        result = normalizer.normalize("https://example.com/?_ga=1&utm_term=x&id=5")
+        assert result == "https://example.com/?id=5"
+        assert URLNormalizer().tracking_params is URLNormalizer.TRACKING_PARAMS
+
     def test_force_https(self):
         """Test forcing HTTPS."""
         normalizer = URLNormalizer(force_https=True)
@@ -195,6 +208,12 @@ class TestNumberNormalizer:
         normalizer = NumberNormalizer(default=0)
         assert normalizer.normalize("not a number") == 0
 
+    def test_normalize_batch(self):
+        """Test batch normalization matches per-value results."""
+        normalizer = NumberNormalizer(return_type=int, min_value=0, max_value=100)
+        values = [-5, 42.7, 150, "77", "n/a", None, True]
+        assert normalizer.normalize_batch(values) == [normalizer.normalize(v) for v in values]
+
 
 class TestBooleanNormalizer:
     """Tests for BooleanNormalizer."""
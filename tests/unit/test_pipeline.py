@@ -222,10 +222,18 @@ class TestDeduplicator:
         dedup = Deduplicator(key_fields=["id"])
 
         data = [{"id": 1}]
-        results = dedup.deduplicate(data)
+        results = dedup.deduplicate(data, add_hash=True)
 
         assert "_hash" in results[0]
-        assert len(results[0]["_hash"]) == 64  # SHA256 hex
+        assert len(results[0]["_hash"]) == 64  # 32-byte hex digest
+
+    def test_sha256_algorithm(self):
+        """Test sha256 hashes stay available for stored hash files."""
+        blake = Deduplicator(key_fields=["id"])
+        sha = Deduplicator(key_fields=["id"], algorithm="sha256")
+
+        assert len(sha.generate_hash({"id": 1})) == 64
+        assert sha.generate_hash({"id": 1}) != blake.generate_hash({"id": 1})
 
     def test_reset(self):
         """Test resetting seen hashes."""
@@ -0,0 +1,82 @@
+"""Tests for worker pool dispatch."""
+
+import asyncio
+
+import pytest
+
+from src.workers.base import BaseWorker, WorkerState
+from src.workers.pool import WorkerPool
+
+
+class FakeWorker(BaseWorker):
+    """Worker without a browser whose tasks fail when their ID is "bad"."""
+
+    def start(self) -> None:
+        self._state = WorkerState.IDLE
+
+    async def run_task(self, task) -> bool:
+        await asyncio.sleep(0.01)
+        if task.id == "bad":
+            raise ValueError("task failed")
+        return True
+
+
+class FakeTask:
+    """Minimal stand-in for a Task row."""
+
+    def __init__(self, task_id: str) -> None:
+        self.id = task_id
+        self.task_type = "test"
+
+
+@pytest.fixture
+def pool():
+    """Running pool with a single fake worker."""
+    pool = WorkerPool(pool_size=1, worker_class=FakeWorker, max_concurrent=2)
+    pool.start()
+    yield pool
+    pool.stop()
+
+
+class TestWorkerPool:
+    """Tests for WorkerPool."""
+
+    async def test_batch_runs_every_task(self):
+        """Test a batch larger than the pool runs all tasks."""
+        pool = WorkerPool(pool_size=2, worker_class=FakeWorker, max_concurrent=2)
+        pool.start()
+        results = await pool.execute_batch([FakeTask(str(i)) for i in range(6)])
+        pool.stop()
+
+        assert list(results) == [str(i) for i in range(6)]
+        assert all(results.values())
+
+    async def test_waiter_released_after_failure(self, pool):
+        """Test a caller waiting on a worker that errors does not hang."""
+        results = await asyncio.wait_for(
+            asyncio.gather(pool.execute(FakeTask("bad")), pool.execute(FakeTask("ok"))),
+            timeout=1,
+        )
+
+        assert results == [False, False]
+
+    async def test_paused_worker_used_after_resume(self, pool):
+        """Test a worker paused while idle is handed out again once resumed."""
+        worker = pool.workers[0]
+        worker.pause()
+        assert await pool.execute(FakeTask("a")) is False
+
+        worker.resume()
+        assert pool.get_stats()["available_workers"] == 1
+        assert await pool.execute(FakeTask("b")) is True
+
+    async def test_removed_worker_not_handed_out(self):
+        """Test removed workers are dropped from the idle queue."""
+        pool = WorkerPool(pool_size=2, worker_class=FakeWorker, max_concurrent=2)
+        pool.start()
+        removed = pool.workers[0]
+        pool.remove_worker(removed.worker_id)
+
+        assert await pool.execute(FakeTask("a")) is True
+        assert removed.stats.tasks_completed == 0
+        pool.stop()